@@ -0,0 +1,86 @@
+"""
+Tek kilitli CacheBase ile kilit bölümlemeli ShardedCache karşılaştırması.
+
+Her thread kendi sembol kümesi üzerinde karışık get/set (ve get_many/set_many)
+çalıştırır; toplam işlem/saniye ve kilit bekleme etkisi 1, 8 ve 32 thread için ölçülür.
+
+Not: GIL'li CPython'da kritik bölüm çok kısa olduğundan tek kilit darboğaz
+olmaz, parça seçimi (hash) maliyeti baskın çıkabilir. Bölümlemenin kazancı
+GIL'siz (free-threaded) yorumlayıcılarda ve kilit altında uzun süren
+işlemlerde görülür; engine bu yüzden varsayılan olarak CacheBase kullanır.
+
+Kullanım:
+    python benchmarks/cache_contention.py [--ops 20000] [--shards 16]
+"""
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.cache import CacheBase, ShardedCache
+
+SYMBOLS = [f"COIN{i}/USDT" for i in range(500)]
+TIMEFRAMES = ['1m', '5m', '15m', '1h']
+
+def worker(cache, ops: int, seed: int, bulk: bool, barrier: threading.Barrier) -> None:
+    rng = random.Random(seed)
+    keys = [f"{symbol}_{timeframe}" for symbol in rng.sample(SYMBOLS, 50) for timeframe in TIMEFRAMES]
+    barrier.wait()
+
+    if bulk:
+        for _ in range(ops // 20):
+            batch = rng.sample(keys, 20)
+            if rng.random() < 0.2:
+                cache.set_many({key: key for key in batch})
+            else:
+                cache.get_many(batch)
+        return
+
+    for _ in range(ops):
+        key = rng.choice(keys)
+        if rng.random() < 0.2:
+            cache.set(key, key)
+        else:
+            cache.get(key)
+
+def run(factory, threads: int, ops: int, bulk: bool) -> float:
+    """Toplam işlem/saniye"""
+    cache = factory()
+    barrier = threading.Barrier(threads + 1)
+    pool = [
+        threading.Thread(target=worker, args=(cache, ops, seed, bulk, barrier))
+        for seed in range(threads)
+    ]
+    for thread in pool:
+        thread.start()
+
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in pool:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    return threads * ops / elapsed
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--ops', type=int, default=20000, help="thread başına işlem sayısı")
+    parser.add_argument('--shards', type=int, default=16, help="ShardedCache parça sayısı")
+    args = parser.parse_args()
+
+    caches = {
+        'CacheBase': lambda: CacheBase(max_size=5000, expiry_seconds=60),
+        f'ShardedCache({args.shards})': lambda: ShardedCache(max_size=5000, expiry_seconds=60, shards=args.shards)
+    }
+
+    print(f"{'mode':<8} {'threads':>7} " + " ".join(f"{name:>20}" for name in caches))
+    for bulk in (False, True):
+        for threads in (1, 8, 32):
+            results = [run(factory, threads, args.ops, bulk) for factory in caches.values()]
+            print(f"{'bulk' if bulk else 'single':<8} {threads:>7} " + " ".join(f"{ops:>16,.0f} op/s" for ops in results))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+import logging
+import threading
+import time
+from typing import Dict, Optional
+
+from utils.language_manager import LanguageManager
+
+class BalanceLedger:
+    """
+    Yerel bakiye defteri.
+    Borsadan bir kez doldurulur, kendi emir dolumlarımızla güncellenir ve
+    yavaş bir zamanlayıcıyla veya sapma tespit edildiğinde borsayla uzlaştırılır.
+    """
+    # Çekim sırasında defter değişirse uzlaştırma en fazla bu kadar denenir
+    MAX_RECONCILE_ATTEMPTS = 3
+
+    def __init__(self, exchange, reconcile_interval: float = 60.0, drift_tolerance: float = 1e-6,
+                 lang: Optional[LanguageManager] = None):
+        self.exchange = exchange
+        self.lang = lang or LanguageManager()
+        self.reconcile_interval = reconcile_interval
+        self.drift_tolerance = drift_tolerance
+        self.balances: Dict[str, Dict[str, float]] = {}
+        self.last_sync = 0.0
+        self._dirty = False
+        self._lock = threading.Lock()
+
+        # Her yerel değişiklikte artar; çekim sırasında işlenen dolumları korumak için
+        self._generation = 0
+
+    def seed(self) -> None:
+        """Bakiyeleri borsadan yükle"""
+        self.reconcile()
+
+    def _load(self, balance: dict) -> Dict[str, Dict[str, float]]:
+        """ccxt fetch_balance çıktısını {coin: {'free', 'used'}} biçimine çevir"""
+        free = balance.get('free') or {}
+        used = balance.get('used') or {}
+        return {
+            coin: {'free': float(free.get(coin) or 0), 'used': float(used.get(coin) or 0)}
+            for coin in set(free) | set(used)
+        }
+
+    def reconcile(self) -> Dict[str, float]:
+        """
+        Borsadaki bakiyeleri çek ve yerel defteri güncelle.
+        Coin bazında (borsa - yerel) serbest bakiye farkını döndürür.
+        Çekim sürerken emir/kilit işlenirse borsa görüntüsü eskimiş olabilir;
+        yeniden çekilir, hep yarışılırsa defter korunur ve uzlaştırma ertelenir.
+        """
+        for _ in range(self.MAX_RECONCILE_ATTEMPTS):
+            with self._lock:
+                generation = self._generation
+            balances = self._load(self.exchange.fetch_balance())
+
+            with self._lock:
+                if self._generation != generation:
+                    continue
+
+                drift = {}
+                for coin in set(balances) | set(self.balances):
+                    remote = balances.get(coin, {}).get('free', 0.0)
+                    local = self.balances.get(coin, {}).get('free', 0.0)
+                    if abs(remote - local) > self.drift_tolerance:
+                        drift[coin] = remote - local
+
+                had_balances = bool(self.balances)
+                self.balances = balances
+                self.last_sync = time.monotonic()
+                self._dirty = False
+
+            if had_balances and drift:
+                logging.debug(f"{self.lang.__('balance_drift_corrected')}: {drift}")
+            return drift
+
+        self._dirty = True
+        logging.debug(self.lang.__('balance_reconcile_deferred'))
+        return {}
+
+    def needs_reconcile(self) -> bool:
+        """Uzlaştırma zamanı geldi mi veya sapma işaretlendi mi"""
+        return self._dirty or time.monotonic() - self.last_sync >= self.reconcile_interval
+
+    def mark_dirty(self) -> None:
+        """Sapma şüphesi (ör. yetersiz bakiye hatası) - bir sonraki kontrolde uzlaştır"""
+        self._dirty = True
+
+    def get_free(self, coin: str) -> float:
+        with self._lock:
+            return self.balances.get(coin, {}).get('free', 0.0)
+
+    def get_used(self, coin: str) -> float:
+        with self._lock:
+            return self.balances.get(coin, {}).get('used', 0.0)
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Bakiyelerin kopyasını döndür"""
+        with self._lock:
+            return {coin: dict(values) for coin, values in self.balances.items()}
+
+    def _add(self, coin: str, field: str, amount: float) -> None:
+        """Kilit altında çağrılır"""
+        self._generation += 1
+        entry = self.balances.setdefault(coin, {'free': 0.0, 'used': 0.0})
+        entry[field] = max(0.0, entry[field] + amount)
+
+    def reserve(self, coin: str, amount: float) -> None:
+        """Açık emir için bakiyeyi kilitle (free -> used)"""
+        with self._lock:
+            self._add(coin, 'free', -amount)
+            self._add(coin, 'used', amount)
+
+    def release(self, coin: str, amount: float) -> None:
+        """İptal edilen emrin kilidini kaldır (used -> free)"""
+        with self._lock:
+            self._add(coin, 'used', -amount)
+            self._add(coin, 'free', amount)
+
+    def apply_order(self, symbol: str, order: dict, reserved: bool = False) -> None:
+        """
+        Dolan emri deftere işle.
+        reserved=True ise satılan miktar kilitli (used) bakiyeden düşülür.
+        """
+        base, quote = symbol.split('/')
+        amount = float(order.get('filled') or order.get('amount') or 0)
+        price = float(order.get('average') or order.get('price') or 0)
+        cost = float(order.get('cost') or amount * price)
+        fees = order.get('fees') or ([order['fee']] if order.get('fee') else [])
+
+        with self._lock:
+            if order['side'] == 'buy':
+                self._add(base, 'free', amount)
+                self._add(quote, 'free', -cost)
+            else:
+                self._add(base, 'used' if reserved else 'free', -amount)
+                self._add(quote, 'free', cost)
+
+            for fee in fees:
+                if fee and fee.get('cost') and fee.get('currency'):
+                    self._add(fee['currency'], 'free', -float(fee['cost']))
@@ -1,50 +1,364 @@
-from threading import Lock
-from datetime import datetime
-from typing import Dict, Any, Optional
+import logging
+import math
+import os
+import time
+from collections import OrderedDict
+from threading import Event, Lock, Thread
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from utils.language_manager import LanguageManager
 
 class CacheBase:
-    """Temel cache sınıfı"""
-    def __init__(self, max_size: int = 1000, expiry_seconds: int = 60):
+    """
+    Temel cache sınıfı.
+    OrderedDict üzerinde LRU: erişilen anahtar sona taşınır, doluyken baştaki
+    (en az kullanılan) kayıt atılır. Süre kontrolü time.monotonic() ile yapılır,
+    sistem saatindeki değişikliklerden etkilenmez. Tüm işlemler O(1).
+    """
+    def __init__(self, max_size: int = 1000, expiry_seconds: float = 60):
         self.max_size = max_size
         self.expiry_seconds = expiry_seconds
-        self.cache: Dict = {}
+        self.cache: OrderedDict = OrderedDict()
         self.lock = Lock()
 
+        # Sayaçlar
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _get(self, key: str, now: float):
+        """Kilit altında çağrılır: (bulundu mu, değer)"""
+        entry = self.cache.get(key)
+        if entry is None:
+            self.misses += 1
+            return False, None
+
+        value, expires_at = entry
+        if now >= expires_at:
+            del self.cache[key]
+            self.expirations += 1
+            self.misses += 1
+            return False, None
+
+        self.cache.move_to_end(key)
+        self.hits += 1
+        return True, value
+
+    def _set(self, key: str, value: Any, now: float,
+             ttl: Optional[float] = None) -> Optional[Tuple[str, Any]]:
+        """Kilit altında çağrılır, yer açmak için atılan (anahtar, değer) çiftini döndürür"""
+        evicted = None
+        if key in self.cache:
+            self.cache.move_to_end(key)
+        elif len(self.cache) >= self.max_size:
+            evicted_key, (evicted_value, _) = self.cache.popitem(last=False)
+            evicted = (evicted_key, evicted_value)
+            self.evictions += 1
+        self.cache[key] = (value, now + (self.expiry_seconds if ttl is None else ttl))
+        return evicted
+
+    def _on_evict(self, key: str, value: Any) -> None:
+        """LRU'dan atılan kayıt için kanca (kilit dışında çağrılır)"""
+        pass
+
     def get(self, key: str) -> Optional[Any]:
         """Cache'den veri al"""
         with self.lock:
-            if key in self.cache:
-                value, timestamp = self.cache[key]
-                if (datetime.now() - timestamp).seconds < self.expiry_seconds:
-                    return value
-                del self.cache[key]
-        return None
+            return self._get(key, time.monotonic())[1]
 
     def set(self, key: str, value: Any) -> None:
         """Cache'e veri ekle"""
         with self.lock:
-            # Cache doluysa en eski %10'u temizle
-            if len(self.cache) >= self.max_size:
-                sorted_items = sorted(self.cache.items(), key=lambda x: x[1][1])
-                for old_key, _ in sorted_items[:self.max_size//10]:
-                    del self.cache[old_key]
-            
-            self.cache[key] = (value, datetime.now())
+            evicted = self._set(key, value, time.monotonic())
+        if evicted:
+            self._on_evict(*evicted)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Birden çok anahtarı tek kilit alımıyla oku (bulunanlar döner)"""
+        result = {}
+        with self.lock:
+            now = time.monotonic()
+            for key in keys:
+                found, value = self._get(key, now)
+                if found:
+                    result[key] = value
+        return result
+
+    def set_many(self, items: Dict[str, Any]) -> None:
+        """Birden çok kaydı tek kilit alımıyla yaz"""
+        evicted = []
+        with self.lock:
+            now = time.monotonic()
+            for key, value in items.items():
+                item = self._set(key, value, now)
+                if item:
+                    evicted.append(item)
+        for item in evicted:
+            self._on_evict(*item)
+
+    def get_or_load(self, key: str, loader: Callable[[], Any]) -> Any:
+        """
+        Cache'te varsa döndür, yoksa loader ile yükleyip kaydet.
+        Loader kilit dışında çalışır; None dönerse kaydedilmez.
+        """
+        with self.lock:
+            found, value = self._get(key, time.monotonic())
+        if found:
+            return value
+
+        value = loader()
+        if value is not None:
+            self.set(key, value)
+        return value
+
+    def invalidate(self, key: str) -> None:
+        """Tek kaydı sil"""
+        with self.lock:
+            self.cache.pop(key, None)
 
     def clear(self) -> None:
         """Cache'i temizle"""
         with self.lock:
             self.cache.clear()
 
+    def __len__(self) -> int:
+        return len(self.cache)
+
+    def get_stats(self) -> Dict[str, float]:
+        """İsabet/ıska/atılma sayaçları"""
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self.cache),
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'hit_rate': self.hits / lookups * 100 if lookups else 0.0
+            }
+
+class ShardedCache:
+    """
+    Kilit bölümlemeli (lock-striped) cache.
+    Anahtarlar sembole göre parçalara dağıtılır, her parça kendi kilidi olan bir
+    CacheBase'dir. Farklı semboller üzerinde çalışan worker'lar aynı kilidi beklemez.
+    Aynı sembolün tüm anahtarları ("SEMBOL_timeframe") aynı parçaya düşer.
+    """
+    def __init__(self, max_size: int = 1000, expiry_seconds: float = 60, shards: int = 16):
+        per_shard = max(1, -(-max_size // shards))
+        self.shards: List[CacheBase] = [CacheBase(per_shard, expiry_seconds) for _ in range(shards)]
+
+    def _index(self, key: str) -> int:
+        return hash(key.partition('_')[0]) % len(self.shards)
+
+    def _shard(self, key: str) -> CacheBase:
+        return self.shards[self._index(key)]
+
+    def _group(self, keys: Iterable[str]) -> Dict[int, List[str]]:
+        groups: Dict[int, List[str]] = {}
+        for key in keys:
+            groups.setdefault(self._index(key), []).append(key)
+        return groups
+
+    def get(self, key: str) -> Optional[Any]:
+        return self._shard(key).get(key)
+
+    def set(self, key: str, value: Any) -> None:
+        self._shard(key).set(key, value)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Anahtarları parçalara göre grupla, her parçanın kilidini bir kez al"""
+        result = {}
+        for index, shard_keys in self._group(keys).items():
+            result.update(self.shards[index].get_many(shard_keys))
+        return result
+
+    def set_many(self, items: Dict[str, Any]) -> None:
+        """Kayıtları parçalara göre grupla, her parçanın kilidini bir kez al"""
+        for index, shard_keys in self._group(items).items():
+            self.shards[index].set_many({key: items[key] for key in shard_keys})
+
+    def get_or_load(self, key: str, loader: Callable[[], Any]) -> Any:
+        return self._shard(key).get_or_load(key, loader)
+
+    def invalidate(self, key: str) -> None:
+        self._shard(key).invalidate(key)
+
+    def clear(self) -> None:
+        for shard in self.shards:
+            shard.clear()
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self.shards)
+
+    def get_stats(self) -> Dict[str, float]:
+        """Parça sayaçlarının toplamı"""
+        stats = {'size': 0, 'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0}
+        for shard in self.shards:
+            for key, value in shard.get_stats().items():
+                if key in stats:
+                    stats[key] += value
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / lookups * 100 if lookups else 0.0
+        return stats
+
 class PriceCache(CacheBase):
-    """Fiyat bilgileri için özelleştirilmiş cache"""
-    def __init__(self):
-        super().__init__(max_size=500, expiry_seconds=2)  # Fiyatlar için kısa ömür
+    """
+    Fiyat bilgileri için stale-while-revalidate cache.
+    fresh_seconds'tan eski kayıt bayat sayılır ama hemen yaşıyla birlikte döndürülür,
+    anahtar arka plandaki tek yenileyicinin kuyruğuna eklenir ve toplu olarak güncellenir.
+    max_stale_seconds'tan eski kayıtlar tamamen atılır. Çağıran max_age ile kabul
+    edebileceği en fazla yaşı belirler (SL kontrolü taze, UI birkaç saniyelik veri ister).
+    """
+    def __init__(self, max_size: int = 500, fresh_seconds: float = 2, max_stale_seconds: float = 30,
+                 lang: Optional[LanguageManager] = None):
+        super().__init__(max_size=max_size, expiry_seconds=max_stale_seconds)
+        self.fresh_seconds = fresh_seconds
+        self.lang = lang or LanguageManager()
+
+        # Yenilenecek anahtarlar ve arka plan yenileyicisi
+        self._pending = set()
+        self._fetch_many: Optional[Callable[[List[str]], Dict[str, Any]]] = None
+        self._refresh_interval = 1.0
+        self._refresher: Optional[Thread] = None
+        self._wakeup = Event()
+        self._refreshing = False
+
+        # Sayaçlar
+        self.stale_hits = 0
+        self.refreshes = 0
+        self.refreshed_keys = 0
+        self.refresh_errors = 0
+
+    def _lookup(self, key: str, now: float) -> Tuple[Optional[Any], float]:
+        """Kilit altında çağrılır: (değer, yaş); kayıt yoksa (None, inf)"""
+        found, value = self._get(key, now)
+        if not found:
+            self._pending.add(key)
+            return None, math.inf
+
+        # Tüm kayıtlar aynı süreyle yazılır, alınma zamanı bitiş zamanından çıkarılır
+        age = now - (self.cache[key][1] - self.expiry_seconds)
+        if age >= self.fresh_seconds:
+            self.stale_hits += 1
+            self._pending.add(key)
+        return value, age
+
+    def get_with_age(self, key: str, max_age: Optional[float] = None) -> Tuple[Optional[Any], float]:
+        """
+        Son bilinen değeri ve yaşını (saniye) beklemeden döndür.
+        Değer bayatsa yenileme istenir; max_age aşılmışsa değer None döner.
+        """
+        with self.lock:
+            value, age = self._lookup(key, time.monotonic())
+        if max_age is not None and age > max_age:
+            return None, age
+        return value, age
+
+    def get_many_with_age(self, keys: Iterable[str],
+                          max_age: Optional[float] = None) -> Dict[str, Tuple[Any, float]]:
+        """Birden çok anahtarı tek kilit alımıyla oku, max_age içinde kalanlar döner"""
+        result = {}
+        with self.lock:
+            now = time.monotonic()
+            for key in keys:
+                value, age = self._lookup(key, now)
+                if value is not None and (max_age is None or age <= max_age):
+                    result[key] = (value, age)
+        return result
+
+    def get(self, key: str) -> Optional[Any]:
+        """Son bilinen değeri al (bayatsa arka planda yenilenir)"""
+        return self.get_with_age(key)[0]
+
+    def get_or_load(self, key: str, loader: Callable[[], Any], max_age: Optional[float] = None) -> Any:
+        """
+        max_age içinde değer varsa döndür, yoksa loader ile beklemeli yükle.
+        max_age verilmezse atılmamış her değer kabul edilir.
+        """
+        value, _ = self.get_with_age(key, max_age)
+        if value is not None:
+            return value
+
+        value = loader()
+        if value is not None:
+            self.set(key, value)
+        return value
+
+    def start_refresher(self, fetch_many: Callable[[List[str]], Dict[str, Any]],
+                        interval: float = 1.0) -> None:
+        """Bayat anahtarları interval aralıkla fetch_many ile toplu yenileyen thread'i başlat"""
+        if self._refreshing:
+            return
+        self._fetch_many = fetch_many
+        self._refresh_interval = interval
+        self._refreshing = True
+        self._wakeup.clear()
+        self._refresher = Thread(target=self._refresh_loop)
+        self._refresher.daemon = True
+        self._refresher.start()
+
+    def stop_refresher(self) -> None:
+        """Yenileyici thread'i durdur"""
+        self._refreshing = False
+        self._wakeup.set()
+        if self._refresher:
+            self._refresher.join(timeout=5)
+            self._refresher = None
+
+    def refresh(self) -> int:
+        """Bekleyen anahtarları tek istekle yenile, yenilenen kayıt sayısını döndür"""
+        with self.lock:
+            pending, self._pending = self._pending, set()
+            # Bu arada başka yoldan (ör. pozisyon takibi) tazelenenler atlanır
+            now = time.monotonic()
+            keys = [
+                key for key in pending
+                if key not in self.cache
+                or now - (self.cache[key][1] - self.expiry_seconds) >= self.fresh_seconds
+            ]
+        if not keys or not self._fetch_many:
+            return 0
+
+        try:
+            values = self._fetch_many(sorted(keys))
+        except Exception as e:
+            self.refresh_errors += 1
+            logging.error(f"{self.lang.__('price_refresh_error')}: {str(e)}")
+            return 0
+
+        values = {key: value for key, value in values.items() if value is not None}
+        self.set_many(values)
+        self.refreshes += 1
+        self.refreshed_keys += len(values)
+        return len(values)
+
+    def _refresh_loop(self) -> None:
+        while self._refreshing:
+            self._wakeup.wait(self._refresh_interval)
+            self._wakeup.clear()
+            if self._refreshing:
+                self.refresh()
+
+    def get_stats(self) -> Dict[str, float]:
+        """Cache sayaçları ve yenileme sayaçları"""
+        stats = super().get_stats()
+        stats.update({
+            'stale_hits': self.stale_hits,
+            'refreshes': self.refreshes,
+            'refreshed_keys': self.refreshed_keys,
+            'refresh_errors': self.refresh_errors,
+            'pending': len(self._pending)
+        })
+        return stats
 
 class OHLCVCache(CacheBase):
     """OHLCV verileri için özelleştirilmiş cache"""
-    def __init__(self):
-        super().__init__(max_size=100, expiry_seconds=300)  # 5 dakika cache süresi
+    def __init__(self, max_size: int = 100, expiry_seconds: float = 300):
+        super().__init__(max_size=max_size, expiry_seconds=expiry_seconds)  # 5 dakika cache süresi
 
     def get_for_timeframe(self, symbol: str, timeframe: str) -> Optional[Any]:
         """Belirli bir timeframe için OHLCV verisi al"""
@@ -54,10 +368,228 @@ class OHLCVCache(CacheBase):
         """Belirli bir timeframe için OHLCV verisi kaydet"""
         self.set(f"{symbol}_{timeframe}", data)
 
+    def get_or_load_for_timeframe(self, symbol: str, timeframe: str, loader: Callable[[], Any]) -> Any:
+        """Belirli bir timeframe için OHLCV verisini cache'ten al veya yükle"""
+        return self.get_or_load(f"{symbol}_{timeframe}", loader)
+
+class TieredOHLCVCache(OHLCVCache):
+    """
+    İki katmanlı OHLCV cache: sıcak bellek LRU + disk katmanı.
+    Bellekten atılan, bellekteki süresi dolan veya kapanışta bekleyen kayıtlar
+    diske (.npy) indirilir, bellekte bulunamayan kayıt diskten okunup belleğe terfi ettirilir.
+    Disk katmanı toplam boyuta göre en eski kayıtları silerek sınırlandırılır.
+    Disk kayıtlarının geçerlilik süresi duvar saatiyle tutulur (yeniden başlatmada korunur).
+    """
+    def __init__(self, cache_dir: str, max_size: int = 100, expiry_seconds: float = 300,
+                 max_disk_bytes: int = 200 * 1024 * 1024, disk_expiry_seconds: float = 300,
+                 lang: Optional[LanguageManager] = None):
+        super().__init__(max_size=max_size, expiry_seconds=expiry_seconds)
+        self.lang = lang or LanguageManager()
+        self.cache_dir = cache_dir
+        self.max_disk_bytes = max_disk_bytes
+        self.disk_expiry_seconds = disk_expiry_seconds
+
+        # Disk indeksi: anahtar -> (boyut, alınma zamanı), eskiden yeniye
+        self._disk: OrderedDict = OrderedDict()
+        self._disk_bytes = 0
+        self._disk_lock = Lock()
+
+        # Bellekteki kayıtların alınma zamanları (diske inerken korunur, kayıt bellekten çıkınca silinir)
+        self._fetched_at: Dict[str, float] = {}
+
+        self.disk_hits = 0
+        self.disk_misses = 0
+        self.promotions = 0
+        self.demotions = 0
+
+        os.makedirs(cache_dir, exist_ok=True)
+        self._load_index()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key.replace('/', '~') + '.npy')
+
+    def _load_index(self) -> None:
+        """Önceki oturumdan kalan disk kayıtlarını indeksle"""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith('.npy'):
+                continue
+            stat = os.stat(os.path.join(self.cache_dir, name))
+            entries.append((stat.st_mtime, name[:-4].replace('~', '/'), stat.st_size))
+
+        for fetched_at, key, size in sorted(entries):
+            self._disk[key] = (size, fetched_at)
+            self._disk_bytes += size
+
+    def set(self, key: str, value: Any) -> None:
+        """Veriyi sayısal dizi olarak bellek katmanına yaz"""
+        with self.lock:
+            self._fetched_at[key] = time.time()
+            evicted = self._set(key, np.asarray(value, dtype='f8'), time.monotonic())
+        if evicted:
+            self._on_evict(*evicted)
+
+    def _admit(self, key: str, value: np.ndarray, fetched_at: float) -> None:
+        """Kaydı disk süresinden kalan kadar yaşamak üzere bellek katmanına al"""
+        remaining = self.disk_expiry_seconds - (time.time() - fetched_at)
+        with self.lock:
+            self._fetched_at[key] = fetched_at
+            evicted = self._set(key, value, time.monotonic(),
+                                ttl=min(self.expiry_seconds, remaining))
+        if evicted:
+            self._on_evict(*evicted)
+
+    def _on_evict(self, key: str, value: Any) -> None:
+        """Bellekten atılan kaydı diske indir"""
+        self._demote(key, value)
+
+    def _demote(self, key: str, value: np.ndarray) -> Optional[float]:
+        """Kaydı diske yaz, yazıldıysa alınma zamanını döndür"""
+        fetched_at = self._fetched_at.pop(key, time.time())
+        if time.time() - fetched_at >= self.disk_expiry_seconds:
+            return None
+
+        path = self._path(key)
+        tmp_path = path + '.tmp'
+        try:
+            with open(tmp_path, 'wb') as f:
+                np.save(f, value)
+            os.utime(tmp_path, (fetched_at, fetched_at))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logging.error(f"{self.lang.__('ohlcv_disk_write_error')} ({key}): {str(e)}")
+            return None
+
+        with self._disk_lock:
+            previous = self._disk.pop(key, None)
+            if previous:
+                self._disk_bytes -= previous[0]
+            self._disk[key] = (value.nbytes, fetched_at)
+            self._disk_bytes += value.nbytes
+            self.demotions += 1
+            self._evict_disk()
+        return fetched_at
+
+    def _evict_disk(self) -> None:
+        """Disk kilidi altında: boyut sınırı aşıldıysa en eski kayıtları sil"""
+        while self._disk_bytes > self.max_disk_bytes and self._disk:
+            key, (size, _) = self._disk.popitem(last=False)
+            self._disk_bytes -= size
+            self._remove_file(key)
+
+    def _remove_file(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def _promote(self, key: str) -> Optional[np.ndarray]:
+        """Kaydı diskten okuyup bellek katmanına taşı"""
+        with self._disk_lock:
+            entry = self._disk.get(key)
+            if entry is None:
+                self.disk_misses += 1
+                return None
+
+            age = time.time() - entry[1]
+            if age >= self.disk_expiry_seconds:
+                del self._disk[key]
+                self._disk_bytes -= entry[0]
+                self._remove_file(key)
+                self.disk_misses += 1
+                return None
+
+            try:
+                # Dizinin tamamı kullanılacağı için doğrudan belleğe okunur
+                value = np.load(self._path(key))
+            except (OSError, ValueError) as e:
+                logging.error(f"{self.lang.__('ohlcv_disk_read_error')} ({key}): {str(e)}")
+                del self._disk[key]
+                self._disk_bytes -= entry[0]
+                self.disk_misses += 1
+                return None
+
+            self._disk.move_to_end(key)
+            self.disk_hits += 1
+            self.promotions += 1
+
+        self._admit(key, value, entry[1])
+        return value
+
+    def get(self, key: str) -> Optional[Any]:
+        with self.lock:
+            entry = self.cache.get(key)
+            found, value = self._get(key, time.monotonic())
+        if found:
+            return value
+
+        if entry is not None:
+            # Bellekteki süresi dolan kayıt disk süresi bitene kadar diske iner
+            fetched_at = self._demote(key, entry[0])
+            if fetched_at is not None:
+                self._admit(key, entry[0], fetched_at)
+                return entry[0]
+            return None
+        return self._promote(key)
+
+    def get_or_load(self, key: str, loader: Callable[[], Any]) -> Any:
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        value = loader()
+        if value is not None:
+            value = np.asarray(value, dtype='f8')
+            self.set(key, value)
+        return value
+
+    def flush(self) -> None:
+        """Bellek katmanındaki tüm kayıtları diske indir (kapanışta)"""
+        with self.lock:
+            now = time.monotonic()
+            items = [(key, value) for key, (value, expires_at) in self.cache.items() if expires_at > now]
+        for key, value in items:
+            self._demote(key, value)
+
+    def invalidate(self, key: str) -> None:
+        """Kaydı her iki katmandan sil"""
+        with self.lock:
+            self.cache.pop(key, None)
+            self._fetched_at.pop(key, None)
+        with self._disk_lock:
+            entry = self._disk.pop(key, None)
+            if entry:
+                self._disk_bytes -= entry[0]
+                self._remove_file(key)
+
+    def clear(self) -> None:
+        """Her iki katmanı temizle"""
+        with self.lock:
+            self.cache.clear()
+            self._fetched_at.clear()
+        with self._disk_lock:
+            for key in self._disk:
+                self._remove_file(key)
+            self._disk.clear()
+            self._disk_bytes = 0
+
+    def get_stats(self) -> Dict[str, float]:
+        stats = super().get_stats()
+        with self._disk_lock:
+            stats.update({
+                'disk_size': len(self._disk),
+                'disk_bytes': self._disk_bytes,
+                'disk_hits': self.disk_hits,
+                'disk_misses': self.disk_misses,
+                'promotions': self.promotions,
+                'demotions': self.demotions
+            })
+        return stats
+
 class IndicatorCache(CacheBase):
     """Teknik göstergeler için cache"""
-    def __init__(self):
-        super().__init__(max_size=200, expiry_seconds=60)  # 1 dakika cache süresi
+    def __init__(self, max_size: int = 200, expiry_seconds: float = 60):
+        super().__init__(max_size=max_size, expiry_seconds=expiry_seconds)  # 1 dakika cache süresi
 
     def get_indicator(self, symbol: str, indicator: str) -> Optional[Any]:
         """Belirli bir gösterge değerini al"""
@@ -65,4 +597,123 @@ class IndicatorCache(CacheBase):
 
     def set_indicator(self, symbol: str, indicator: str, value: Any) -> None:
         """Belirli bir gösterge değerini kaydet"""
-        self.set(f"{symbol}_{indicator}", value)
\ No newline at end of file
+        self.set(f"{symbol}_{indicator}", value)
+
+    def get_or_load_indicator(self, symbol: str, indicator: str, loader: Callable[[], Any]) -> Any:
+        """Gösterge değerini cache'ten al veya hesapla"""
+        return self.get_or_load(f"{symbol}_{indicator}", loader)
+
+# Hata sınıfına göre ilk bekleme süresi (saniye), her ardışık hatada iki katına çıkar
+DEFAULT_BACKOFF = {
+    'market_closed': 600,
+    'bad_symbol': 3600,
+    'exchange': 60,
+    'error': 30
+}
+
+class NegativeEntry:
+    """Sembolün tek hata sınıfındaki başarısızlık kaydı"""
+    __slots__ = ('failures', 'blocked_until', 'since', 'last_error')
+
+    def __init__(self):
+        self.failures = 0
+        self.blocked_until = 0.0
+        self.since = time.time()
+        self.last_error = ''
+
+class NegativeCache:
+    """
+    Başarısız sonuçlar için negatif cache.
+    Hata alan sembol, hata sınıfına göre üstel artan süre boyunca karantinaya alınır
+    (base * 2^(hata sayısı - 1), en fazla max_seconds). Karantina süresi dolan sembol
+    tekrar denenir; yine hata alırsa süre uzar, başarılı olursa kaydı silinir.
+    """
+    def __init__(self, backoff: Optional[Dict[str, float]] = None, max_seconds: float = 3600):
+        self.backoff = dict(DEFAULT_BACKOFF, **(backoff or {}))
+        self.max_seconds = max_seconds
+        self._entries: Dict[str, Dict[str, NegativeEntry]] = {}
+        self.lock = Lock()
+
+        # Sayaçlar
+        self.failures = 0
+        self.skips = 0
+
+    def is_blocked(self, key: str) -> bool:
+        """Anahtar karantinada mı"""
+        # Hızlı yol: hiç hata almamış anahtar için kilit alınmaz
+        if key not in self._entries:
+            return False
+        with self.lock:
+            entries = self._entries.get(key)
+            if not entries:
+                return False
+            now = time.monotonic()
+            if any(entry.blocked_until > now for entry in entries.values()):
+                self.skips += 1
+                return True
+            return False
+
+    def record_failure(self, key: str, error_class: str, message: str = '') -> float:
+        """Hatayı kaydet, karantina süresini (saniye) döndür"""
+        with self.lock:
+            entry = self._entries.setdefault(key, {}).get(error_class)
+            if entry is None:
+                entry = self._entries[key][error_class] = NegativeEntry()
+            entry.failures += 1
+            entry.last_error = message
+
+            base = self.backoff.get(error_class, self.backoff['error'])
+            delay = min(base * 2 ** (entry.failures - 1), self.max_seconds)
+            entry.blocked_until = time.monotonic() + delay
+            self.failures += 1
+            return delay
+
+    def record_success(self, key: str) -> None:
+        """Başarılı sonuçta anahtarın hata geçmişini sil"""
+        if key not in self._entries:
+            return
+        with self.lock:
+            self._entries.pop(key, None)
+
+    def release(self, key: str) -> None:
+        """Anahtarı karantinadan elle çıkar"""
+        self.record_success(key)
+
+    def clear(self) -> None:
+        """Tüm kayıtları sil"""
+        with self.lock:
+            self._entries.clear()
+
+    def quarantined(self) -> List[Dict[str, Any]]:
+        """Karantinadaki anahtarlar, kalan süreye göre azalan"""
+        now = time.monotonic()
+        with self.lock:
+            items = [
+                {
+                    'symbol': key,
+                    'error_class': error_class,
+                    'failures': entry.failures,
+                    'remaining': entry.blocked_until - now,
+                    'since': entry.since,
+                    'last_error': entry.last_error
+                }
+                for key, entries in self._entries.items()
+                for error_class, entry in entries.items()
+                if entry.blocked_until > now
+            ]
+        items.sort(key=lambda item: item['remaining'], reverse=True)
+        return items
+
+    def __len__(self) -> int:
+        return len(self.quarantined())
+
+    def get_stats(self) -> Dict[str, float]:
+        """Karantina sayaçları"""
+        quarantined = len(self)
+        with self.lock:
+            return {
+                'size': len(self._entries),
+                'quarantined': quarantined,
+                'failures': self.failures,
+                'skips': self.skips
+            }
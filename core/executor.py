@@ -0,0 +1,118 @@
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, Optional
+
+from utils.language_manager import LanguageManager
+
+class OrderExecutor:
+    """
+    Alım niyetlerini kendi kuyruğu ve worker thread'i ile işleyen emir yürütücü.
+    Tarama sadece niyet bırakır, emir gidiş-dönüşünü beklemez.
+    """
+    def __init__(self, execute: Callable[[dict], None], open_positions: Callable[[], int],
+                 max_positions: int, lock: Optional[threading.RLock] = None,
+                 lang: Optional[LanguageManager] = None):
+        self.execute = execute
+        self.open_positions = open_positions
+        self.max_positions = max_positions
+        self.lang = lang or LanguageManager()
+
+        # Pozisyon sayısı ile bekleyen niyetler aynı kilit altında kontrol edilir
+        self._lock = lock or threading.RLock()
+        self._pending: Dict[str, dict] = {}
+        self._queue = queue.Queue()
+        self._thread = None
+        self.is_running = False
+
+        # Emir başına gecikmeler: {'symbol', 'queue_ms', 'execution_ms'}
+        self.latencies = deque(maxlen=1000)
+
+    def start(self) -> None:
+        """Worker thread'i başlat"""
+        if self.is_running:
+            return
+        self.is_running = True
+        self._thread = threading.Thread(target=self._worker)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self, timeout: float = 5) -> None:
+        """Worker thread'i durdur, bekleyen niyetleri at"""
+        self.is_running = False
+        self._queue.put(None)
+        if self._thread:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        with self._lock:
+            self._pending.clear()
+
+    def submit(self, opportunity: dict) -> bool:
+        """
+        Alım niyetini kuyruğa ekle.
+        Aynı sembol için bekleyen niyet varsa veya pozisyon limiti dolmuşsa reddedilir.
+        """
+        symbol = opportunity['symbol']
+        with self._lock:
+            if not self.is_running or symbol in self._pending:
+                return False
+            if self.open_positions() + len(self._pending) >= self.max_positions:
+                return False
+
+            self._pending[symbol] = {'opportunity': opportunity, 'queued_at': time.perf_counter()}
+
+        self._queue.put(symbol)
+        return True
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def _worker(self) -> None:
+        """Kuyruktaki niyetleri sırayla emre dönüştür"""
+        while self.is_running:
+            symbol = self._queue.get()
+            if symbol is None:
+                break
+
+            with self._lock:
+                intent = self._pending.get(symbol)
+            if intent is None:
+                continue
+
+            started = time.perf_counter()
+            try:
+                self.execute(intent['opportunity'])
+            except Exception as e:
+                logging.error(f"{self.lang.__('order_execution_error')} ({symbol}): {str(e)}")
+            finally:
+                finished = time.perf_counter()
+                with self._lock:
+                    self._pending.pop(symbol, None)
+
+            latency = {
+                'symbol': symbol,
+                'queue_ms': (started - intent['queued_at']) * 1000,
+                'execution_ms': (finished - started) * 1000
+            }
+            self.latencies.append(latency)
+            logging.debug(
+                f"{self.lang.__('order_latency')} ({symbol}): "
+                f"{self.lang.__('queue_wait')} {latency['queue_ms']:.1f} ms, "
+                f"{self.lang.__('execution_time')} {latency['execution_ms']:.1f} ms"
+            )
+
+    def get_latency_stats(self) -> Dict[str, float]:
+        """Kuyruk bekleme ve yürütme sürelerinin ortalama/maksimum özetini döndür"""
+        latencies = list(self.latencies)
+        if not latencies:
+            return {'count': 0, 'avg_queue_ms': 0.0, 'avg_execution_ms': 0.0, 'max_execution_ms': 0.0}
+
+        return {
+            'count': len(latencies),
+            'avg_queue_ms': sum(l['queue_ms'] for l in latencies) / len(latencies),
+            'avg_execution_ms': sum(l['execution_ms'] for l in latencies) / len(latencies),
+            'max_execution_ms': max(l['execution_ms'] for l in latencies)
+        }
@@ -0,0 +1,96 @@
+import csv
+from datetime import datetime
+from typing import Iterator, List, Optional
+
+from .store import HistoryStore, TIME_COLUMNS
+
+# Parquet isteğe bağlıdır (pyarrow kurulu değilse sadece CSV kullanılabilir)
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+# Epoch saniye tutan sütunlar, dışa aktarımda zamana çevrilir
+TIMESTAMP_COLUMNS = ('ts', 'entry_time', 'exit_time')
+
+def parquet_available() -> bool:
+    return pa is not None
+
+def _iso(value: Optional[float]) -> str:
+    return datetime.fromtimestamp(value).isoformat(sep=' ') if value is not None else ''
+
+def iter_csv_rows(store: HistoryStore, table: str, since=None, until=None,
+                  batch_size: int = 5000) -> Iterator[List]:
+    """Başlık satırı ve ardından zamanı okunur hale getirilmiş veri satırları üreten generator"""
+    columns = [column for column, _ in store.schema(table)]
+    yield columns
+
+    time_indexes = [i for i, column in enumerate(columns) if column in TIMESTAMP_COLUMNS]
+    for rows in store.iter_rows(table, since, until, batch_size):
+        for row in rows:
+            row = list(row)
+            for i in time_indexes:
+                row[i] = _iso(row[i])
+            yield row
+
+def export_csv(store: HistoryStore, table: str, path: str, since=None, until=None,
+               batch_size: int = 5000) -> int:
+    """Tabloyu CSV dosyasına akış halinde yaz, yazılan satır sayısını döndür"""
+    count = -1
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        for row in iter_csv_rows(store, table, since, until, batch_size):
+            writer.writerow(row)
+            count += 1
+    return count
+
+def _arrow_type(column: str, declared: str):
+    if column in TIMESTAMP_COLUMNS:
+        return pa.timestamp('us')
+    if declared == 'INTEGER':
+        return pa.int64()
+    if declared == 'REAL':
+        return pa.float64()
+    return pa.string()
+
+def export_parquet(store: HistoryStore, table: str, path: str, since=None, until=None,
+                   batch_size: int = 20000) -> int:
+    """
+    Tabloyu Parquet dosyasına yaz.
+    Her parça ayrı bir row group olarak yazılır, bellekte en fazla bir parça tutulur.
+    """
+    if pa is None:
+        raise ImportError("Parquet dışa aktarımı için pyarrow gerekli")
+
+    schema = pa.schema([
+        (column, _arrow_type(column, declared)) for column, declared in store.schema(table)
+    ])
+
+    count = 0
+    with pq.ParquetWriter(path, schema) as writer:
+        for rows in store.iter_rows(table, since, until, batch_size):
+            arrays = []
+            for i, field in enumerate(schema):
+                values = [row[i] for row in rows]
+                if field.name in TIMESTAMP_COLUMNS:
+                    values = [int(value * 1_000_000) if value is not None else None for value in values]
+                arrays.append(pa.array(values, type=field.type))
+            writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+            count += len(rows)
+    return count
+
+def export_table(store: HistoryStore, table: str, path: str, since=None, until=None,
+                 fmt: Optional[str] = None) -> int:
+    """
+    CSV veya Parquet olarak dışa aktar.
+    fmt ('csv'/'parquet') verilmezse biçim dosya uzantısından belirlenir.
+    """
+    if table not in TIME_COLUMNS:
+        raise ValueError(f"Bilinmeyen tablo: {table}")
+    if fmt is None:
+        fmt = 'parquet' if path.lower().endswith('.parquet') else 'csv'
+    if fmt == 'parquet':
+        return export_parquet(store, table, path, since, until)
+    return export_csv(store, table, path, since, until)
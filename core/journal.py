@@ -0,0 +1,144 @@
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from typing import Dict, Optional
+
+from utils.language_manager import LanguageManager
+
+class PositionJournal:
+    """
+    Açık pozisyonlar için yalnızca eklenen (write-ahead) günlük.
+    Her alım, satış ve SL/TP/OCO değişikliği bir JSON satırı olarak kaydedilir.
+    Yazma işlemleri arka planda toplu yapılır ve fsync edilir, sıcak yolu bloklamaz.
+    Çökme sonrası replay() ile açık pozisyonlar geri yüklenir.
+    """
+    def __init__(self, path: str, flush_interval: float = 0.2, lang: Optional[LanguageManager] = None):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.lang = lang or LanguageManager()
+        self._buffer = []
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._file = None
+        self._thread = None
+        self.is_running = False
+
+    def open(self) -> None:
+        """Günlük dosyasını aç ve flush thread'ini başlat"""
+        if self.is_running:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._file = open(self.path, 'a', encoding='utf-8')
+        self.is_running = True
+        self._thread = threading.Thread(target=self._flush_loop)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def close(self) -> None:
+        """Bekleyen kayıtları yaz ve dosyayı kapat"""
+        if not self.is_running:
+            return
+        self.is_running = False
+        self._wakeup.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+        self.flush()
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    @staticmethod
+    def _encode(value):
+        if isinstance(value, datetime):
+            return value.isoformat()
+        raise TypeError(f"{type(value).__name__} JSON'a çevrilemez")
+
+    def _append(self, event: dict) -> None:
+        event['ts'] = datetime.now().isoformat()
+        line = json.dumps(event, default=self._encode)
+        with self._lock:
+            self._buffer.append(line)
+
+    def record_open(self, symbol: str, position: dict) -> None:
+        """Yeni pozisyonu kaydet"""
+        self._append({'event': 'open', 'symbol': symbol, 'position': position})
+
+    def record_update(self, symbol: str, **fields) -> None:
+        """Pozisyon alanlarındaki değişikliği kaydet (SL/TP, OCO, miktar)"""
+        self._append({'event': 'update', 'symbol': symbol, 'fields': fields})
+
+    def record_close(self, symbol: str, exit_price: float, reason: str) -> None:
+        """Kapanan pozisyonu kaydet"""
+        self._append({'event': 'close', 'symbol': symbol, 'price': exit_price, 'reason': reason})
+
+    def flush(self) -> None:
+        """Tampondaki kayıtları tek yazma + fsync ile diske aktar"""
+        with self._lock:
+            lines, self._buffer = self._buffer, []
+        if not lines or not self._file:
+            return
+        try:
+            self._file.write('\n'.join(lines) + '\n')
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        except Exception as e:
+            logging.error(f"{self.lang.__('journal_write_error')}: {str(e)}")
+
+    def _flush_loop(self) -> None:
+        while self.is_running:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+    def replay(self) -> Dict[str, dict]:
+        """Günlüğü baştan oynatarak açık pozisyonları döndür"""
+        positions: Dict[str, dict] = {}
+        if not os.path.exists(self.path):
+            return positions
+
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    # Çökme anında yarım kalan son satır
+                    logging.warning(f"{self.lang.__('journal_corrupt_line')}: {line_no}")
+                    continue
+
+                symbol = event.get('symbol')
+                if event.get('event') == 'open':
+                    position = dict(event['position'])
+                    if isinstance(position.get('entry_time'), str):
+                        position['entry_time'] = datetime.fromisoformat(position['entry_time'])
+                    positions[symbol] = position
+                elif event.get('event') == 'update' and symbol in positions:
+                    positions[symbol].update(event.get('fields', {}))
+                elif event.get('event') == 'close':
+                    positions.pop(symbol, None)
+
+        return positions
+
+    def compact(self, positions: Dict[str, dict]) -> None:
+        """Günlüğü sadece mevcut açık pozisyonları içerecek şekilde yeniden yaz"""
+        was_running = self.is_running
+        if was_running:
+            self.close()
+
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for symbol, position in positions.items():
+                event = {'event': 'open', 'symbol': symbol, 'position': position,
+                         'ts': datetime.now().isoformat()}
+                f.write(json.dumps(event, default=self._encode) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+        if was_running:
+            self.open()
@@ -0,0 +1,124 @@
+import csv
+import itertools
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from typing import Dict, List, Optional
+
+# Histogram kova üst sınırları (ms), son kova sınırsız
+BUCKETS_MS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000, 60000, 300000]
+
+# Pipeline aşamaları (sıralı)
+ENTRY_STAGES = ('candle_close', 'fetch_done', 'analysis_done', 'intent_queued', 'order_sent', 'order_filled')
+EXIT_STAGES = ('trigger', 'order_sent', 'order_filled')
+
+class LatencyHistogram:
+    """Sabit kovalı gecikme histogramı + yüzdelikler için son örnekler"""
+    def __init__(self, sample_size: int = 1024):
+        self.buckets = [0] * (len(BUCKETS_MS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples = deque(maxlen=sample_size)
+
+    def add(self, value_ms: float) -> None:
+        self.buckets[bisect_left(BUCKETS_MS, value_ms)] += 1
+        self.count += 1
+        self.total += value_ms
+        self.max = max(self.max, value_ms)
+        self.samples.append(value_ms)
+
+    def percentile(self, q: float) -> float:
+        samples = sorted(self.samples)
+        if not samples:
+            return 0.0
+        return samples[min(len(samples) - 1, int(len(samples) * q))]
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            'count': self.count,
+            'avg_ms': self.total / self.count if self.count else 0.0,
+            'p50_ms': self.percentile(0.50),
+            'p95_ms': self.percentile(0.95),
+            'p99_ms': self.percentile(0.99),
+            'max_ms': self.max
+        }
+
+class LatencyTracker:
+    """
+    Sinyal -> dolum pipeline'ı için zaman damgalı span takibi.
+    Her iz (trace) aşama zamanlarını tutar, tamamlandığında ardışık aşamalar
+    arasındaki süreler aşama bazlı histogramlara eklenir.
+    """
+    def __init__(self, max_open_traces: int = 5000):
+        self.max_open_traces = max_open_traces
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self._traces: Dict[str, dict] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def start_trace(self, pipeline: str, symbol: str) -> str:
+        """Yeni iz başlat, iz kimliğini döndür"""
+        trace_id = f"{pipeline}:{symbol}:{next(self._ids)}"
+        with self._lock:
+            # Tamamlanmayan izler birikmesin
+            if len(self._traces) >= self.max_open_traces:
+                self._traces.pop(next(iter(self._traces)))
+            self._traces[trace_id] = {'pipeline': pipeline, 'stages': {}}
+        return trace_id
+
+    def mark(self, trace_id: Optional[str], stage: str, timestamp: Optional[float] = None) -> None:
+        """Aşama zamanını kaydet (varsayılan: şimdi, epoch saniye)"""
+        if trace_id is None:
+            return
+        with self._lock:
+            trace = self._traces.get(trace_id)
+            if trace is not None:
+                trace['stages'][stage] = timestamp if timestamp is not None else time.time()
+
+    def discard(self, trace_id: Optional[str]) -> None:
+        """Emre dönüşmeyen izi at"""
+        with self._lock:
+            self._traces.pop(trace_id, None)
+
+    def finish(self, trace_id: Optional[str]) -> None:
+        """İzi kapat ve aşama sürelerini histogramlara ekle"""
+        with self._lock:
+            trace = self._traces.pop(trace_id, None)
+            if trace is None:
+                return
+
+            stages = ENTRY_STAGES if trace['pipeline'] == 'entry' else EXIT_STAGES
+            marks = [(stage, trace['stages'][stage]) for stage in stages if stage in trace['stages']]
+
+            for (prev_stage, prev_ts), (stage, ts) in zip(marks, marks[1:]):
+                self._add(f"{trace['pipeline']}: {prev_stage} -> {stage}", (ts - prev_ts) * 1000)
+            if len(marks) > 1:
+                self._add(f"{trace['pipeline']}: total", (marks[-1][1] - marks[0][1]) * 1000)
+
+    def _add(self, key: str, value_ms: float) -> None:
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = LatencyHistogram()
+        histogram.add(max(0.0, value_ms))
+
+    def summary(self) -> List[dict]:
+        """Aşama bazlı gecikme özetleri"""
+        with self._lock:
+            return [{'stage': key, **histogram.summary()} for key, histogram in self.histograms.items()]
+
+    def export_csv(self, path: str) -> bool:
+        """Özetleri ve histogram kovalarını CSV dosyasına aktar"""
+        with self._lock:
+            rows = [
+                [key, *histogram.summary().values(), *histogram.buckets]
+                for key, histogram in self.histograms.items()
+            ]
+
+        bucket_names = [f"<={limit}ms" for limit in BUCKETS_MS] + [f">{BUCKETS_MS[-1]}ms"]
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['stage', 'count', 'avg_ms', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms', *bucket_names])
+            writer.writerows(rows)
+        return True
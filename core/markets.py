@@ -0,0 +1,126 @@
+from decimal import Decimal, ROUND_DOWN
+from typing import Dict, NamedTuple, Optional
+
+# ccxt precisionMode sabitleri
+DECIMAL_PLACES = 2
+SIGNIFICANT_DIGITS = 3
+TICK_SIZE = 4
+
+class MarketRules(NamedTuple):
+    """Tek bir market için emir kısıtları"""
+    amount_step: Optional[Decimal]
+    price_step: Optional[Decimal]
+    min_amount: float
+    max_amount: float
+    min_cost: float
+    taker_fee: float
+
+class MarketConstraintIndex:
+    """
+    markets_cache'ten önceden hesaplanan market kısıtları indeksi.
+    Emir boyutlandırma ve doğrulama ek API çağrısı olmadan yerel olarak yapılır.
+    """
+    def __init__(self, markets: Optional[Dict[str, dict]] = None, precision_mode: int = TICK_SIZE):
+        self.rules: Dict[str, MarketRules] = {}
+        if markets:
+            self.build(markets, precision_mode)
+
+    @staticmethod
+    def _step(value, precision_mode: int) -> Optional[Decimal]:
+        """ccxt precision değerini adım büyüklüğüne çevir"""
+        if value is None:
+            return None
+        if precision_mode == TICK_SIZE:
+            step = Decimal(str(value))
+        elif precision_mode == DECIMAL_PLACES:
+            step = Decimal(1).scaleb(-int(value))
+        else:
+            return None
+        return step if step > 0 else None
+
+    @staticmethod
+    def _market_lot_size(market: dict) -> Optional[dict]:
+        """Binance MARKET_LOT_SIZE filtresini bul (piyasa emirleri için geçerli miktar sınırları)"""
+        for item in market.get('info', {}).get('filters', []) or []:
+            if item.get('filterType') == 'MARKET_LOT_SIZE':
+                return item
+        return None
+
+    def build(self, markets: Dict[str, dict], precision_mode: int = TICK_SIZE) -> None:
+        """İndeksi markets_cache'ten yeniden oluştur"""
+        rules = {}
+        for symbol, market in markets.items():
+            precision = market.get('precision') or {}
+            limits = market.get('limits') or {}
+            amount_limits = limits.get('amount') or {}
+            cost_limits = limits.get('cost') or {}
+
+            min_amount = float(amount_limits.get('min') or 0)
+            max_amount = float(amount_limits.get('max') or 0) or float('inf')
+
+            # Piyasa emirleri için daha dar miktar sınırı olabilir
+            lot_size = self._market_lot_size(market)
+            if lot_size:
+                min_amount = max(min_amount, float(lot_size.get('minQty') or 0))
+                market_max = float(lot_size.get('maxQty') or 0)
+                if market_max > 0:
+                    max_amount = min(max_amount, market_max)
+
+            rules[symbol] = MarketRules(
+                amount_step=self._step(precision.get('amount'), precision_mode),
+                price_step=self._step(precision.get('price'), precision_mode),
+                min_amount=min_amount,
+                max_amount=max_amount,
+                min_cost=float(cost_limits.get('min') or 0),
+                taker_fee=float(market.get('taker') or 0)
+            )
+
+        # Referans değişimi atomik, okuyucular kilitsiz erişebilir
+        self.rules = rules
+
+    def get(self, symbol: str) -> Optional[MarketRules]:
+        return self.rules.get(symbol)
+
+    @staticmethod
+    def _floor(value: float, step: Optional[Decimal]) -> float:
+        if step is None:
+            return value
+        return float((Decimal(str(value)) / step).to_integral_value(ROUND_DOWN) * step)
+
+    def amount_to_step(self, symbol: str, amount: float) -> float:
+        """Miktarı lot adımına aşağı yuvarla"""
+        rules = self.rules.get(symbol)
+        return self._floor(amount, rules.amount_step) if rules else amount
+
+    def price_to_step(self, symbol: str, price: float) -> float:
+        """Fiyatı tick adımına aşağı yuvarla"""
+        rules = self.rules.get(symbol)
+        return self._floor(price, rules.price_step) if rules else price
+
+    def size_order(self, symbol: str, usdt_amount: float, price: float) -> float:
+        """
+        USDT bütçesinden alım miktarını hesapla.
+        Komisyon payı düşülür, miktar lot adımına yuvarlanır ve üst sınırla kırpılır.
+        """
+        rules = self.rules.get(symbol)
+        if not rules:
+            return usdt_amount / price
+
+        amount = usdt_amount / (1 + rules.taker_fee) / price
+        return self._floor(min(amount, rules.max_amount), rules.amount_step)
+
+    def check_order(self, symbol: str, amount: float, price: float) -> Optional[str]:
+        """
+        Emri borsa kurallarına göre doğrula.
+        Geçerliyse None, değilse ihlal edilen kuralın çeviri anahtarını döndürür.
+        """
+        rules = self.rules.get(symbol)
+        if not rules:
+            return None
+        if amount <= 0 or amount < rules.min_amount:
+            return 'order_below_min_amount'
+        if amount > rules.max_amount:
+            return 'order_above_max_amount'
+        if amount * price < rules.min_cost:
+            return 'order_below_min_notional'
+        return None
@@ -0,0 +1,142 @@
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Sembol başına tek taramada tutulan alanlar
+SCAN_DTYPE = np.dtype([
+    ('price', 'f8'),
+    ('score', 'f4'),
+    ('rsi', 'f4'),
+    ('change_24h', 'f4'),
+    ('volume', 'f8')
+])
+
+class ScanHistory:
+    """
+    Tarama sonuçları için sabit bellekli halka tampon.
+    Her tarama bir satır, her sembol bir sütundur (sembol kimliği = sütun indeksi).
+    Taranmayan hücreler NaN kalır. Bellek kapasite x sembol sayısı ile sınırlıdır.
+    """
+    def __init__(self, capacity: int = 500, initial_symbols: int = 512):
+        self.capacity = capacity
+        self.symbols: List[str] = []
+        self._symbol_ids: Dict[str, int] = {}
+
+        self._data = self._empty((capacity, initial_symbols))
+        self._timestamps = np.zeros(capacity, dtype='f8')
+
+        # Yazılmakta olan satır ve tamamlanan tarama sayısı
+        self._head = -1
+        self._open = False
+        self._completed = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _empty(shape) -> np.ndarray:
+        data = np.empty(shape, dtype=SCAN_DTYPE)
+        for field in SCAN_DTYPE.names:
+            data[field] = np.nan
+        return data
+
+    def _symbol_id(self, symbol: str) -> int:
+        """Sembol kimliğini döndür, yeni sembolde gerekirse sütun sayısını iki katına çıkar"""
+        symbol_id = self._symbol_ids.get(symbol)
+        if symbol_id is None:
+            symbol_id = self._symbol_ids[symbol] = len(self.symbols)
+            self.symbols.append(symbol)
+            if symbol_id >= self._data.shape[1]:
+                data = self._empty((self.capacity, self._data.shape[1] * 2))
+                data[:, :self._data.shape[1]] = self._data
+                self._data = data
+        return symbol_id
+
+    def begin_scan(self, timestamp: Optional[float] = None) -> None:
+        """Yeni tarama satırı aç (en eski tarama üzerine yazılır)"""
+        with self._lock:
+            # Yarım kalan taramanın satırı yeniden kullanılır
+            if not self._open:
+                self._head = (self._head + 1) % self.capacity
+                self._open = True
+            self._data[self._head] = self._empty(1)[0]
+            self._timestamps[self._head] = timestamp if timestamp is not None else time.time()
+
+    def record(self, symbol: str, price: float, score: float, rsi: float = np.nan,
+               change_24h: float = np.nan, volume: float = np.nan) -> None:
+        """Açık taramaya sembol sonucunu yaz"""
+        with self._lock:
+            if not self._open:
+                return
+            symbol_id = self._symbol_id(symbol)
+            self._data[self._head, symbol_id] = (
+                price, score, rsi, np.nan if change_24h is None else change_24h, volume
+            )
+
+    def end_scan(self) -> None:
+        """Açık taramayı tamamlandı olarak işaretle"""
+        with self._lock:
+            if self._open:
+                self._open = False
+                self._completed += 1
+
+    def __len__(self) -> int:
+        """Tamponda tutulan tamamlanmış tarama sayısı"""
+        # Açık tarama en eski satırın üzerine yazılmıştır
+        return min(self._completed, self.capacity - (1 if self._open else 0))
+
+    def _rows(self, last_n: int) -> np.ndarray:
+        """Son n tamamlanmış taramanın satır indeksleri (eskiden yeniye)"""
+        count = min(last_n, len(self))
+        # Tarama sürüyorsa son tamamlanan satır bir öncekidir
+        newest = self._head - 1 if self._open else self._head
+        return (newest - np.arange(count)[::-1]) % self.capacity
+
+    def score_trajectory(self, symbol: str, last_n: int = 50) -> Tuple[np.ndarray, np.ndarray]:
+        """Sembolün son n taramadaki (zaman, skor) dizileri"""
+        with self._lock:
+            symbol_id = self._symbol_ids.get(symbol)
+            if symbol_id is None:
+                return np.empty(0), np.empty(0, dtype='f4')
+            rows = self._rows(last_n)
+            return self._timestamps[rows].copy(), self._data['score'][rows, symbol_id].copy()
+
+    def get_scan(self, scans_ago: int = 0) -> Dict[str, dict]:
+        """Geçmişteki bir taramanın sembol sonuçlarını döndür (0 = son tarama)"""
+        with self._lock:
+            if scans_ago >= len(self):
+                return {}
+            row = self._rows(scans_ago + 1)[0]
+            snapshot = self._data[row, :len(self.symbols)]
+            valid = np.flatnonzero(~np.isnan(snapshot['score']))
+            return {
+                self.symbols[i]: {field: float(snapshot[field][i]) for field in SCAN_DTYPE.names}
+                for i in valid
+            }
+
+    def top_movers(self, n: int = 10, scans_back: int = 1) -> List[Tuple[str, float, float, float]]:
+        """
+        Son tarama ile scans_back önceki tarama arasında skoru en çok değişen semboller.
+        (sembol, önceki skor, güncel skor, fark) listesi, mutlak farka göre azalan.
+        """
+        with self._lock:
+            if len(self) <= scans_back:
+                return []
+            rows = self._rows(scans_back + 1)
+            symbol_count = len(self.symbols)
+            previous = self._data['score'][rows[0], :symbol_count]
+            current = self._data['score'][rows[-1], :symbol_count]
+
+            delta = current - previous
+            valid = np.flatnonzero(~np.isnan(delta))
+            if not len(valid):
+                return []
+
+            # Kısmi seçim + sadece seçilenleri sırala
+            k = min(n, len(valid))
+            top = valid[np.argpartition(-np.abs(delta[valid]), k - 1)[:k]]
+            top = top[np.argsort(-np.abs(delta[top]))]
+            return [
+                (self.symbols[i], float(previous[i]), float(current[i]), float(delta[i]))
+                for i in top
+            ]
@@ -0,0 +1,299 @@
+import random
+import threading
+import time
+from typing import Dict, List, Optional
+from ccxt import BadSymbol, InsufficientFunds, Exchange
+
+class SimulatedExchange:
+    """
+    ccxt arayüzünün bot tarafından kullanılan kısmını taklit eden sahte borsa.
+    Gerçek API çağrısı yapmadan (kağıt üzerinde) işlem ve OCO testi sağlar.
+    """
+    # ccxt.TICK_SIZE ile aynı değer
+    precisionMode = 4
+
+    def __init__(self, initial_balance: float = 1000.0, volatility: float = 0.002,
+                 taker_fee: float = 0.001, seed: Optional[int] = None):
+        self.id = 'simulated'
+        self.has = {
+            'fetchTickers': True,
+            'fetchOpenOrders': True,
+            'createOcoOrder': True
+        }
+        self.volatility = volatility
+        self.taker_fee = taker_fee
+        self._random = random.Random(seed)
+        self._lock = threading.RLock()
+        self._next_id = 1
+
+        # Başlangıç fiyatları
+        self.prices = {
+            'ADA/USDT': 0.45,
+            'DOGE/USDT': 0.12,
+            'DOT/USDT': 6.5,
+            'LINK/USDT': 14.0,
+            'SOL/USDT': 140.0,
+            'XRP/USDT': 0.55
+        }
+        self.markets = {symbol: self._create_market(symbol) for symbol in self.prices}
+
+        # Bakiyeler: {coin: {'free': x, 'used': y}}
+        self.balances = {'USDT': {'free': float(initial_balance), 'used': 0.0}}
+
+        # Emirler ve OCO listeleri
+        self.orders: Dict[str, dict] = {}
+        self.order_lists: Dict[str, dict] = {}
+
+    def _create_market(self, symbol: str) -> dict:
+        """Market tanımı oluştur"""
+        base, quote = symbol.split('/')
+        return {
+            'id': f"{base}{quote}",
+            'symbol': symbol,
+            'base': base,
+            'quote': quote,
+            'active': True,
+            'spot': True,
+            'taker': self.taker_fee,
+            'maker': self.taker_fee,
+            'precision': {'amount': 0.001, 'price': 0.0001},
+            'limits': {
+                'amount': {'min': 0.001, 'max': 9000000.0},
+                'price': {'min': 0.0001, 'max': 1000000.0},
+                'cost': {'min': 5.0, 'max': None}
+            },
+            'info': {'isSpotTradingAllowed': True}
+        }
+
+    def _new_id(self) -> str:
+        order_id = str(self._next_id)
+        self._next_id += 1
+        return order_id
+
+    def _balance(self, coin: str) -> dict:
+        return self.balances.setdefault(coin, {'free': 0.0, 'used': 0.0})
+
+    def _step_price(self, symbol: str) -> float:
+        """Fiyatı rastgele yürüyüşle ilerlet ve tetiklenen emirleri eşleştir"""
+        if symbol not in self.prices:
+            raise BadSymbol(f"Market bulunamadı: {symbol}")
+        if self.volatility > 0:
+            self.prices[symbol] *= 1 + self._random.gauss(0, self.volatility)
+        self._match_orders(symbol)
+        return self.prices[symbol]
+
+    def set_price(self, symbol: str, price: float) -> None:
+        """Fiyatı elle ayarla (test senaryoları için)"""
+        with self._lock:
+            self.prices[symbol] = float(price)
+            self._match_orders(symbol)
+
+    # Public API
+    def load_markets(self, reload: bool = False) -> Dict[str, dict]:
+        return self.markets
+
+    def market(self, symbol: str) -> dict:
+        return self.markets[symbol]
+
+    def fetch_ticker(self, symbol: str) -> dict:
+        with self._lock:
+            price = self._step_price(symbol)
+            return {
+                'symbol': symbol,
+                'last': price,
+                'bid': price,
+                'ask': price,
+                'percentage': 0.0,
+                'timestamp': int(time.time() * 1000)
+            }
+
+    def fetch_tickers(self, symbols: Optional[List[str]] = None) -> Dict[str, dict]:
+        with self._lock:
+            return {symbol: self.fetch_ticker(symbol) for symbol in (symbols or self.prices)}
+
+    def fetch_ohlcv(self, symbol: str, timeframe: str = '15m', limit: int = 100) -> List[list]:
+        """Güncel fiyatla biten rastgele mum verisi üret"""
+        with self._lock:
+            price = self._step_price(symbol)
+            now = int(time.time() * 1000)
+            step = Exchange.parse_timeframe(timeframe) * 1000
+            candles = []
+            close = price
+            for i in range(limit):
+                open_ = close / (1 + self._random.gauss(0, self.volatility * 5))
+                high = max(open_, close) * (1 + abs(self._random.gauss(0, self.volatility)))
+                low = min(open_, close) * (1 - abs(self._random.gauss(0, self.volatility)))
+                volume = self._random.uniform(50000, 500000) / close
+                candles.append([now - i * step, open_, high, low, close, volume])
+                close = open_
+            candles.reverse()
+            return candles
+
+    # Private API
+    def fetch_balance(self) -> dict:
+        with self._lock:
+            result = {'free': {}, 'used': {}, 'total': {}}
+            for coin, balance in self.balances.items():
+                total = balance['free'] + balance['used']
+                result[coin] = {'free': balance['free'], 'used': balance['used'], 'total': total}
+                result['free'][coin] = balance['free']
+                result['used'][coin] = balance['used']
+                result['total'][coin] = total
+            return result
+
+    def _fill(self, order: dict, price: float) -> dict:
+        """Emri verilen fiyattan doldur ve bakiyeleri güncelle"""
+        market = self.markets[order['symbol']]
+        base, quote = self._balance(market['base']), self._balance(market['quote'])
+        cost = price * order['amount']
+
+        if order['side'] == 'buy':
+            # Binance gibi: alım komisyonu alınan coin'den kesilir
+            fee = {'cost': order['amount'] * self.taker_fee, 'currency': market['base']}
+            base['free'] += order['amount'] - fee['cost']
+            quote['free'] -= cost
+        else:
+            fee = {'cost': cost * self.taker_fee, 'currency': market['quote']}
+            # Satış emirleri için bakiye önceden kilitlenmiş olabilir
+            if order.get('reserved'):
+                base['used'] -= order['amount']
+            else:
+                base['free'] -= order['amount']
+            quote['free'] += cost - fee['cost']
+
+        order.update({
+            'status': 'closed',
+            'price': price,
+            'average': price,
+            'filled': order['amount'],
+            'remaining': 0.0,
+            'cost': cost,
+            'fee': fee,
+            'lastTradeTimestamp': int(time.time() * 1000)
+        })
+        return order
+
+    def _create_order(self, symbol: str, order_type: str, side: str, amount: float,
+                      price: Optional[float] = None, stop_price: Optional[float] = None) -> dict:
+        order = {
+            'id': self._new_id(),
+            'symbol': symbol,
+            'type': order_type,
+            'side': side,
+            'amount': float(amount),
+            'price': price,
+            'stopPrice': stop_price,
+            'filled': 0.0,
+            'remaining': float(amount),
+            'status': 'open',
+            'timestamp': int(time.time() * 1000)
+        }
+        self.orders[order['id']] = order
+        return order
+
+    def create_market_buy_order(self, symbol: str, amount: float, params: Optional[dict] = None) -> dict:
+        with self._lock:
+            price = self.prices[symbol]
+            cost = price * amount
+            if self._balance(self.markets[symbol]['quote'])['free'] < cost:
+                raise InsufficientFunds(f"Insufficient balance for {symbol} buy")
+            order = self._create_order(symbol, 'market', 'buy', amount)
+            return dict(self._fill(order, price))
+
+    def create_market_sell_order(self, symbol: str, amount: float, params: Optional[dict] = None) -> dict:
+        with self._lock:
+            if self._balance(self.markets[symbol]['base'])['free'] < amount:
+                raise InsufficientFunds(f"Insufficient balance for {symbol} sell")
+            order = self._create_order(symbol, 'market', 'sell', amount)
+            return dict(self._fill(order, self.prices[symbol]))
+
+    def create_oco_order(self, symbol: str, side: str, amount: float, price: float,
+                         stop_price: float, stop_limit_price: float) -> dict:
+        """
+        Take-profit limit + stop-limit OCO satış emri oluştur.
+        Bir bacak dolduğunda diğeri iptal edilir.
+        """
+        with self._lock:
+            if side != 'sell':
+                raise Exception("Only sell OCO orders are supported")
+            base = self._balance(self.markets[symbol]['base'])
+            if base['free'] < amount:
+                raise InsufficientFunds(f"Insufficient balance for {symbol} OCO")
+
+            # Satılacak miktarı kilitle
+            base['free'] -= amount
+            base['used'] += amount
+
+            list_id = self._new_id()
+            take_profit = self._create_order(symbol, 'limit', 'sell', amount, price=price)
+            stop_loss = self._create_order(symbol, 'stop_loss_limit', 'sell', amount,
+                                           price=stop_limit_price, stop_price=stop_price)
+            for order in (take_profit, stop_loss):
+                order['reserved'] = True
+                order['orderListId'] = list_id
+
+            self.order_lists[list_id] = {
+                'id': list_id,
+                'symbol': symbol,
+                'take_profit_id': take_profit['id'],
+                'stop_loss_id': stop_loss['id'],
+                'status': 'open'
+            }
+            return dict(self.order_lists[list_id])
+
+    def _match_orders(self, symbol: str) -> None:
+        """Fiyatı tetiklenen OCO bacaklarını doldur"""
+        price = self.prices[symbol]
+        for order_list in self.order_lists.values():
+            if order_list['symbol'] != symbol or order_list['status'] != 'open':
+                continue
+
+            take_profit = self.orders[order_list['take_profit_id']]
+            stop_loss = self.orders[order_list['stop_loss_id']]
+
+            if price >= take_profit['price']:
+                filled, cancelled = take_profit, stop_loss
+            elif price <= stop_loss['stopPrice']:
+                filled, cancelled = stop_loss, take_profit
+            else:
+                continue
+
+            self._fill(filled, filled['price'])
+            cancelled['status'] = 'canceled'
+            order_list['status'] = 'closed'
+
+    def cancel_oco_order(self, list_id: str, symbol: Optional[str] = None) -> dict:
+        """OCO listesini iptal et ve kilitli bakiyeyi serbest bırak"""
+        with self._lock:
+            order_list = self.order_lists.get(list_id)
+            if not order_list or order_list['status'] != 'open':
+                raise Exception(f"Order list not open: {list_id}")
+
+            amount = 0.0
+            for key in ('take_profit_id', 'stop_loss_id'):
+                order = self.orders[order_list[key]]
+                order['status'] = 'canceled'
+                amount = order['amount']
+
+            base = self._balance(self.markets[order_list['symbol']]['base'])
+            base['used'] -= amount
+            base['free'] += amount
+            order_list['status'] = 'canceled'
+            return dict(order_list)
+
+    def fetch_open_orders(self, symbol: Optional[str] = None, since=None, limit=None,
+                          params: Optional[dict] = None) -> List[dict]:
+        with self._lock:
+            return [
+                dict(order) for order in self.orders.values()
+                if order['status'] == 'open' and (symbol is None or order['symbol'] == symbol)
+            ]
+
+    def fetch_order(self, order_id: str, symbol: Optional[str] = None, params: Optional[dict] = None) -> dict:
+        with self._lock:
+            if order_id not in self.orders:
+                raise Exception(f"Order not found: {order_id}")
+            return dict(self.orders[order_id])
+
+    def close(self) -> None:
+        pass
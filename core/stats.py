@@ -1,6 +1,50 @@
 # core/stats.py
+import math
+import time
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, NamedTuple, Tuple
+
+class SymbolStats(NamedTuple):
+    """Sembol bazlı kapanan işlem özeti"""
+    trades: int = 0
+    wins: int = 0
+    losses: int = 0
+    profit: float = 0.0
+    best: float = 0.0
+    worst: float = 0.0
+
+class StatsSnapshot(NamedTuple):
+    """UI'ın kilitsiz okuduğu değişmez istatistik görüntüsü"""
+    total_trades: int = 0
+    winning_trades: int = 0
+    losing_trades: int = 0
+    win_rate: float = 0.0
+    total_profit_usdt: float = 0.0
+    gross_profit: float = 0.0
+    gross_loss: float = 0.0
+    profit_factor: float = 0.0
+    expectancy: float = 0.0
+    average_profit_per_trade: float = 0.0
+    best_trade: float = 0.0
+    worst_trade: float = 0.0
+    equity: float = 0.0
+    peak_equity: float = 0.0
+    max_drawdown: float = 0.0
+    max_drawdown_pct: float = 0.0
+    sharpe: float = 0.0
+    sortino: float = 0.0
+    per_symbol: Mapping[str, SymbolStats] = MappingProxyType({})
+    updated_at: float = 0.0
+
 class TradingStats:
-    def __init__(self):
+    """
+    Kapanan her işlemde O(1) güncellenen performans istatistikleri.
+    Getiri ortalaması ve varyansı Welford yöntemiyle tutulur (Sharpe/Sortino
+    işlem başına getiri yüzdesi üzerinden, yıllıklandırılmadan hesaplanır).
+    Yazmalar engine kilidi altında yapılır; yayınlamada yeni bir StatsSnapshot
+    üretilir (sembol özeti kopyalanır) ve referansı atomik olarak değiştirilir.
+    """
+    def __init__(self, starting_equity: float = 0.0):
         self.total_trades = 0
         self.winning_trades = 0
         self.losing_trades = 0
@@ -12,20 +56,123 @@ class TradingStats:
         self.average_profit_per_trade = 0
         self.win_rate = 0
         self.active_trades = {}
-        self.trade_history = []
-
-    def add_trade_history(self, trade_data: dict):
-        """İşlem geçmişine yeni işlem ekle"""
-        self.trade_history.append(trade_data)
-        
-        # Satış işlemiyse istatistikleri güncelle
-        if trade_data['type'] == 'sell':
-            profit = trade_data.get('profit', 0)
-            if profit > self.best_trade:
-                self.best_trade = profit
-            if profit < self.worst_trade:
-                self.worst_trade = profit
-            
-            if self.total_trades > 0:
-                self.average_profit_per_trade = self.total_profit_usdt / self.total_trades
-                self.win_rate = (self.winning_trades / self.total_trades) * 100
\ No newline at end of file
+
+        self.gross_profit = 0.0
+        self.gross_loss = 0.0
+        self.starting_equity = starting_equity
+        self.peak_equity = starting_equity
+        self.max_drawdown_pct = 0.0
+
+        # Welford: işlem başına getiri (%) ortalaması ve kare farkları toplamı
+        self._return_mean = 0.0
+        self._return_m2 = 0.0
+        self._downside_sq_sum = 0.0
+
+        # Yerinde güncellenir, sadece görüntü yayınlanırken kopyalanır
+        self._per_symbol: Dict[str, SymbolStats] = {}
+        self.snapshot = StatsSnapshot(equity=starting_equity, peak_equity=starting_equity)
+
+    @property
+    def equity(self) -> float:
+        return self.starting_equity + self.total_profit_usdt
+
+    def load_closed_trades(self, trades: Iterable[Tuple[float, str, float, float]], starting_equity: float) -> None:
+        """
+        Önceki oturumların kapanışlarını (zaman, sembol, kâr, kâr %) eskiden yeniye
+        analitiklere işle. Kapanışlar akış olarak okunur; görüntü sonda bir kez yayınlanır.
+        """
+        self.starting_equity = self.peak_equity = float(starting_equity)
+        for _, symbol, profit, profit_percentage in trades:
+            self.record_close(symbol, profit or 0.0, profit_percentage or 0.0, publish=False)
+        self._publish()
+
+    def record_close(self, symbol: str, profit: float, profit_percentage: float, publish: bool = True) -> None:
+        """Kapanan işlemi sayaçlara, düşüşe ve sembol özetine işle (engine kilidi altında)"""
+        self.total_trades += 1
+        if profit > 0:
+            self.winning_trades += 1
+            self.gross_profit += profit
+        else:
+            self.losing_trades += 1
+            self.gross_loss += -profit
+
+        self.total_profit_usdt += profit
+        self.total_profit_percentage += profit_percentage
+        self.best_trade = max(self.best_trade, profit) if self.total_trades > 1 else profit
+        self.worst_trade = min(self.worst_trade, profit) if self.total_trades > 1 else profit
+        self.average_profit_per_trade = self.total_profit_usdt / self.total_trades
+        self.win_rate = self.winning_trades / self.total_trades * 100
+
+        # Welford güncellemesi
+        delta = profit_percentage - self._return_mean
+        self._return_mean += delta / self.total_trades
+        self._return_m2 += delta * (profit_percentage - self._return_mean)
+        if profit_percentage < 0:
+            self._downside_sq_sum += profit_percentage * profit_percentage
+
+        # Düşüş
+        equity = self.equity
+        self.peak_equity = max(self.peak_equity, equity)
+        drawdown = self.peak_equity - equity
+        self.max_drawdown = max(self.max_drawdown, drawdown)
+        if self.peak_equity > 0:
+            self.max_drawdown_pct = max(self.max_drawdown_pct, drawdown / self.peak_equity * 100)
+
+        # Sembol özeti (değişmez kayıt; yayınlanmış görüntüler kendi kopyalarını tutar)
+        previous = self._per_symbol.get(symbol)
+        if previous is None:
+            current = SymbolStats(1, int(profit > 0), int(profit <= 0), profit, profit, profit)
+        else:
+            current = previous._replace(
+                trades=previous.trades + 1,
+                wins=previous.wins + int(profit > 0),
+                losses=previous.losses + int(profit <= 0),
+                profit=previous.profit + profit,
+                best=max(previous.best, profit),
+                worst=min(previous.worst, profit)
+            )
+        self._per_symbol[symbol] = current
+
+        if publish:
+            self._publish()
+
+    def _publish(self) -> None:
+        """Güncel değerlerden yeni görüntü oluştur"""
+        n = self.total_trades
+        std = math.sqrt(self._return_m2 / (n - 1)) if n > 1 else 0.0
+        downside = math.sqrt(self._downside_sq_sum / n) if n else 0.0
+
+        if self.gross_loss > 0:
+            profit_factor = self.gross_profit / self.gross_loss
+        else:
+            profit_factor = math.inf if self.gross_profit > 0 else 0.0
+
+        # Beklenen değer = kazanma oranı x ort. kazanç - kaybetme oranı x ort. kayıp
+        expectancy = 0.0
+        if n:
+            avg_win = self.gross_profit / self.winning_trades if self.winning_trades else 0.0
+            avg_loss = self.gross_loss / self.losing_trades if self.losing_trades else 0.0
+            expectancy = (self.winning_trades * avg_win - self.losing_trades * avg_loss) / n
+
+        self.snapshot = StatsSnapshot(
+            total_trades=n,
+            winning_trades=self.winning_trades,
+            losing_trades=self.losing_trades,
+            win_rate=self.win_rate,
+            total_profit_usdt=self.total_profit_usdt,
+            gross_profit=self.gross_profit,
+            gross_loss=self.gross_loss,
+            profit_factor=profit_factor,
+            expectancy=expectancy,
+            average_profit_per_trade=self.average_profit_per_trade,
+            best_trade=self.best_trade,
+            worst_trade=self.worst_trade,
+            equity=self.equity,
+            peak_equity=self.peak_equity,
+            max_drawdown=self.max_drawdown,
+            max_drawdown_pct=self.max_drawdown_pct,
+            sharpe=self._return_mean / std if std > 0 else 0.0,
+            sortino=self._return_mean / downside if downside > 0 else 0.0,
+            per_symbol=MappingProxyType(dict(self._per_symbol)),
+            updated_at=time.time()
+        )
@@ -0,0 +1,371 @@
+import logging
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from utils.language_manager import LanguageManager
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS trades (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ts REAL NOT NULL,
+    symbol TEXT NOT NULL,
+    type TEXT NOT NULL,
+    price REAL NOT NULL,
+    amount REAL NOT NULL,
+    profit REAL,
+    profit_percentage REAL,
+    status TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_trades_ts ON trades (ts);
+CREATE INDEX IF NOT EXISTS idx_trades_symbol_ts ON trades (symbol, ts);
+
+CREATE TABLE IF NOT EXISTS positions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    symbol TEXT NOT NULL,
+    entry_time REAL NOT NULL,
+    entry_price REAL NOT NULL,
+    amount REAL NOT NULL,
+    stop_loss REAL,
+    take_profit REAL,
+    analysis_score REAL,
+    exit_time REAL,
+    exit_price REAL,
+    reason TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_positions_entry_time ON positions (entry_time);
+CREATE INDEX IF NOT EXISTS idx_positions_symbol_entry_time ON positions (symbol, entry_time);
+
+CREATE TABLE IF NOT EXISTS scans (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ts REAL NOT NULL,
+    symbol TEXT NOT NULL,
+    price REAL,
+    change_24h REAL,
+    rsi REAL,
+    volume REAL,
+    score REAL,
+    signal TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_scans_ts ON scans (ts);
+CREATE INDEX IF NOT EXISTS idx_scans_symbol_ts ON scans (symbol, ts);
+"""
+
+INSERT_TRADE = (
+    "INSERT INTO trades (ts, symbol, type, price, amount, profit, profit_percentage, status) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+INSERT_POSITION = (
+    "INSERT INTO positions (symbol, entry_time, entry_price, amount, stop_loss, take_profit, analysis_score) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+CLOSE_POSITION = (
+    "UPDATE positions SET exit_time = ?, exit_price = ?, reason = ? "
+    "WHERE id = (SELECT id FROM positions WHERE symbol = ? AND exit_time IS NULL "
+    "ORDER BY entry_time DESC LIMIT 1)"
+)
+# Pozisyon kapanınca açılış işleminin durumu güncellenir
+CLOSE_TRADE = (
+    "UPDATE trades SET status = 'closed_position' "
+    "WHERE id = (SELECT id FROM trades WHERE symbol = ? AND type = 'buy' AND status = 'open_position' "
+    "ORDER BY id DESC LIMIT 1)"
+)
+INSERT_SCAN = (
+    "INSERT INTO scans (ts, symbol, price, change_24h, rsi, volume, score, signal) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+# Dışa aktarılabilen tablolar ve zaman sütunları
+TIME_COLUMNS = {'trades': 'ts', 'positions': 'entry_time', 'scans': 'ts'}
+
+def _timestamp(value) -> float:
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return float(value) if value is not None else datetime.now().timestamp()
+
+class HistoryStore:
+    """
+    İşlem, pozisyon ve tarama geçmişi için gömülü SQLite deposu.
+    Yazmalar kuyruğa alınır ve arka planda tek transaction ile toplu yapılır,
+    okumalar sayfalı ve indeksli sorgularla yapılır.
+    """
+    def __init__(self, path: str, flush_interval: float = 1.0, lang: Optional[LanguageManager] = None):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.lang = lang or LanguageManager()
+        self._pending = []
+        self._lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._conn = None
+        self._thread = None
+        self.is_running = False
+
+    def open(self) -> None:
+        """Veritabanını aç, şemayı oluştur ve yazma thread'ini başlat"""
+        if self.is_running:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        # WAL: okumalar yazmaları beklemez
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+        self.is_running = True
+        self._thread = threading.Thread(target=self._flush_loop)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def close(self) -> None:
+        """Bekleyen yazmaları aktar ve veritabanını kapat"""
+        if not self.is_running:
+            return
+        self.is_running = False
+        self._wakeup.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+        self.flush()
+        with self._db_lock:
+            self._conn.close()
+            self._conn = None
+
+    # Yazma
+    def _enqueue(self, sql: str, rows: List[tuple]) -> None:
+        with self._lock:
+            self._pending.append((sql, rows))
+
+    def record_trade(self, trade_type: str, symbol: str, price: float, amount: float, status: str,
+                     profit: Optional[float] = None, profit_percentage: Optional[float] = None,
+                     timestamp=None) -> None:
+        """İşlemi kuyruğa ekle"""
+        self._enqueue(INSERT_TRADE, [(
+            _timestamp(timestamp), symbol, trade_type, price, amount, profit, profit_percentage, status
+        )])
+
+    def record_position_open(self, symbol: str, position: dict) -> None:
+        """Açılan pozisyonu kuyruğa ekle"""
+        self._enqueue(INSERT_POSITION, [(
+            symbol,
+            _timestamp(position.get('entry_time')),
+            position['entry_price'],
+            position['amount'],
+            position.get('stop_loss'),
+            position.get('take_profit'),
+            position.get('analysis_score')
+        )])
+
+    def record_position_close(self, symbol: str, exit_price: float, reason: str, timestamp=None) -> None:
+        """Sembolün açık pozisyon kaydını ve açılış işleminin durumunu kapat"""
+        self._enqueue(CLOSE_POSITION, [(_timestamp(timestamp), exit_price, reason, symbol)])
+        self._enqueue(CLOSE_TRADE, [(symbol,)])
+
+    def record_scans(self, scan_results: List[dict]) -> None:
+        """Tarama sonuçlarını kuyruğa ekle"""
+        rows = [
+            (
+                _timestamp(result.get('timestamp')),
+                result['symbol'],
+                result.get('price'),
+                result.get('change_24h'),
+                result.get('rsi'),
+                result.get('volume'),
+                result.get('score'),
+                result.get('signal')
+            )
+            for result in scan_results
+        ]
+        if rows:
+            self._enqueue(INSERT_SCAN, rows)
+
+    def flush(self) -> None:
+        """Kuyruktaki yazmaları tek transaction ile veritabanına aktar"""
+        # Kuyruk veritabanı kilidi altında alınır: eş zamanlı flush'lar (yazma thread'i,
+        # okumalar, dışa aktarım) partileri kuyruğa eklenme sırasıyla yazar, böylece
+        # bir UPDATE kendi INSERT'inden önce çalışıp boşa gitmez
+        with self._db_lock:
+            with self._lock:
+                pending, self._pending = self._pending, []
+            if not pending or not self._conn:
+                return
+
+            # Ardışık aynı sorgular tek executemany ile yazılır
+            batches = []
+            for sql, rows in pending:
+                if batches and batches[-1][0] == sql:
+                    batches[-1][1].extend(rows)
+                else:
+                    batches.append((sql, list(rows)))
+
+            try:
+                with self._conn:
+                    for sql, rows in batches:
+                        self._conn.executemany(sql, rows)
+            except Exception as e:
+                logging.error(f"{self.lang.__('history_store_write_error')}: {str(e)}")
+
+    def _flush_loop(self) -> None:
+        while self.is_running:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+    # Okuma
+    @staticmethod
+    def _where(symbol: Optional[str], since, until) -> tuple:
+        clauses, params = [], []
+        if symbol:
+            clauses.append("symbol = ?")
+            params.append(symbol)
+        if since is not None:
+            clauses.append("ts >= ?")
+            params.append(_timestamp(since))
+        if until is not None:
+            clauses.append("ts < ?")
+            params.append(_timestamp(until))
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def _query(self, sql: str, params: list) -> List[sqlite3.Row]:
+        with self._db_lock:
+            if not self._conn:
+                return []
+            return self._conn.execute(sql, params).fetchall()
+
+    def count_trades(self, symbol: Optional[str] = None, since=None, until=None) -> int:
+        """Filtreye uyan işlem sayısı"""
+        where, params = self._where(symbol, since, until)
+        rows = self._query(f"SELECT COUNT(*) FROM trades{where}", params)
+        return rows[0][0] if rows else 0
+
+    def get_trades(self, offset: int = 0, limit: int = 100, symbol: Optional[str] = None,
+                   since=None, until=None, newest_first: bool = True) -> List[dict]:
+        """İşlemleri sayfalı olarak döndür (TradeHistory ile aynı sözlük yapısı)"""
+        where, params = self._where(symbol, since, until)
+        order = "DESC" if newest_first else "ASC"
+        rows = self._query(
+            f"SELECT * FROM trades{where} ORDER BY ts {order}, id {order} LIMIT ? OFFSET ?",
+            params + [limit, offset]
+        )
+        return [self._trade_dict(row) for row in rows]
+
+    @staticmethod
+    def _trade_dict(row: sqlite3.Row) -> dict:
+        trade = {
+            'id': row['id'],
+            'timestamp': datetime.fromtimestamp(row['ts']),
+            'symbol': row['symbol'],
+            'type': row['type'],
+            'price': row['price'],
+            'amount': row['amount'],
+            'total_usdt': row['price'] * row['amount'],
+            'status': row['status']
+        }
+        if row['profit'] is not None:
+            trade['profit'] = row['profit']
+            trade['profit_percentage'] = row['profit_percentage']
+        return trade
+
+    def get_trades_after(self, after_id: int, limit: int = 1000) -> List[dict]:
+        """Kimliği after_id'den büyük işlemler, eskiden yeniye (artımlı okuma)"""
+        rows = self._query("SELECT * FROM trades WHERE id > ? ORDER BY id LIMIT ?", [after_id, limit])
+        return [self._trade_dict(row) for row in rows]
+
+    def get_trades_before(self, before_id: int, limit: int = 100) -> List[dict]:
+        """Kimliği before_id'den küçük işlemler, yeniden eskiye (geriye doğru sayfalama)"""
+        rows = self._query("SELECT * FROM trades WHERE id < ? ORDER BY id DESC LIMIT ?", [before_id, limit])
+        return [self._trade_dict(row) for row in rows]
+
+    def get_closed_profit(self) -> float:
+        """Kapanan işlemlerin toplam kârı"""
+        self.flush()
+        rows = self._query("SELECT COALESCE(SUM(profit), 0) FROM trades WHERE type = 'sell'", [])
+        return float(rows[0][0]) if rows else 0.0
+
+    def iter_closed_trades(self, batch_size: int = 5000):
+        """Kapanışları (zaman, sembol, kâr, kâr %) eskiden yeniye tek tek döndüren generator"""
+        self.flush()
+        for rows in self._iter_query(
+            "SELECT ts, symbol, profit, profit_percentage FROM trades WHERE type = 'sell' ORDER BY ts, id",
+            [], batch_size
+        ):
+            yield from rows
+
+    def get_trade_statuses(self, ids: List[int]) -> Dict[int, str]:
+        """Verilen işlemlerin güncel durumları"""
+        if not ids:
+            return {}
+        placeholders = ",".join("?" * len(ids))
+        rows = self._query(f"SELECT id, status FROM trades WHERE id IN ({placeholders})", list(ids))
+        return {row['id']: row['status'] for row in rows}
+
+    def get_positions(self, offset: int = 0, limit: int = 100, symbol: Optional[str] = None,
+                      open_only: bool = False) -> List[dict]:
+        """Pozisyon kayıtlarını en yeniden eskiye döndür"""
+        clauses, params = [], []
+        if symbol:
+            clauses.append("symbol = ?")
+            params.append(symbol)
+        if open_only:
+            clauses.append("exit_time IS NULL")
+        where = (" WHERE " + " AND ".join(clauses)) if clauses else ""
+        rows = self._query(
+            f"SELECT * FROM positions{where} ORDER BY entry_time DESC LIMIT ? OFFSET ?",
+            params + [limit, offset]
+        )
+        return [dict(row) for row in rows]
+
+    def get_scans(self, symbol: Optional[str] = None, since=None, until=None,
+                  offset: int = 0, limit: int = 1000) -> List[dict]:
+        """Tarama kayıtlarını en yeniden eskiye döndür"""
+        where, params = self._where(symbol, since, until)
+        rows = self._query(
+            f"SELECT * FROM scans{where} ORDER BY ts DESC LIMIT ? OFFSET ?",
+            params + [limit, offset]
+        )
+        return [dict(row) for row in rows]
+
+    def schema(self, table: str) -> List[Tuple[str, str]]:
+        """Tablonun (sütun adı, SQLite tipi) listesi"""
+        if table not in TIME_COLUMNS:
+            raise ValueError(f"Bilinmeyen tablo: {table}")
+        return [(row[1], row[2]) for row in self._query(f"PRAGMA table_info({table})", [])]
+
+    def iter_rows(self, table: str, since=None, until=None, batch_size: int = 5000):
+        """
+        Tablo satırlarını zaman sırasıyla parça parça döndüren generator.
+        Ayrı bir okuma bağlantısı kullanılır, bellekte en fazla bir parça tutulur.
+        """
+        if table not in TIME_COLUMNS:
+            raise ValueError(f"Bilinmeyen tablo: {table}")
+        time_column = TIME_COLUMNS[table]
+
+        clauses, params = [], []
+        if since is not None:
+            clauses.append(f"{time_column} >= ?")
+            params.append(_timestamp(since))
+        if until is not None:
+            clauses.append(f"{time_column} < ?")
+            params.append(_timestamp(until))
+        where = (" WHERE " + " AND ".join(clauses)) if clauses else ""
+
+        # Bekleyen yazmalar dışa aktarıma dahil olsun
+        self.flush()
+        yield from self._iter_query(f"SELECT * FROM {table}{where} ORDER BY {time_column}", params, batch_size)
+
+    def _iter_query(self, sql: str, params: list, batch_size: int):
+        """Sorgu sonucunu ayrı bir okuma bağlantısıyla parça parça döndür"""
+        conn = sqlite3.connect(self.path)
+        try:
+            cursor = conn.execute(sql, params)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield rows
+        finally:
+            conn.close()
@@ -3,15 +3,37 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 import logging
-from typing import Dict, Optional
+import os
+from typing import Dict, List, Optional
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from .stats import TradingStats
 from .analysis import MarketAnalyzer
+from .simulated_exchange import SimulatedExchange
+from .balance import BalanceLedger
+from .executor import OrderExecutor
+from .markets import MarketConstraintIndex, TICK_SIZE
+from .journal import PositionJournal
+from .store import HistoryStore
+from .scan_history import ScanHistory
+from .cache import PriceCache, TieredOHLCVCache, IndicatorCache, NegativeCache
+from .latency import LatencyTracker
 from utils.language_manager import LanguageManager
 
+def mode_path(data_dir: str, filename: str, simulated: bool) -> str:
+    """
+    Moda göre veri dosyası yolu: simülasyon dosyaları gerçek hesabınkilerden ayrıdır
+    (positions.journal -> positions.sim.journal). Böylece bir mod diğerinin
+    pozisyonlarını geri yüklemez ve geçmişleri karışmaz.
+    """
+    if simulated:
+        base, ext = os.path.splitext(filename)
+        filename = f"{base}.sim{ext}"
+    return os.path.join(data_dir, filename)
+
 class TradingEngine:
-    def __init__(self, config: dict):
+    def __init__(self, config: dict, data_dir: str = '_internal', store: Optional[HistoryStore] = None):
         self.config = config
         self.is_running = False
         self.is_stopping = False
@@ -19,31 +41,122 @@ class TradingEngine:
         self.stats = TradingStats()
         self.active_trades = {}
         self.markets_cache = {}
+        self.market_rules = MarketConstraintIndex()
+        self.balance_ledger = None
         self.scan_callback = None
-        self._lock = threading.Lock()
+        self._lock = threading.RLock()
+        
+        # Dil yöneticisi (bileşenlerin logları da bunu kullanır)
+        self.lang = LanguageManager()
+        
+        # Satış emri gönderilmekte olan semboller (çift satışı önler)
+        self._closing = set()
+        
+        # Mum kapanışı -> emir dolumu arası aşama gecikmeleri
+        self.latency = LatencyTracker()
+        
+        # Ticker, mum ve analiz sonuçları için LRU/TTL cache'ler
+        # Bayat fiyat beklemeden döner, arka planda toplu yenilenir
+        self.price_cache = PriceCache(
+            fresh_seconds=float(self.config.get('price_cache_ttl', 2)),
+            max_stale_seconds=float(self.config.get('price_max_stale', 30)),
+            lang=self.lang
+        )
+        # Mumlar bellekten atıldığında veya yeniden başlatmada diskten geri gelir
+        self.ohlcv_cache = TieredOHLCVCache(
+            os.path.join(data_dir, 'ohlcv_cache'),
+            max_size=int(self.config.get('ohlcv_cache_size', 1000)),
+            expiry_seconds=float(self.config.get('ohlcv_cache_ttl', 60)),
+            max_disk_bytes=int(self.config.get('ohlcv_disk_cache_mb', 200)) * 1024 * 1024,
+            disk_expiry_seconds=float(self.config.get('ohlcv_disk_ttl', 300)),
+            lang=self.lang
+        )
+        self.indicator_cache = IndicatorCache(
+            max_size=int(self.config.get('indicator_cache_size', 1000)),
+            expiry_seconds=float(self.config.get('indicator_cache_ttl', 900))
+        )
+        # Hata veren semboller üstel artan süreyle taramadan çıkarılır
+        self.negative_cache = NegativeCache(
+            max_seconds=float(self.config.get('quarantine_max_seconds', 21600))
+        )
+        
+        # Son taramaların skor geçmişi (sabit bellekli halka tampon)
+        self.scan_history = ScanHistory(capacity=int(self.config.get('scan_history_size', 500)))
+        
+        # Açık pozisyonlar çökme sonrası kurtarma için günlüğe yazılır
+        simulated = bool(self.config.get('simulated', False))
+        self.journal = PositionJournal(
+            mode_path(data_dir, 'positions.journal', simulated),
+            flush_interval=float(self.config.get('journal_flush_interval', 0.2)),
+            lang=self.lang
+        )
+        
+        # İşlem, pozisyon ve tarama geçmişi kalıcı olarak SQLite'ta tutulur
+        # (dışarıdan verilen depo paylaşılır, kapatılması sahibine aittir)
+        store_path = mode_path(data_dir, 'history.db', simulated)
+        if store is not None and os.path.abspath(store.path) != os.path.abspath(store_path):
+            raise ValueError(f"Geçmiş deposu bu mod için değil: {store.path} (beklenen {store_path})")
+        self._owns_store = store is None
+        self.store = store or HistoryStore(
+            store_path,
+            flush_interval=float(self.config.get('history_flush_interval', 1.0)),
+            lang=self.lang
+        )
+        
+        # Alım emirleri taramadan bağımsız kendi kuyruğunda yürütülür
+        self.order_executor = OrderExecutor(
+            self._execute_intent,
+            lambda: len(self.active_trades),
+            max_positions=self.config.get('max_positions', 3),
+            lock=self._lock,
+            lang=self.lang
+        )
         
         # MarketAnalyzer instance'ı oluştur
         self.analyzer = MarketAnalyzer()
         
-        # Dil yöneticisi
-        self.lang = LanguageManager()
-        
     def start(self):
         """Trading sistemini başlat"""
         try:
-            self.exchange = ccxt.binance({
-                'apiKey': self.config['api_key'],
-                'secret': self.config['api_secret'],
-                'enableRateLimit': True,
-                'options': {
-                    'defaultType': 'spot',
-                    'adjustForTimeDifference': True
-                }
-            })
+            if self.config.get('simulated', False):
+                self.exchange = SimulatedExchange(
+                    initial_balance=float(self.config.get('simulated_balance', 1000))
+                )
+            else:
+                self.exchange = ccxt.binance({
+                    'apiKey': self.config['api_key'],
+                    'secret': self.config['api_secret'],
+                    'enableRateLimit': True,
+                    'options': {
+                        'defaultType': 'spot',
+                        'adjustForTimeDifference': True,
+                        'warnOnFetchOpenOrdersWithoutSymbol': False
+                    }
+                })
             
             # Test API bağlantısı
             self.exchange.load_markets()
-            balance = self.exchange.fetch_balance()
+            
+            # Bakiye defterini bir kez doldur, sonrasında dolumlarla güncellenir
+            self.balance_ledger = BalanceLedger(
+                self.exchange,
+                reconcile_interval=float(self.config.get('balance_reconcile_interval', 60)),
+                lang=self.lang
+            )
+            self.balance_ledger.seed()
+            
+            # Geçmiş deposunu aç
+            self.store.open()
+            
+            # Analitikler (kazanma oranı, düşüş, Sharpe) önceki oturumların kapanışlarıyla başlar;
+            # geçmiş kârlar bakiyeye zaten yansıdığından başlangıç sermayesi bakiye - toplam kârdır
+            self.stats.load_closed_trades(
+                self.store.iter_closed_trades(),
+                self.balance_ledger.get_free('USDT') - self.store.get_closed_profit()
+            )
+            
+            # Önceki oturumdan kalan açık pozisyonları geri yükle
+            self._recover_positions()
             
             # Trading döngüsünü başlat
             self.is_running = True
@@ -51,6 +164,19 @@ class TradingEngine:
             self.trading_thread.daemon = True
             self.trading_thread.start()
             
+            # Pozisyon takip döngüsünü taramadan bağımsız başlat
+            self.monitor_thread = threading.Thread(target=self._position_monitor_loop)
+            self.monitor_thread.daemon = True
+            self.monitor_thread.start()
+            
+            self.order_executor.start()
+            
+            # Bayat fiyatları tek istekle yenileyen arka plan thread'i
+            self.price_cache.start_refresher(
+                self._fetch_tickers,
+                interval=float(self.config.get('price_refresh_interval', 1.0))
+            )
+            
             logging.info(self.lang.__('trading_engine_started'))
             
         except Exception as e:
@@ -58,92 +184,127 @@ class TradingEngine:
             logging.error(error_msg)
             raise Exception(error_msg)
         
+    def _recover_positions(self):
+        """
+        Günlükteki açık pozisyonları geri yükle ve borsa bakiyeleriyle uzlaştır.
+        Bakiyesi artık bulunmayan (ör. elle satılmış) pozisyonlar atılır.
+        """
+        try:
+            positions = self.journal.replay()
+            
+            for symbol, position in positions.items():
+                coin = symbol.split('/')[0]
+                held = self.balance_ledger.get_free(coin) + self.balance_ledger.get_used(coin)
+                
+                # Komisyon kesintisi için küçük tolerans
+                if held < position['amount'] * 0.98:
+                    logging.warning(f"{self.lang.__('journal_position_dropped')}: {symbol} ({held} < {position['amount']})")
+                    continue
+                
+                position['amount'] = min(position['amount'], held)
+                with self._lock:
+                    self.active_trades[symbol] = position
+                logging.info(f"{self.lang.__('journal_position_restored')}: {symbol}")
+            
+            # Günlüğü güncel durumla yeniden yaz ve kayda başla
+            self.journal.compact(self.active_trades)
+            self.journal.open()
+            
+        except Exception as e:
+            logging.error(f"{self.lang.__('journal_recovery_error')}: {str(e)}")
+            self.journal.open()
+
     def start_closing_positions(self):
         """Manuel durdurma için pozisyonları kapat"""
+        results = self.close_all_positions()
+        return all(result['success'] for result in results.values())
+
+    def close_all_positions(self, progress_callback=None) -> Dict[str, dict]:
+        """
+        Tüm açık pozisyonları paralel satış emirleriyle kapat.
+        Eşzamanlı emir sayısı close_all_concurrency ile sınırlanır (rate limit).
+        progress_callback(symbol, result, done, total) her emir sonuçlandığında çağrılır.
+        Sembol bazında {'success', 'price', 'error', 'latency_ms'} özetini döndürür.
+        """
         with self._lock:
             self.is_stopping = True
-            positions_to_close = list(self.active_trades.items())
-            all_closed = True
-            
-            for symbol, position in positions_to_close:
-                try:
-                    if symbol not in self.active_trades:
-                        continue
-                    
-                    # Manuel kapatma için satış emri ver
+            # Monitor thread'in aynı pozisyonu satmaması için sembolleri sahiplen
+            symbols = [symbol for symbol in self.active_trades if symbol not in self._closing]
+            self._closing.update(symbols)
+        
+        results = {}
+        if not symbols:
+            return results
+        
+        workers = min(len(symbols), max(1, int(self.config.get('close_all_concurrency', 5))))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(self._emergency_close, symbol): symbol for symbol in symbols}
+            for done, future in enumerate(as_completed(futures), 1):
+                symbol = futures[future]
+                results[symbol] = future.result()
+                if progress_callback:
                     try:
-                        order = self.exchange.create_market_sell_order(
-                            symbol=symbol,
-                            amount=position['amount']
-                        )
-                        
-                        if order['status'] == 'closed':
-                            exit_price = float(order['price'])
-                            self._manual_close_position(symbol, exit_price)
-                        else:
-                            all_closed = False
-                            logging.error(f"{symbol} {self.lang.__('buy_order_failed')}: {order['status']}")
-                            
+                        progress_callback(symbol, results[symbol], done, len(symbols))
                     except Exception as e:
-                        all_closed = False
-                        logging.error(f"{self.lang.__('sell_order_error')} ({symbol}): {str(e)}")
-                        
-                except Exception as e:
-                    all_closed = False
-                    logging.error(f"{self.lang.__('position_close_error')} ({symbol}): {str(e)}")
-            
-            return all_closed
+                        logging.error(f"{self.lang.__('position_close_error')} ({symbol}): {str(e)}")
+        
+        return results
 
-    def _manual_close_position(self, symbol: str, exit_price: float):
-        """Manuel durdurma için pozisyon kayıtlarını güncelle"""
+    def _emergency_close(self, symbol: str) -> dict:
+        """Tek pozisyonu piyasa emriyle kapat (close_all_positions worker'ı)"""
+        result = {'success': False, 'price': None, 'error': None, 'latency_ms': 0.0}
+        started = time.perf_counter()
+        
         try:
-            if symbol not in self.active_trades:
-                return False
-                
-            position = self.active_trades[symbol]
+            position = self.active_trades.get(symbol)
+            if position is None:
+                result['success'] = True
+                return result
             
-            # Kâr/zarar hesapla
-            entry_price = position['entry_price']
-            amount = position['amount']
-            profit_usdt = (exit_price - entry_price) * amount
-            profit_percent = (exit_price - entry_price) / entry_price * 100
-            
-            # İşlem geçmişine ekle
-            trade_data = {
-                'timestamp': datetime.now(),
-                'symbol': symbol,
-                'type': 'sell',
-                'price': exit_price,
-                'amount': amount,
-                'total_usdt': exit_price * amount,
-                'profit': profit_usdt,
-                'profit_percentage': profit_percent,
-                'status': self.lang.__('manual_stop')
-            }
-            self.stats.add_trade_history(trade_data)
-            
-            # İstatistikleri güncelle
-            self.stats.total_trades += 1
-            if profit_usdt > 0:
-                self.stats.winning_trades += 1
+            if not self._cancel_protection_orders(symbol):
+                result['error'] = self.lang.__('oco_cancel_error')
+                return result
+            
+            # Manuel kapatma için satış emri ver
+            try:
+                order = self.exchange.create_market_sell_order(
+                    symbol=symbol,
+                    amount=self.market_rules.amount_to_step(symbol, position['amount'])
+                )
+            except Exception as e:
+                self.balance_ledger.mark_dirty()
+                result['error'] = str(e)
+                logging.error(f"{self.lang.__('sell_order_error')} ({symbol}): {str(e)}")
+                return result
+            
+            if order['status'] == 'closed':
+                self.balance_ledger.apply_order(symbol, order)
+                exit_price = float(order['price'])
+                self._manual_close_position(symbol, exit_price)
+                result.update({'success': True, 'price': exit_price})
             else:
-                self.stats.losing_trades += 1
+                result['error'] = order['status']
+                logging.error(f"{symbol} {self.lang.__('buy_order_failed')}: {order['status']}")
                 
-            self.stats.total_profit_usdt += profit_usdt
+        except Exception as e:
+            result['error'] = str(e)
+            logging.error(f"{self.lang.__('position_close_error')} ({symbol}): {str(e)}")
             
-            # Pozisyonu sil
-            del self.active_trades[symbol]
-            
-            # Satış logunu yazdır
-            logging.info(
-                f"{self.lang.__('manual_sale_completed')}:\n"
-                f"{self.lang.__('coin')}: {symbol}\n"
-                f"{self.lang.__('entry')}: {entry_price:.8f}\n"
-                f"{self.lang.__('exit')}: {exit_price:.8f}\n"
-                f"{self.lang.__('profit')}: {profit_usdt:.2f} USDT ({profit_percent:.2f}%)\n"
-                f"{self.lang.__('reason')}: {self.lang.__('manual_stop')}"
-            )
+        finally:
+            result['latency_ms'] = (time.perf_counter() - started) * 1000
+            with self._lock:
+                self._closing.discard(symbol)
+        
+        return result
+
+    def _manual_close_position(self, symbol: str, exit_price: float):
+        """Manuel durdurma için pozisyon kayıtlarını güncelle"""
+        try:
+            position = self.active_trades.get(symbol)
+            if position is None:
+                return False
             
+            self._record_sell(symbol, exit_price, position['amount'], 'manual_stop')
             return True
             
         except Exception as e:
@@ -157,10 +318,21 @@ class TradingEngine:
         self.is_stopping = True
         
         try:
-            # Thread'i durdur
-            if hasattr(self, 'trading_thread'):
+            # Thread'leri durdur
+            if getattr(self, 'trading_thread', None):
                 self.trading_thread.join(timeout=5)
                 self.trading_thread = None
+            if getattr(self, 'monitor_thread', None):
+                self.monitor_thread.join(timeout=5)
+                self.monitor_thread = None
+            self.order_executor.stop()
+            self.price_cache.stop_refresher()
+            self.journal.close()
+            self.ohlcv_cache.flush()
+            if self._owns_store:
+                self.store.close()
+            else:
+                self.store.flush()
                 
             # Exchange'i temizle
             if self.exchange:
@@ -183,9 +355,8 @@ class TradingEngine:
         """Ana trading döngüsü"""
         while self.is_running:
             try:                
-                # Eğer durdurma işlemi başladıysa, sadece pozisyon kontrolü yap
+                # Durdurma başladıysa tarama yapma, pozisyonları monitor thread takip eder
                 if self.is_stopping:
-                    self._check_positions()
                     time.sleep(1)
                     continue
                 
@@ -193,20 +364,40 @@ class TradingEngine:
                 opportunities = self._scan_markets()
                 
                 for opp in opportunities:
-                    if len(self.active_trades) >= self.config.get('max_positions', 3):
-                        break
-                        
                     if self._validate_trade(opp):
-                        self._execute_trade(opp)
-                        
-                # Açık pozisyonları kontrol et
-                self._check_positions()
+                        self.order_executor.submit(opp)
                 
             except Exception as e:
                 logging.error(f"{self.lang.__('trading_loop_error')}: {str(e)}")
             
             time.sleep(1)
 
+    def _position_monitor_loop(self):
+        """Açık pozisyonları taramadan bağımsız, sabit aralıkla takip et"""
+        interval = float(self.config.get('position_check_interval', 0.5))
+        reconcile_interval = float(self.config.get('oco_reconcile_interval', 5))
+        last_reconcile = 0.0
+        
+        while self.is_running:
+            started = time.monotonic()
+            try:
+                self._check_positions()
+                
+                # OCO korumalı pozisyonların dolumlarını daha seyrek uzlaştır
+                if started - last_reconcile >= reconcile_interval:
+                    last_reconcile = started
+                    self._reconcile_protection_orders()
+                
+                # Bakiye defterini yavaş zamanlayıcıyla veya sapmada borsayla eşitle
+                if self.balance_ledger.needs_reconcile():
+                    self.balance_ledger.reconcile()
+            except Exception as e:
+                logging.error(f"{self.lang.__('position_monitor_error')}: {str(e)}")
+            
+            # Kontrol süresini aralıktan düş, döngü kaymasın
+            elapsed = time.monotonic() - started
+            time.sleep(max(0.0, interval - elapsed))
+
     def _scan_markets(self):        
         if self.is_stopping:
             return []
@@ -230,48 +421,74 @@ class TradingEngine:
                         not market.get('info', {}).get('isSpotTradingAllowed', False) is False)
                 }
                 self._last_market_update = current_time
+                
+                # Emir boyutlandırma için market kısıtlarını önceden hesapla
+                self.market_rules.build(
+                    self.markets_cache,
+                    getattr(self.exchange, 'precisionMode', TICK_SIZE)
+                )
 
             # Sadece aktif marketleri tara
             total_markets = len(self.markets_cache)
             scanned_count = 0
+            self.scan_history.begin_scan()
             
             for i, (symbol, market) in enumerate(self.markets_cache.items(), 1):
                 if not self.is_running:  # Erken çıkış kontrolü
                     return []
+
+                # Atlanan semboller de ilerlemeye sayılır, yoksa ilerleme toplama ulaşmaz
+                scanned_count += 1
+
+                # Karantinadaki semboller için istek atılmaz
+                if self.negative_cache.is_blocked(symbol):
+                    continue
                     
+                trace_id = None
                 try:
-                    scanned_count += 1
                     scan_count += 1
                     
                     if (i % 10 == 0):  # Her 10 coinde bir ilerleme bilgisi
                         logging.info(f"{self.lang.__('progress')}: {i}/{total_markets} {self.lang.__('coins_analyzed')}")
                     
-                    # OHLCV verileri al
-                    ohlcv = self.exchange.fetch_ohlcv(
-                        symbol,
-                        self.config.get('timeframe', '15m'),
-                        limit=100
+                    # OHLCV verileri al (cache süresi dolmadıysa API çağrısı yapılmaz)
+                    timeframe = self.config.get('timeframe', '15m')
+                    ohlcv = self.ohlcv_cache.get_or_load_for_timeframe(
+                        symbol, timeframe,
+                        lambda: self.exchange.fetch_ohlcv(symbol, timeframe, limit=100)
                     )
                     
-                    if not ohlcv or len(ohlcv) < 100:
+                    if ohlcv is None or len(ohlcv) < 100:
                         continue
+                    
+                    # Son mumun açılışı = önceki mumun kapanışı
+                    trace_id = self.latency.start_trace('entry', symbol)
+                    self.latency.mark(trace_id, 'candle_close', ohlcv[-1][0] / 1000)
                         
                     df = pd.DataFrame(
                         ohlcv,
                         columns=['timestamp', 'open', 'high', 'low', 'close', 'volume']
                     )
                     
-                    ticker = self.exchange.fetch_ticker(symbol)
+                    ticker = self.price_cache.get_or_load(symbol, lambda: self.exchange.fetch_ticker(symbol))
+                    self.latency.mark(trace_id, 'fetch_done')
+                    self.negative_cache.record_success(symbol)
                     
-                    # MarketAnalyzer sınıfını kullan
-                    analysis_result = self.analyzer.analyze_market(df)
+                    # MarketAnalyzer sınıfını kullan (aynı mum verisi için sonuç tekrar hesaplanmaz)
+                    analysis_result = self.indicator_cache.get_or_load_indicator(
+                        symbol, f"analysis_{timeframe}_{ohlcv[-1][0]}_{ohlcv[-1][4]}",
+                        lambda: self.analyzer.analyze_market(df)
+                    )
+                    self.latency.mark(trace_id, 'analysis_done')
                     
                     if not analysis_result:
+                        self.latency.finish(trace_id)
                         continue
                     
                     # Sonuçları sakla
                     scan_result = {
                         'symbol': symbol,
+                        'timeframe': timeframe,
                         'price': float(df['close'].iloc[-1]),
                         'change_24h': ticker.get('percentage', 0),
                         'rsi': analysis_result['indicators']['rsi'],
@@ -281,6 +498,10 @@ class TradingEngine:
                         'timestamp': datetime.now()
                     }
                     scan_results.append(scan_result)
+                    self.scan_history.record(
+                        symbol, scan_result['price'], scan_result['score'], scan_result['rsi'],
+                        scan_result['change_24h'], scan_result['volume']
+                    )
                     
                     # UI güncellemesi - ayarlara göre kontrol et
                     if self.scan_callback and self.config.get('live_analysis', False):
@@ -291,30 +512,46 @@ class TradingEngine:
                     # Minimum hacim kontrolü
                     usdt_volume = float(df['volume'].iloc[-1]) * float(df['close'].iloc[-1])
                     if usdt_volume < self.analyzer.min_volume:
+                        self.latency.finish(trace_id)
                         continue
                     
-                    if analysis_result['score'] >= self.config.get('min_score', 65):
+                    if analysis_result['score'] < self.config.get('min_score', 65):
+                        self.latency.finish(trace_id)
+                    else:
                         opportunity = {
                             'symbol': symbol,
                             'price': float(df['close'].iloc[-1]),
                             'volume': usdt_volume,
-                            'analysis': analysis_result
+                            'analysis': analysis_result,
+                            'trace_id': trace_id
                         }
                         logging.info(f"{self.lang.__('opportunity_found')} - {symbol} - {self.lang.__('score')}: {analysis_result['score']}")
                         total_opportunities += 1
                         
-                        # Fırsat bulunur bulunmaz alım kontrolü yap
-                        if len(self.active_trades) < self.config.get('max_positions', 3):
-                            if self._validate_trade(opportunity):
-                                self._execute_trade(opportunity)
+                        # Fırsat bulunur bulunmaz alım niyetini kuyruğa bırak
+                        self.latency.mark(trace_id, 'intent_queued')
+                        if not (self._validate_trade(opportunity) and self.order_executor.submit(opportunity)):
+                            self.latency.discard(trace_id)
                         
                 except Exception as e:
-                    if 'Market is closed' not in str(e):
+                    # Yarım kalan iz açık izler arasında birikmesin
+                    self.latency.discard(trace_id)
+                    error_class = self._classify_scan_error(e)
+                    if error_class != 'market_closed':
                         logging.error(f"{self.lang.__('scan_error')} ({symbol}): {str(e)}")
+                    if error_class:
+                        delay = self.negative_cache.record_failure(symbol, error_class, str(e))
+                        logging.debug(f"{self.lang.__('symbol_quarantined')}: {symbol} ({error_class}, {delay:.0f}s)")
                     continue
                 
+            self.scan_history.end_scan()
+            
             if self.scan_callback:
                 self.scan_callback(scan_results, total_markets, total_markets)
+            
+            # Tarama anlık görüntüsünü geçmişe yaz
+            if self.config.get('store_scans', True):
+                self.store.record_scans(scan_results)
                         
             logging.info(f"{self.lang.__('scan_completed')}. {total_opportunities} {self.lang.__('opportunities_found')}.")
             return opportunities
@@ -323,6 +560,23 @@ class TradingEngine:
             logging.error(f"{self.lang.__('market_scan_error')}: {str(e)}")
             return []
 
+    def _classify_scan_error(self, error: Exception) -> Optional[str]:
+        """
+        Tarama hatasının karantina sınıfı (None = sembolden kaynaklanmıyor).
+        Sadece borsanın sembol için döndürdüğü hatalar karantinaya alınır; analiz,
+        kayıt veya UI geri çağrısındaki hatalar sembolü engellememeli.
+        """
+        if 'Market is closed' in str(error):
+            return 'market_closed'
+        if isinstance(error, ccxt.BadSymbol):
+            return 'bad_symbol'
+        # Ağ ve istek limiti hataları tüm sembolleri etkiler, ccxt kendi bekler
+        if isinstance(error, ccxt.NetworkError):
+            return None
+        if isinstance(error, ccxt.ExchangeError):
+            return 'exchange'
+        return None
+
     def _validate_trade(self, opportunity: dict) -> bool:
         """İşlem kurallarını kontrol et"""
         try:
@@ -347,6 +601,18 @@ class TradingEngine:
             logging.error(f"{self.lang.__('validation_error')}: {str(e)}")
             return False
 
+    def _execute_intent(self, opportunity: dict):
+        """Kuyruktan gelen alım niyetini yürüt (emir yürütücü thread'inde çalışır)"""
+        trace_id = opportunity.get('trace_id')
+        try:
+            # Niyet kuyrukta beklerken pozisyon açılmış olabilir
+            if self.is_stopping or not self._validate_trade(opportunity):
+                self.latency.discard(trace_id)
+                return
+            self._execute_trade(opportunity)
+        finally:
+            self.latency.finish(trace_id)
+
     def _execute_trade(self, opportunity: dict):
         if self.is_stopping:
             return []
@@ -357,46 +623,64 @@ class TradingEngine:
             
             # İşlem miktarını hesapla
             target_usdt = float(self.config.get('max_usdt', 10))
-            available_usdt = float(self.exchange.fetch_balance()['USDT']['free'])
+            available_usdt = self.balance_ledger.get_free('USDT')
             usdt_amount = min(target_usdt, available_usdt)
 
             if usdt_amount < target_usdt:
                 logging.warning(f"{self.lang.__('insufficient_balance')}. "
                             f"{self.lang.__('target')}: {target_usdt}, {self.lang.__('available')}: {usdt_amount}")
             
+            # Lot adımı, min/max miktar ve min notional yerel olarak uygulanır
             price = opportunity['price']
-            amount = usdt_amount / price
+            amount = self.market_rules.size_order(symbol, usdt_amount, price)
+            
+            order_error = self.market_rules.check_order(symbol, amount, price)
+            if order_error:
+                logging.warning(f"{self.lang.__(order_error)} ({symbol}): {amount:.8f} @ {price:.8f}")
+                return
             
             # Market emri ver
+            self.latency.mark(opportunity.get('trace_id'), 'order_sent')
             order = self.exchange.create_market_buy_order(symbol, amount)
             
             if order['status'] == 'closed':
+                self.latency.mark(opportunity.get('trace_id'), 'order_filled')
+                self.balance_ledger.apply_order(symbol, order)
+                
+                # Elde kalan miktar: komisyon coin'den kesildiyse dolumdan düşülür
+                amount = self._net_filled_amount(symbol, order)
+                
                 # Stop loss ve take profit hesapla
                 entry_price = float(order['price'])
                 stop_loss = entry_price * (1 - self.config.get('stop_loss', 3) / 100)
                 take_profit = entry_price * (1 + self.config.get('take_profit', 2) / 100)
                 
                 # İşlem geçmişine ekle
-                trade_data = {
-                    'timestamp': datetime.now(),
-                    'symbol': symbol,
-                    'type': 'buy',
-                    'price': entry_price,
-                    'amount': amount,
-                    'total_usdt': entry_price * amount,
-                    'status': self.lang.__('open_position')
-                }
-                self.stats.add_trade_history(trade_data)
+                with self._lock:
+                    self.store.record_trade('buy', symbol, entry_price, amount, 'open_position')
+                
+                # Borsa tarafında SL/TP koruması (desteklenmiyorsa polling ile takip edilir)
+                protection = None
+                if self.config.get('use_oco', False):
+                    protection = self._place_protection_orders(
+                        symbol, amount, stop_loss, take_profit
+                    )
+                    if protection:
+                        self.balance_ledger.reserve(symbol.split('/')[0], protection['amount'])
                 
                 # Pozisyonu kaydet
-                self.active_trades[symbol] = {
-                    'entry_price': entry_price,
-                    'amount': float(order['amount']),
-                    'stop_loss': stop_loss,
-                    'take_profit': take_profit,
-                    'entry_time': datetime.now(),
-                    'analysis_score': opportunity['analysis']['score']
-                }
+                with self._lock:
+                    self.active_trades[symbol] = {
+                        'entry_price': entry_price,
+                        'amount': amount,
+                        'stop_loss': stop_loss,
+                        'take_profit': take_profit,
+                        'entry_time': datetime.now(),
+                        'analysis_score': opportunity['analysis']['score'],
+                        'protection': protection
+                    }
+                    self.journal.record_open(symbol, self.active_trades[symbol])
+                    self.store.record_position_open(symbol, self.active_trades[symbol])
                 
                 logging.info(
                     f"{self.lang.__('buy_completed')}:\n"
@@ -409,26 +693,127 @@ class TradingEngine:
                 )
                 
         except Exception as e:
+            if isinstance(e, ccxt.InsufficientFunds):
+                self.balance_ledger.mark_dirty()
             logging.error(f"{self.lang.__('buy_error')} ({symbol}): {str(e)}")
 
+    def _net_filled_amount(self, symbol: str, order: dict) -> float:
+        """
+        Alım emrinden sonra elde kalan satılabilir miktar.
+        BNB ile ödenmeyen komisyon Binance'te alınan coin'den kesilir; bu kesinti
+        dolan miktardan düşülür ve sonuç lot adımına aşağı yuvarlanır.
+        """
+        base = symbol.split('/')[0]
+        amount = float(order.get('filled') or order['amount'])
+        fees = order.get('fees') or ([order['fee']] if order.get('fee') else [])
+        for fee in fees:
+            if fee and fee.get('currency') == base and fee.get('cost'):
+                amount -= float(fee['cost'])
+        return self.market_rules.amount_to_step(symbol, amount)
+
+    def _fetch_tickers(self, symbols: list) -> Dict[str, dict]:
+        """Sembollerin ticker'larını mümkünse tek istekte al"""
+        if self.exchange.has.get('fetchTickers'):
+            return self.exchange.fetch_tickers(symbols)
+        return {symbol: self.exchange.fetch_ticker(symbol) for symbol in symbols}
+
+    def _fetch_prices(self, symbols: list) -> Dict[str, float]:
+        """Sembollerin son fiyatlarını mümkünse tek istekte al"""
+        tickers = self._fetch_tickers(symbols)
+        
+        # Taze fiyatlar cache'e yazılır, UI ve tarama tekrar istek atmaz
+        self.price_cache.set_many({symbol: ticker for symbol, ticker in tickers.items() if ticker})
+        
+        return {
+            symbol: float(ticker['last'])
+            for symbol, ticker in tickers.items()
+            if ticker and ticker.get('last') is not None
+        }
+
+    def get_prices(self, symbols: list, max_age: Optional[float] = None) -> Dict[str, float]:
+        """
+        Son fiyatlar: max_age içindeki cache değerleri beklemeden kullanılır,
+        eksik veya fazla bayat olanlar tek istekte borsadan alınır.
+        """
+        cached = self.price_cache.get_many_with_age(symbols, max_age)
+        prices = {
+            symbol: float(ticker['last'])
+            for symbol, (ticker, _) in cached.items()
+            if ticker.get('last') is not None
+        }
+        missing = [symbol for symbol in symbols if symbol not in prices]
+        if missing:
+            prices.update(self._fetch_prices(missing))
+        return prices
+
+    def get_ticker(self, symbol: str, max_age: Optional[float] = None) -> dict:
+        """Ticker'ı cache'ten al, yoksa veya max_age'den eskiyse borsadan çek"""
+        return self.price_cache.get_or_load(
+            symbol, lambda: self.exchange.fetch_ticker(symbol), max_age=max_age
+        )
+
+    def get_cached_price(self, symbol: str, max_age: Optional[float] = None):
+        """
+        (fiyat, yaş) çiftini hiç beklemeden döndür; uygun değer yoksa (None, yaş).
+        Bayat veya eksik fiyat arka planda yenilenir.
+        """
+        ticker, age = self.price_cache.get_with_age(symbol, max_age)
+        if not ticker or ticker.get('last') is None:
+            return None, age
+        return float(ticker['last']), age
+
+    def get_quarantined(self) -> List[dict]:
+        """Karantinadaki semboller (hata sınıfı, hata sayısı, kalan süre)"""
+        return self.negative_cache.quarantined()
+
+    def release_symbol(self, symbol: str) -> None:
+        """Sembolü karantinadan çıkar, sonraki taramada tekrar denenir"""
+        self.negative_cache.release(symbol)
+
+    def get_cache_stats(self) -> Dict[str, dict]:
+        """Cache isabet/ıska/atılma sayaçları"""
+        return {
+            'price': self.price_cache.get_stats(),
+            'ohlcv': self.ohlcv_cache.get_stats(),
+            'indicator': self.indicator_cache.get_stats(),
+            'negative': self.negative_cache.get_stats()
+        }
+
     def _check_positions(self):
         """Açık pozisyonları kontrol et"""
         try:
-            for symbol in list(self.active_trades.keys()):
-                position = self.active_trades[symbol]
-                
+            with self._lock:
+                positions = {
+                    symbol: (position['stop_loss'], position['take_profit'])
+                    for symbol, position in self.active_trades.items()
+                    if symbol not in self._closing and not position.get('protection')
+                }
+            
+            if not positions:
+                return
+            
+            # SL/TP kararı için sadece taze fiyat kabul edilir
+            prices = self.get_prices(
+                list(positions), max_age=float(self.config.get('position_price_max_age', 0.5))
+            )
+            
+            for symbol, (stop_loss, take_profit) in positions.items():
                 try:
-                    current_price = float(self.exchange.fetch_ticker(symbol)['last'])
-                    
-                    # Stop loss kontrolü
-                    if current_price <= position['stop_loss']:
-                        self._close_position(symbol, current_price, "STOP-LOSS")
+                    current_price = prices.get(symbol)
+                    if current_price is None:
                         continue
-                        
-                    # Take profit kontrolü
-                    if current_price >= position['take_profit']:
-                        self._close_position(symbol, current_price, "TAKE-PROFIT")
+                    
+                    if current_price <= stop_loss:
+                        reason = "STOP-LOSS"
+                    elif current_price >= take_profit:
+                        reason = "TAKE-PROFIT"
+                    else:
                         continue
+                    
+                    # Stop loss / take profit tetiklendi
+                    trace_id = self.latency.start_trace('exit', symbol)
+                    self.latency.mark(trace_id, 'trigger')
+                    self._close_position(symbol, current_price, reason, trace_id=trace_id)
                         
                 except Exception as e:
                     logging.error(f"{self.lang.__('position_check_error')} ({symbol}): {str(e)}")
@@ -436,84 +821,61 @@ class TradingEngine:
         except Exception as e:
             logging.error(f"{self.lang.__('position_tracking_error')}: {str(e)}")
 
-    def _close_position(self, symbol: str, current_price: float, reason: str):
+    def _close_position(self, symbol: str, current_price: float, reason: str,
+                        trace_id: Optional[str] = None):
         """Pozisyonu kapat"""
-        try:
+        with self._lock:
             if symbol not in self.active_trades:
                 logging.error(f"{self.lang.__('position_not_found')}: {symbol}")
+                self.latency.discard(trace_id)
                 return False
-                
+            if symbol in self._closing:
+                self.latency.discard(trace_id)
+                return False
+            self._closing.add(symbol)
+            
+        try:
             position = self.active_trades[symbol]
             
-            # Bakiye kontrolü
+            # OCO emri varsa önce iptal et, kilitli bakiye serbest kalsın
+            if not self._cancel_protection_orders(symbol):
+                return False
+            
+            # Bakiye kontrolü defterden yapılır. Pozisyon net miktarı tuttuğu için defter
+            # normalde yeterlidir; satılabilir lotu düşüren bir eksik gerçek sapmadır ve
+            # sadece o durumda borsayla eşitlenir
             coin = symbol.split('/')[0]
-            balance = self.exchange.fetch_balance()
+            available_amount = self.balance_ledger.get_free(coin)
             
-            if coin not in balance or 'free' not in balance[coin]:
-                logging.error(f"{self.lang.__('coin_balance_error')}: {coin}")
-                return False
-                
-            available_amount = float(balance[coin]['free'])
+            amount_to_step = self.market_rules.amount_to_step
+            position_amount = amount_to_step(symbol, position['amount'])
+            if amount_to_step(symbol, available_amount) < position_amount:
+                self.balance_ledger.reconcile()
+                available_amount = self.balance_ledger.get_free(coin)
             
-            if available_amount < position['amount']:
+            # Lot adımına uymayan miktar reddedilir
+            amount = amount_to_step(symbol, min(position['amount'], available_amount))
+            if amount < position_amount:
                 logging.warning(f"{self.lang.__('amount_correction')}: {available_amount} < {position['amount']}")
-                position['amount'] = available_amount
+            if amount != position['amount']:
+                position['amount'] = amount
+                self.journal.record_update(symbol, amount=amount)
             
             if available_amount <= 0:
                 logging.error(f"{self.lang.__('no_balance_to_sell')}: {coin}")
                 return False
                 
             # Market satış emri
+            self.latency.mark(trace_id, 'order_sent')
             order = self.exchange.create_market_sell_order(
                 symbol=symbol,
                 amount=position['amount']
             )
             
             if order['status'] == 'closed':
-                # Kâr/zarar hesapla...
-                entry_price = position['entry_price']
-                exit_price = float(order['price'])
-                amount = position['amount']
-                
-                profit_usdt = (exit_price - entry_price) * amount
-                profit_percent = (exit_price - entry_price) / entry_price * 100
-                
-                # İşlem geçmişine ekle
-                trade_data = {
-                    'timestamp': datetime.now(),
-                    'symbol': symbol,
-                    'type': 'sell',
-                    'price': exit_price,
-                    'amount': amount,
-                    'total_usdt': exit_price * amount,
-                    'profit': profit_usdt,
-                    'profit_percentage': profit_percent,
-                    'status': reason
-                }
-                self.stats.add_trade_history(trade_data)
-                
-                # İstatistikleri güncelle...
-                self.stats.total_trades += 1
-                if profit_usdt > 0:
-                    self.stats.winning_trades += 1
-                else:
-                    self.stats.losing_trades += 1
-                    
-                self.stats.total_profit_usdt += profit_usdt
-                
-                # Pozisyonu sil
-                del self.active_trades[symbol]
-                
-                # Satış logunu yazdır
-                logging.info(
-                    f"{self.lang.__('sale_completed')}:\n"
-                    f"{self.lang.__('coin')}: {symbol}\n"
-                    f"{self.lang.__('entry')}: {entry_price:.8f}\n"
-                    f"{self.lang.__('exit')}: {exit_price:.8f}\n"
-                    f"{self.lang.__('profit')}: {profit_usdt:.2f} USDT ({profit_percent:.2f}%)\n"
-                    f"{self.lang.__('reason')}: {reason}"
-                )
-                
+                self.latency.mark(trace_id, 'order_filled')
+                self.balance_ledger.apply_order(symbol, order)
+                self._record_sell(symbol, float(order['price']), position['amount'], reason)
                 return True
                 
             return False
@@ -521,7 +883,172 @@ class TradingEngine:
         except Exception as e:
             logging.error(f"{self.lang.__('sell_error')} ({symbol}): {str(e)}")
             return False
+            
+        finally:
+            self.latency.finish(trace_id)
+            with self._lock:
+                self._closing.discard(symbol)
     
+    def _record_sell(self, symbol: str, exit_price: float, amount: float, reason: str):
+        """Gerçekleşen satışı geçmişe ve istatistiklere işle, pozisyonu sil"""
+        position = self.active_trades[symbol]
+        
+        # Kâr/zarar hesapla...
+        entry_price = position['entry_price']
+        profit_usdt = (exit_price - entry_price) * amount
+        profit_percent = (exit_price - entry_price) / entry_price * 100
+        
+        # Paralel kapatmalarda istatistikler aynı kilit altında güncellenir
+        with self._lock:
+            # İşlem geçmişine ve istatistiklere ekle
+            self.stats.record_close(symbol, profit_usdt, profit_percent)
+            self.store.record_trade('sell', symbol, exit_price, amount, reason,
+                                    profit_usdt, profit_percent)
+            
+            # Pozisyonu sil
+            self.active_trades.pop(symbol, None)
+            self.journal.record_close(symbol, exit_price, reason)
+            self.store.record_position_close(symbol, exit_price, reason)
+        
+        # Satış logunu yazdır
+        title = 'manual_sale_completed' if reason == 'manual_stop' else 'sale_completed'
+        logging.info(
+            f"{self.lang.__(title)}:\n"
+            f"{self.lang.__('coin')}: {symbol}\n"
+            f"{self.lang.__('entry')}: {entry_price:.8f}\n"
+            f"{self.lang.__('exit')}: {exit_price:.8f}\n"
+            f"{self.lang.__('profit')}: {profit_usdt:.2f} USDT ({profit_percent:.2f}%)\n"
+            f"{self.lang.__('reason')}: {self.lang.__(reason)}"
+        )
+
+    def _place_protection_orders(self, symbol: str, amount: float,
+                                 stop_loss: float, take_profit: float) -> Optional[dict]:
+        """
+        Alım dolduktan hemen sonra borsa tarafında OCO (take-profit limit + stop-limit) emri ver.
+        OCO desteklenmiyorsa veya emir reddedilirse None döner ve pozisyon polling ile takip edilir.
+        """
+        try:
+            amount = self.market_rules.amount_to_step(symbol, amount)
+            stop_limit = self.market_rules.price_to_step(
+                symbol, stop_loss * (1 - self.config.get('oco_stop_limit_gap', 0.2) / 100)
+            )
+            stop_loss = self.market_rules.price_to_step(symbol, stop_loss)
+            take_profit = self.market_rules.price_to_step(symbol, take_profit)
+            
+            if hasattr(self.exchange, 'create_oco_order'):
+                protection = self.exchange.create_oco_order(
+                    symbol, 'sell', amount, take_profit, stop_loss, stop_limit
+                )
+            elif hasattr(self.exchange, 'private_post_orderlist_oco'):
+                protection = self._create_binance_oco(symbol, amount, stop_loss, stop_limit, take_profit)
+            else:
+                return None
+            
+            protection['amount'] = amount
+            logging.info(f"{self.lang.__('oco_order_placed')}: {symbol} (#{protection['id']})")
+            return protection
+            
+        except Exception as e:
+            logging.warning(f"{self.lang.__('oco_order_error')} ({symbol}): {str(e)}")
+            return None
+
+    def _create_binance_oco(self, symbol: str, amount: float, stop_loss: float,
+                            stop_limit: float, take_profit: float) -> dict:
+        """Binance orderList/oco uç noktası ile OCO satış emri ver"""
+        response = self.exchange.private_post_orderlist_oco({
+            'symbol': self.exchange.market(symbol)['id'],
+            'side': 'SELL',
+            'quantity': self.exchange.amount_to_precision(symbol, amount),
+            'aboveType': 'LIMIT_MAKER',
+            'abovePrice': self.exchange.price_to_precision(symbol, take_profit),
+            'belowType': 'STOP_LOSS_LIMIT',
+            'belowStopPrice': self.exchange.price_to_precision(symbol, stop_loss),
+            'belowPrice': self.exchange.price_to_precision(symbol, stop_limit),
+            'belowTimeInForce': 'GTC'
+        })
+        legs = {report['type']: str(report['orderId']) for report in response['orderReports']}
+        
+        return {
+            'id': str(response['orderListId']),
+            'symbol': symbol,
+            'take_profit_id': legs['LIMIT_MAKER'],
+            'stop_loss_id': legs['STOP_LOSS_LIMIT']
+        }
+
+    def _cancel_protection_orders(self, symbol: str) -> bool:
+        """Pozisyonun OCO emrini iptal et (elle satıştan önce bakiyeyi serbest bırakır)"""
+        position = self.active_trades.get(symbol)
+        protection = position.get('protection') if position else None
+        if not protection:
+            return True
+        
+        try:
+            if hasattr(self.exchange, 'cancel_oco_order'):
+                self.exchange.cancel_oco_order(protection['id'], symbol)
+            else:
+                self.exchange.private_delete_orderlist({
+                    'symbol': self.exchange.market(symbol)['id'],
+                    'orderListId': protection['id']
+                })
+            position['protection'] = None
+            self.journal.record_update(symbol, protection=None)
+            self.balance_ledger.release(symbol.split('/')[0], protection['amount'])
+            return True
+            
+        except Exception as e:
+            logging.error(f"{self.lang.__('oco_cancel_error')} ({symbol}): {str(e)}")
+            return False
+
+    def _reconcile_protection_orders(self):
+        """
+        OCO korumalı pozisyonların dolumlarını toplu kontrol et.
+        Tek bir açık emir sorgusu yapılır, sadece kaybolan emirler tek tek sorgulanır.
+        """
+        try:
+            with self._lock:
+                protected = {
+                    symbol: position['protection']
+                    for symbol, position in self.active_trades.items()
+                    if position.get('protection') and symbol not in self._closing
+                }
+            
+            if not protected:
+                return
+            
+            open_ids = {str(order['id']) for order in self.exchange.fetch_open_orders()}
+            
+            for symbol, protection in protected.items():
+                legs = (
+                    (protection['take_profit_id'], "TAKE-PROFIT"),
+                    (protection['stop_loss_id'], "STOP-LOSS")
+                )
+                if any(order_id in open_ids for order_id, _ in legs):
+                    continue
+                
+                try:
+                    for order_id, reason in legs:
+                        order = self.exchange.fetch_order(order_id, symbol)
+                        if order['status'] == 'closed' and order.get('filled'):
+                            self.balance_ledger.apply_order(symbol, order, reserved=True)
+                            exit_price = float(order.get('average') or order['price'])
+                            self._record_sell(symbol, exit_price, float(order['filled']), reason)
+                            break
+                    else:
+                        # OCO borsada iptal edilmiş, kilitli miktarı serbest bırak ve polling ile takibe dön
+                        with self._lock:
+                            position = self.active_trades.get(symbol)
+                            if position and position.get('protection') is protection:
+                                self.balance_ledger.release(symbol.split('/')[0], protection['amount'])
+                                position['protection'] = None
+                                self.journal.record_update(symbol, protection=None)
+                        logging.warning(f"{self.lang.__('oco_order_cancelled')}: {symbol}")
+                        
+                except Exception as e:
+                    logging.error(f"{self.lang.__('position_check_error')} ({symbol}): {str(e)}")
+                    
+        except Exception as e:
+            logging.error(f"{self.lang.__('position_tracking_error')}: {str(e)}")
+
     def _get_signal(self, score: float) -> str:
         """Skora göre sinyal üret - Dil desteği için analyzer'ı kullan"""
         if score >= 85:
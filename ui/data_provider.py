@@ -0,0 +1,223 @@
+from PyQt6.QtCore import QThread, pyqtSignal
+from types import MappingProxyType
+from typing import FrozenSet, Iterable, Mapping, NamedTuple, Optional, Tuple
+import logging
+import threading
+import time
+
+from core.stats import StatsSnapshot
+from core.store import HistoryStore
+from utils.language_manager import LanguageManager
+
+class TradeRow(NamedTuple):
+    """Aktif işlem tablosunun tek satırı"""
+    symbol: str
+    entry_price: float
+    current_price: Optional[float]
+    amount: float
+    profit_percent: Optional[float]
+    stop_loss: float
+    take_profit: float
+
+class HistoryDelta(NamedTuple):
+    """Geçmiş tablosuna son görüntüden bu yana eklenecek ve güncellenecek işlemler"""
+    added: Tuple[Mapping, ...] = ()
+    updated: Tuple[Mapping, ...] = ()
+    older: Optional[Tuple[Mapping, ...]] = None
+    has_more: bool = True
+    # Depo değişti: tablo temizlenip bu farkla baştan doldurulur
+    reset: bool = False
+
+class UISnapshot(NamedTuple):
+    """Arka planda toplanıp GUI thread'ine gönderilen değişmez UI görüntüsü"""
+    timestamp: float
+    engine_running: bool = False
+    usdt_balance: Optional[float] = None
+    stats: StatsSnapshot = StatsSnapshot()
+    active_count: int = 0
+    trades: Tuple[TradeRow, ...] = ()
+    latency: Optional[Tuple[Mapping, ...]] = None
+    quarantined: Optional[Tuple[Mapping, ...]] = None
+    history: Optional[HistoryDelta] = None
+
+def _freeze(rows: Iterable[dict]) -> Tuple[Mapping, ...]:
+    return tuple(MappingProxyType(dict(row)) for row in rows)
+
+class DataProvider(QThread):
+    """
+    UI verilerini (bakiye, fiyatlar, istatistikler, geçmiş) GUI thread'i dışında toplar.
+    Borsa ve veritabanı çağrıları bu thread'de yapılır, sonuç değişmez bir UISnapshot
+    olarak sinyalle gönderilir; GUI thread'i sadece çizim yapar.
+    Pahalı bölümler (gecikme, karantina) sadece ilgili sekme görünürken toplanır.
+    Geçmiş artımlı okunur: en büyük işlem kimliğinden (high-water mark) sonrakiler eklenir,
+    açık pozisyon işlemlerinin durumu izlenir, eski işlemler sadece istendiğinde sayfa sayfa gelir.
+    """
+    snapshot_ready = pyqtSignal(object)
+
+    def __init__(self, store: HistoryStore, interval: float = 1.0,
+                 price_max_age: float = 5, history_page_size: int = 100, lang_manager=None, parent=None):
+        super().__init__(parent)
+        self.lang = lang_manager or LanguageManager()
+        self.store = store
+        self.interval = interval
+        self.price_max_age = price_max_age
+        self.history_page_size = history_page_size
+
+        # GUI thread'i tarafından referans değişimiyle güncellenir
+        self.engine = None
+        self.sections: FrozenSet[str] = frozenset()
+        self._next_store: Optional[HistoryStore] = None
+
+        # Geçmiş okuma durumu (sadece bu thread'de değişir)
+        self._history_high = None
+        self._history_low = None
+        self._history_open = set()
+        self._history_more = True
+        self._older_requested = False
+
+        self._wakeup = threading.Event()
+        self._running = False
+
+    def set_engine(self, engine) -> None:
+        self.engine = engine
+        self.request_update()
+
+    def set_store(self, store: HistoryStore) -> None:
+        """Geçmiş deposunu değiştir (simülasyon/gerçek); değişim bu thread'de uygulanır"""
+        self._next_store = store
+        self.request_update()
+
+    def set_sections(self, sections: Iterable[str]) -> None:
+        """Toplanacak isteğe bağlı bölümler ('latency', 'quarantine')"""
+        self.sections = frozenset(sections)
+        self.request_update()
+
+    def request_older_history(self) -> None:
+        """Bir sonraki görüntüde eski işlemlerden bir sayfa daha oku"""
+        self._older_requested = True
+        self.request_update()
+
+    def request_update(self) -> None:
+        """Aralığı beklemeden yeni görüntü topla"""
+        self._wakeup.set()
+
+    def stop(self) -> None:
+        """Thread'i durdur ve bitmesini bekle"""
+        self._running = False
+        self._wakeup.set()
+        self.wait(5000)
+
+    def run(self) -> None:
+        self._running = True
+        while self._running:
+            try:
+                self.snapshot_ready.emit(self.collect())
+            except Exception as e:
+                logging.error(f"{self.lang.__('ui_collect_error')}: {str(e)}")
+            self._wakeup.wait(self.interval)
+            self._wakeup.clear()
+
+    def collect(self) -> UISnapshot:
+        """Güncel UI görüntüsünü topla"""
+        engine = self.engine
+        sections = self.sections
+        snapshot = UISnapshot(timestamp=time.time())
+
+        if engine and engine.is_running and engine.exchange:
+            snapshot = snapshot._replace(engine_running=True, **self._collect_engine(engine, sections))
+
+        history = self._collect_history()
+        if history:
+            snapshot = snapshot._replace(history=history)
+
+        return snapshot
+
+    def _collect_engine(self, engine, sections: FrozenSet[str]) -> dict:
+        values = {}
+        try:
+            values['usdt_balance'] = engine.balance_ledger.get_free('USDT')
+        except Exception as e:
+            logging.error(f"{engine.lang.__('balance_update_error')}: {str(e)}")
+
+        # İstatistik görüntüsü kilitsiz okunur
+        values['stats'] = engine.stats.snapshot
+
+        trades = dict(engine.active_trades)
+        values['active_count'] = len(trades)
+        try:
+            # Bayat veya eksik fiyatlar bu thread'de borsadan alınır
+            prices = engine.get_prices(list(trades), max_age=self.price_max_age) if trades else {}
+        except Exception as e:
+            logging.error(f"{self.lang.__('price_update_error')}: {str(e)}")
+            prices = {}
+
+        rows = []
+        for symbol, trade in trades.items():
+            price = prices.get(symbol)
+            rows.append(TradeRow(
+                symbol=symbol,
+                entry_price=trade['entry_price'],
+                current_price=price,
+                amount=trade['amount'],
+                profit_percent=(price - trade['entry_price']) / trade['entry_price'] * 100
+                if price is not None else None,
+                stop_loss=trade['stop_loss'],
+                take_profit=trade['take_profit']
+            ))
+        values['trades'] = tuple(rows)
+
+        if 'latency' in sections:
+            values['latency'] = _freeze(engine.latency.summary())
+        if 'quarantine' in sections:
+            values['quarantined'] = _freeze(engine.get_quarantined())
+        return values
+
+    def _track(self, trades) -> None:
+        for trade in trades:
+            if trade['status'] == 'open_position':
+                self._history_open.add(trade['id'])
+        ids = [trade['id'] for trade in trades]
+        if ids:
+            self._history_high = max(ids + [self._history_high or 0])
+            self._history_low = min(ids + [self._history_low or ids[0]])
+
+    def _collect_history(self) -> Optional[HistoryDelta]:
+        """Son görüntüden bu yana geçmişte değişenleri oku (değişiklik yoksa None)"""
+        store, self._next_store = self._next_store, None
+        if store is not None and store is not self.store:
+            self.store = store
+            self._history_high = self._history_low = None
+            self._history_open = set()
+            self._older_requested = False
+
+        if self._history_high is None:
+            # İlk okuma: sadece en yeni sayfa
+            added = self.store.get_trades_before(2 ** 63 - 1, self.history_page_size)
+            self._history_high = 0
+            self._track(added)
+            self._history_more = len(added) == self.history_page_size
+            return HistoryDelta(added=_freeze(added), has_more=self._history_more, reset=True)
+
+        added = self.store.get_trades_after(self._history_high)
+        self._track(added)
+
+        # Sadece açık pozisyon işlemlerinin durumu değişebilir
+        updated = []
+        if self._history_open:
+            statuses = self.store.get_trade_statuses(sorted(self._history_open))
+            for trade_id, status in statuses.items():
+                if status != 'open_position':
+                    self._history_open.discard(trade_id)
+                    updated.append({'id': trade_id, 'status': status})
+
+        older = None
+        if self._older_requested:
+            self._older_requested = False
+            older = self.store.get_trades_before(self._history_low or 0, self.history_page_size)
+            self._track(older)
+            self._history_more = len(older) == self.history_page_size
+            older = _freeze(older)
+
+        if not added and not updated and older is None:
+            return None
+        return HistoryDelta(_freeze(added), _freeze(updated), older, self._history_more)
@@ -0,0 +1,140 @@
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPlainTextEdit, QComboBox, QLineEdit
+from PyQt6.QtCore import QTimer
+from collections import deque
+from logging import Handler
+import logging
+import threading
+
+# Seviye filtresi seçenekleri (0 = hepsi)
+LEVELS = (
+    ('all', 0),
+    ('INFO', logging.INFO),
+    ('WARNING', logging.WARNING),
+    ('ERROR', logging.ERROR)
+)
+
+class LogConsole(QWidget):
+    """
+    Sınırlı bellekli log konsolu.
+    Kayıtlar halka tamponda (en fazla max_lines satır) tutulur, herhangi bir thread'den
+    eklenebilir ve GUI zamanlayıcısıyla toplu olarak ekrana yazılır. Metin alanı da
+    maximumBlockCount ile sınırlıdır. Seviye filtresi ve arama widget üzerinde değil
+    tampon üzerinde yapılır.
+    """
+    def __init__(self, lang_manager=None, max_lines: int = 5000, flush_interval: int = 200, parent=None):
+        super().__init__(parent)
+        self.lang = lang_manager
+        self._buffer = deque(maxlen=max_lines)
+        self._pending = deque(maxlen=max_lines)
+        self._lock = threading.Lock()
+        self._min_level = 0
+        self._search = ''
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        # Seviye filtresi ve arama
+        filter_layout = QHBoxLayout()
+        self.level_combo = QComboBox()
+        for name, level in LEVELS:
+            self.level_combo.addItem(self._tr(name), level)
+        self.level_combo.currentIndexChanged.connect(self._on_filter_changed)
+        filter_layout.addWidget(self.level_combo)
+
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText(self._tr('search'))
+        self.search_input.setClearButtonEnabled(True)
+        self.search_input.textChanged.connect(self._on_filter_changed)
+        filter_layout.addWidget(self.search_input)
+        layout.addLayout(filter_layout)
+
+        self.text = QPlainTextEdit()
+        self.text.setReadOnly(True)
+        self.text.setMaximumBlockCount(max_lines)
+        self.text.setStyleSheet("""
+            QPlainTextEdit {
+                background-color: #1e1e1e;
+                color: white;
+                border: 1px solid #3d3d3d;
+                font-family: Consolas, monospace;
+            }
+        """)
+        layout.addWidget(self.text)
+
+        # Bekleyen kayıtları toplu yazan zamanlayıcı
+        self._timer = QTimer(self)
+        self._timer.setInterval(flush_interval)
+        self._timer.timeout.connect(self.flush)
+        self._timer.start()
+
+    def _tr(self, key: str) -> str:
+        return self.lang.__(key) if self.lang else key
+
+    def update_texts(self) -> None:
+        """Dil değişince etiketleri güncelle"""
+        self.level_combo.setItemText(0, self._tr('all'))
+        self.search_input.setPlaceholderText(self._tr('search'))
+
+    def append(self, message: str, level: int = logging.INFO) -> None:
+        """Kaydı tampona ekle (thread-safe, ekrana bir sonraki toplu yazmada gelir)"""
+        with self._lock:
+            self._buffer.append((level, message))
+            self._pending.append((level, message))
+
+    def _matches(self, level: int, message: str) -> bool:
+        return level >= self._min_level and (not self._search or self._search in message.lower())
+
+    def flush(self) -> None:
+        """Bekleyen kayıtları tek seferde metin alanına yaz"""
+        if not self._pending:
+            return
+        with self._lock:
+            pending = list(self._pending)
+            self._pending.clear()
+
+        lines = [message for level, message in pending if self._matches(level, message)]
+        if not lines:
+            return
+
+        # Kullanıcı yukarı kaydırmışsa konum korunur
+        scrollbar = self.text.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum() - 4
+        self.text.appendPlainText("\n".join(lines))
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+
+    def _on_filter_changed(self, *args) -> None:
+        """Filtre değişince görünümü tampondan yeniden oluştur"""
+        self._min_level = self.level_combo.currentData() or 0
+        self._search = self.search_input.text().strip().lower()
+        with self._lock:
+            records = list(self._buffer)
+            self._pending.clear()
+
+        self.text.setPlainText("\n".join(
+            message for level, message in records if self._matches(level, message)
+        ))
+        self.text.verticalScrollBar().setValue(self.text.verticalScrollBar().maximum())
+
+    def toPlainText(self) -> str:
+        """Tampondaki tüm kayıtlar (filtreden bağımsız)"""
+        with self._lock:
+            return "\n".join(message for _, message in self._buffer)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buffer.clear()
+            self._pending.clear()
+        self.text.clear()
+
+class LogConsoleHandler(Handler):
+    """Log kayıtlarını LogConsole tamponuna aktarır (Qt çağrısı yapmaz, her thread'den güvenli)"""
+    def __init__(self, console: LogConsole):
+        super().__init__()
+        self.console = console
+
+    def emit(self, record):
+        try:
+            self.console.append(self.format(record), record.levelno)
+        except Exception:
+            self.handleError(record)
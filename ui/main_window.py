@@ -1,16 +1,24 @@
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                            QLabel, QLineEdit, QPushButton, QTabWidget,
                            QSpinBox, QDoubleSpinBox, QComboBox, QFrame,
-                           QTableWidget, QHeaderView, QGridLayout, QTableWidgetItem, QTextEdit, QMessageBox, QCheckBox)
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+                           QTableWidget, QTableView, QHeaderView, QGridLayout, QTableWidgetItem, QTextEdit, QMessageBox, QCheckBox,
+                           QFileDialog, QDateEdit)
+from PyQt6.QtCore import Qt, QTimer, QDate, pyqtSignal
 from PyQt6.QtGui import QIcon, QColor
 from datetime import datetime
 from utils.config import ConfigManager
 from utils.logger import Logger
 from utils.language_manager import LanguageManager
-from core.trading import TradingEngine
-from logging import Handler
-import logging, os
+from core.trading import TradingEngine, mode_path
+from core.store import HistoryStore
+from core.export import export_table, parquet_available
+from ui.widgets import MetricsPanel, OptimizedTableWidget
+from ui.data_provider import DataProvider, HistoryDelta, UISnapshot
+from ui.scan_bridge import ScanBridge
+from ui.log_console import LogConsole, LogConsoleHandler
+from ui.scanner_view import ScannerView
+from ui.models import AnalysisTableModel, TradesTableModel, HistoryTableModel
+import logging, os, threading
 from ui.tooltip import get_score_tooltip_text
 
 APP_VERSION = "1"
@@ -20,6 +28,10 @@ class MainWindow(QMainWindow):
     # Dil değişikliği sinyali
     language_changed = pyqtSignal()
     
+    # Arka planda pozisyon kapatma / durdurma sinyalleri
+    close_progress = pyqtSignal(str, bool, int, int)
+    trading_stopped = pyqtSignal(object)
+    
     def __init__(self):
         super().__init__()
         
@@ -29,6 +41,10 @@ class MainWindow(QMainWindow):
         self.lang = LanguageManager()  # Dil yöneticisini ekle
         self.trading_engine = None
         
+        # Kalıcı işlem geçmişi (engine'ler arasında paylaşılır, simülasyon ayrı tutulur)
+        self.history_stores = {}
+        self.history_store = self.get_history_store(bool(self.config.get_value('simulated', False)))
+        
         # Program ikonunu ayarla
         icon_path = self.config.ensure_resources()
         if icon_path and os.path.exists(icon_path):
@@ -49,14 +65,54 @@ class MainWindow(QMainWindow):
         # Kaydedilmiş ayarları yükle
         self.load_saved_settings()
                 
-        # UI güncelleme timer'ı
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_ui)
-        self.update_timer.start(1000)  # Her saniye güncelle
+        # UI verileri arka planda toplanır, görüntüler sinyalle gelir
+        self.data_provider = DataProvider(
+            self.history_store,
+            interval=float(self.config.config.get('ui_update_interval', 1.0)),
+            price_max_age=float(self.config.config.get('ui_price_max_age', 5)),
+            history_page_size=int(self.config.config.get('history_page_size', 100)),
+            lang_manager=self.lang
+        )
+        self.data_provider.snapshot_ready.connect(self.update_ui)
+        self.history_model.fetch_older = self.data_provider.request_older_history
+        self.simulated_checkbox.toggled.connect(self.switch_history_store)
+        self.tabs.currentChanged.connect(self.on_tab_changed)
+        self.data_provider.start()
         
         # Dil değişikliği sinyalini bağla
         self.language_changed.connect(self.update_ui_texts)
         
+        # Durdurma sinyallerini bağla (worker thread'den GUI thread'ine)
+        self.close_progress.connect(self.on_close_progress)
+        self.trading_stopped.connect(self.on_trading_stopped)
+        
+        # Tarama sonuçları trading thread'inden kare hızıyla birleştirilerek gelir
+        self.scan_bridge = ScanBridge(fps=float(self.config.config.get('ui_scan_fps', 10)), parent=self)
+        self.scan_bridge.scan_batch.connect(self.update_analysis_table)
+        
+    def get_history_store(self, simulated: bool) -> HistoryStore:
+        """Modun geçmiş deposu (ilk kullanımda açılır)"""
+        store = self.history_stores.get(simulated)
+        if store is None:
+            store = HistoryStore(
+                mode_path(self.config.internal_dir, 'history.db', simulated),
+                flush_interval=float(self.config.config.get('history_flush_interval', 1.0)),
+                lang=self.lang
+            )
+            try:
+                store.open()
+            except Exception as e:
+                logging.error(f"{self.lang.__('history_store_error')}: {str(e)}")
+            self.history_stores[simulated] = store
+        return store
+
+    def switch_history_store(self, simulated: bool):
+        """Geçmiş sekmesini seçili modun deposuna geçir"""
+        store = self.get_history_store(simulated)
+        if store is not self.history_store:
+            self.history_store = store
+            self.data_provider.set_store(store)
+
     def load_saved_settings(self):
         """Kaydedilmiş ayarları UI'a yükle"""
         try:
@@ -71,6 +127,8 @@ class MainWindow(QMainWindow):
             self.usdt_input.setValue(self.config.get_value('max_usdt', 10.0))
             self.max_positions_input.setValue(self.config.get_value('max_positions', 5))
             self.min_score_input.setValue(self.config.get_value('min_score', 75))
+            self.simulated_checkbox.setChecked(bool(self.config.get_value('simulated', False)))
+            self.use_oco_checkbox.setChecked(bool(self.config.get_value('use_oco', False)))
             
         except Exception as e:
             logging.error(f"Ayarları yükleme hatası: {str(e)}")
@@ -96,6 +154,9 @@ class MainWindow(QMainWindow):
         self.setup_trading_tab()
         self.setup_history_tab()
         self.setup_analysis_tab()
+        self.setup_latency_tab()
+        self.setup_performance_tab()
+        self.setup_quarantine_tab()
         
         main_layout.addWidget(self.tabs)
 
@@ -204,6 +265,9 @@ class MainWindow(QMainWindow):
         self.tabs.setTabText(1, self.lang.__('active_trades'))
         self.tabs.setTabText(2, self.lang.__('trades_history'))
         self.tabs.setTabText(3, self.lang.__('statistics'))
+        self.tabs.setTabText(4, self.lang.__('latency'))
+        self.tabs.setTabText(5, self.lang.__('performance'))
+        self.tabs.setTabText(6, self.lang.__('quarantine'))
         
         # Butonlar
         self.start_button.setText(self.lang.__('start'))
@@ -216,6 +280,9 @@ class MainWindow(QMainWindow):
             self.api_secret_label.setText(self.lang.__('api_secret') + ":")
         if hasattr(self, 'timeframe_label'):
             self.timeframe_label.setText("Timeframe:")
+        if hasattr(self, 'simulated_checkbox'):
+            self.simulated_checkbox.setText(self.lang.__('simulated_mode'))
+            self.use_oco_checkbox.setText(self.lang.__('use_oco_orders'))
         if hasattr(self, 'stop_loss_label'):
             self.stop_loss_label.setText("Stop Loss (%):")
         if hasattr(self, 'take_profit_label'):
@@ -238,6 +305,18 @@ class MainWindow(QMainWindow):
             self.reset_excluded_button.setText(self.lang.__('reset_to_default'))
         if hasattr(self, 'save_excluded_button'):
             self.save_excluded_button.setText(self.lang.__('save'))
+        if hasattr(self, 'export_latency_button'):
+            self.export_latency_button.setText(self.lang.__('export'))
+        if hasattr(self, 'release_symbol_button'):
+            self.release_symbol_button.setText(self.lang.__('release'))
+        if hasattr(self, 'export_history_button'):
+            self.export_history_button.setText(self.lang.__('export'))
+            for i in range(self.export_table_combo.count()):
+                self.export_table_combo.setItemText(i, self.lang.__(self.export_table_combo.itemData(i)))
+        if self.log_text:
+            self.log_text.update_texts()
+        if hasattr(self, 'history_count_label'):
+            self.update_history_count()
         if hasattr(self, 'score_info_button'):
             from ui.tooltip import get_score_tooltip_text
             self.score_info_button.setToolTip(get_score_tooltip_text(self.lang))
@@ -283,7 +362,7 @@ class MainWindow(QMainWindow):
         """Tablo başlıklarını güncelle"""
         # İşlemler tablosu
         if self.trades_table:
-            self.trades_table.setHorizontalHeaderLabels([
+            self.trades_model.set_headers([
                 self.lang.__('symbol'),
                 self.lang.__('entry_price'),
                 self.lang.__('current_price'),
@@ -295,7 +374,7 @@ class MainWindow(QMainWindow):
         
         # Geçmiş tablosu
         if self.history_table:
-            self.history_table.setHorizontalHeaderLabels([
+            self.history_model.set_headers([
                 self.lang.__('date'),
                 self.lang.__('symbol'),
                 self.lang.__('type'),
@@ -305,11 +384,13 @@ class MainWindow(QMainWindow):
                 self.lang.__('profit_loss'),
                 self.lang.__('status')
             ])
+            self.history_model.retranslate()
         
         # Analiz tablosu
         if hasattr(self, 'analysis_table') and self.analysis_table:
-            self.analysis_table.setHorizontalHeaderLabels([
+            self.analysis_model.set_headers([
                 self.lang.__('coin'),
+                self.lang.__('timeframe'),
                 self.lang.__('price'),
                 self.lang.__('change_24h'),
                 "RSI",
@@ -318,6 +399,21 @@ class MainWindow(QMainWindow):
                 self.lang.__('signal'),
                 self.lang.__('last_update')
             ])
+            self.scanner_view.update_texts()
+        
+        # Gecikme tablosu
+        if hasattr(self, 'latency_table') and self.latency_table:
+            self.latency_table.setHorizontalHeaderLabels([
+                self.lang.__('stage'), self.lang.__('count'),
+                "Avg (ms)", "p50 (ms)", "p95 (ms)", "p99 (ms)", "Max (ms)"
+            ])
+        
+        # Karantina tablosu
+        if hasattr(self, 'quarantine_table') and self.quarantine_table:
+            self.quarantine_table.setHorizontalHeaderLabels([
+                self.lang.__('symbol'), self.lang.__('error_class'), self.lang.__('failures'),
+                self.lang.__('remaining'), self.lang.__('last_error')
+            ])
 
     def setup_settings_tab(self):
         """Ayarlar sekmesi"""
@@ -412,6 +508,12 @@ class MainWindow(QMainWindow):
         self.score_info_button.setToolTipDuration(10000)
         trading_layout.addWidget(self.score_info_button, 2, 4)
         
+        # Dördüncü satır: simülasyon (API anahtarı gerekmez) ve borsa tarafı OCO koruması
+        self.simulated_checkbox = QCheckBox(self.lang.__('simulated_mode'))
+        trading_layout.addWidget(self.simulated_checkbox, 3, 0, 1, 2)
+        self.use_oco_checkbox = QCheckBox(self.lang.__('use_oco_orders'))
+        trading_layout.addWidget(self.use_oco_checkbox, 3, 2, 1, 2)
+        
         layout.addWidget(trading_frame)
         
         # Yasaklı Coinler Bölümü
@@ -521,7 +623,7 @@ class MainWindow(QMainWindow):
         if self.config.update_excluded_coins(coins):
             self.log_text.append(f"[INFO] {self.lang.__('excluded_coins_updated')}")
         else:
-            self.log_text.append(f"[ERROR] {self.lang.__('excluded_coins_update_error')}")
+            self.log_text.append(f"[ERROR] {self.lang.__('excluded_coins_update_error')}", logging.ERROR)
 
     def reset_excluded_coins(self):
         """Yasaklı coin listesini varsayılana döndür"""
@@ -535,9 +637,7 @@ class MainWindow(QMainWindow):
         layout = QVBoxLayout(tab)
         
         # İşlem tablosu
-        self.trades_table = QTableWidget()
-        self.trades_table.setColumnCount(7)
-        self.trades_table.setHorizontalHeaderLabels([
+        self.trades_model = TradesTableModel([
             self.lang.__('symbol'),
             self.lang.__('entry_price'),
             self.lang.__('current_price'),
@@ -546,21 +646,15 @@ class MainWindow(QMainWindow):
             "Stop Loss",
             "Take Profit"
         ])
-        header = self.trades_table.horizontalHeader()
-        header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.trades_table = self.create_table_view(self.trades_model)
         layout.addWidget(self.trades_table)
         
-        # Log alanı
-        self.log_text = QTextEdit()
-        self.log_text.setReadOnly(True)
-        self.log_text.setStyleSheet("""
-            QTextEdit {
-                background-color: #1e1e1e;
-                color: white;
-                border: 1px solid #3d3d3d;
-                font-family: Consolas, monospace;
-            }
-        """)
+        # Log alanı (sınırlı halka tampon, toplu yazma)
+        self.log_text = LogConsole(
+            lang_manager=self.lang,
+            max_lines=int(self.config.config.get('log_max_lines', 5000)),
+            flush_interval=int(self.config.config.get('log_flush_interval_ms', 200))
+        )
 
         # Logger'ı ayarla
         logger = logging.getLogger()
@@ -571,7 +665,7 @@ class MainWindow(QMainWindow):
             logger.removeHandler(handler)
 
         # Yeni handler ekle
-        log_handler = QTextEditLogger(self.log_text)
+        log_handler = LogConsoleHandler(self.log_text)
         log_handler.setFormatter(
             logging.Formatter(
                 '[%(asctime)s] [%(levelname)s] %(message)s',
@@ -616,9 +710,7 @@ class MainWindow(QMainWindow):
         tab = QWidget()
         layout = QVBoxLayout(tab)
         
-        self.history_table = QTableWidget()
-        self.history_table.setColumnCount(8)
-        self.history_table.setHorizontalHeaderLabels([
+        self.history_model = HistoryTableModel(self.lang, [
             self.lang.__('date'),
             self.lang.__('symbol'),
             self.lang.__('type'),
@@ -628,12 +720,39 @@ class MainWindow(QMainWindow):
             self.lang.__('profit_loss'),
             self.lang.__('status')
         ])
-        header = self.history_table.horizontalHeader()
-        header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.history_table = self.create_table_view(self.history_model, sort_field='timestamp')
         
         layout.addWidget(self.history_table)
         
+        # Sayfalama ve dışa aktarma
+        page_layout = QHBoxLayout()
+        
+        self.export_table_combo = QComboBox()
+        for table in ('trades', 'positions', 'scans'):
+            self.export_table_combo.addItem(self.lang.__(table), table)
+        page_layout.addWidget(self.export_table_combo)
+        
+        self.export_from_date = QDateEdit(QDate.currentDate().addMonths(-1))
+        self.export_from_date.setCalendarPopup(True)
+        page_layout.addWidget(self.export_from_date)
+        self.export_to_date = QDateEdit(QDate.currentDate())
+        self.export_to_date.setCalendarPopup(True)
+        page_layout.addWidget(self.export_to_date)
+        
+        self.export_history_button = QPushButton(self.lang.__('export'))
+        self.export_history_button.clicked.connect(self.export_history)
+        page_layout.addWidget(self.export_history_button)
+        
+        page_layout.addStretch()
+        # Eski işlemler tablo sona kaydırıldıkça yüklenir
+        self.history_count_label = QLabel(f"{self.lang.__('loaded_trades')}: 0")
+        self.history_model.rowsInserted.connect(self.update_history_count)
+        self.history_model.modelReset.connect(self.update_history_count)
+        page_layout.addWidget(self.history_count_label)
+        layout.addLayout(page_layout)
+        
         # Tab'a ekle
+        self.history_tab = tab
         self.tabs.addTab(tab, self.lang.__('trades_history'))
 
     def setup_status_bar(self):
@@ -649,7 +768,8 @@ class MainWindow(QMainWindow):
     def start_trading(self):
         """Trading'i başlat"""
         try:
-            if not self.api_key_input.text() or not self.api_secret_input.text():
+            simulated = self.simulated_checkbox.isChecked()
+            if not simulated and (not self.api_key_input.text() or not self.api_secret_input.text()):
                 self.status_label.setText(self.lang.__('api_credentials_required'))
                 return
 
@@ -662,27 +782,38 @@ class MainWindow(QMainWindow):
                 'take_profit': self.take_profit_input.value(),
                 'max_usdt': self.usdt_input.value(),
                 'max_positions': self.max_positions_input.value(),
-                'min_score': self.min_score_input.value()
+                'min_score': self.min_score_input.value(),
+                'simulated': simulated,
+                'use_oco': self.use_oco_checkbox.isChecked()
             }
 
             # Ayarları kaydet
             self.config.save_config(config)
 
-            # Trading engine'i başlat
-            self.trading_engine = TradingEngine(self.config.config)
-            self.trading_engine.scan_callback = self.update_analysis_table
+            # Trading engine'i başlat (modun geçmiş deposuyla)
+            self.switch_history_store(simulated)
+            self.trading_engine = TradingEngine(
+                self.config.config,
+                data_dir=self.config.internal_dir,
+                store=self.history_store
+            )
+            self.scan_bridge.reset()
+            self.trading_engine.scan_callback = self.scan_bridge.push
             self.trading_engine.start()
+            self.data_provider.set_engine(self.trading_engine)
 
             self.start_button.setEnabled(False)
             self.stop_button.setEnabled(True)
+            # Çalışırken mod değişmez
+            self.simulated_checkbox.setEnabled(False)
             self.status_label.setText(self.lang.__('trading_started'))
 
         except Exception as e:
-            self.log_to_ui(f"[ERROR] {self.lang.__('trading_start_error')}: {str(e)}")
+            self.log_to_ui(f"[ERROR] {self.lang.__('trading_start_error')}: {str(e)}", logging.ERROR)
             
-    def log_to_ui(self, message: str):
-        """Trading Engine'den gelen logları QTextEdit'e ekle"""
-        self.log_text.append(message)
+    def log_to_ui(self, message: str, level: int = logging.INFO):
+        """Mesajı log konsoluna ekle"""
+        self.log_text.append(message, level)
 
     def stop_trading(self):
         """Trading'i durdur"""
@@ -692,174 +823,194 @@ class MainWindow(QMainWindow):
             self.stop_button.setEnabled(False)
             self.status_label.setText(self.lang.__('trading_stopping'))
             
-            if self.trading_engine:
-                # Açık pozisyonları kontrol et
-                if self.trading_engine.active_trades:
-                    reply = QMessageBox.question(
-                        self, 
-                        self.lang.__('open_positions'),
-                        self.lang.__('close_positions_question'),
-                        QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                        QMessageBox.StandardButton.No
-                    )
-                    
-                    if reply == QMessageBox.StandardButton.Yes:
-                        logging.info(self.lang.__('closing_positions'))
-                        
-                        # Pozisyonları kapatma işlemini başlat
-                        if self.trading_engine.start_closing_positions():
-                            logging.info(self.lang.__('all_positions_closed'))
-                        else:
-                            logging.error(self.lang.__('some_positions_not_closed'))
-                            
-                # Trading engine'i durdur
-                self.trading_engine.stop()
-                self.trading_engine = None
-                self.trades_table.setRowCount(0)
+            if not self.trading_engine:
+                self.on_trading_stopped({})
+                return
+            
+            # Açık pozisyonları kontrol et
+            close_positions = False
+            if self.trading_engine.active_trades:
+                reply = QMessageBox.question(
+                    self, 
+                    self.lang.__('open_positions'),
+                    self.lang.__('close_positions_question'),
+                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                    QMessageBox.StandardButton.No
+                )
                 
-                logging.info(self.lang.__('trading_stopped'))
+                if reply == QMessageBox.StandardButton.Yes:
+                    logging.info(self.lang.__('closing_positions'))
+                    close_positions = True
+            
+            # Pozisyon kapatma ve engine durdurma GUI thread'ini bloklamadan arka planda yapılır
+            worker = threading.Thread(
+                target=self._stop_trading_worker,
+                args=(self.trading_engine, close_positions)
+            )
+            worker.daemon = True
+            worker.start()
                 
+        except Exception as e:
+            logging.error(f"{self.lang.__('trading_stop_error')}: {str(e)}")
+            self.on_trading_stopped({})
+
+    def _stop_trading_worker(self, engine: TradingEngine, close_positions: bool):
+        """Pozisyonları paralel kapat ve engine'i durdur (arka plan thread'i)"""
+        results = {}
+        try:
+            if close_positions:
+                results = engine.close_all_positions(
+                    progress_callback=lambda symbol, result, done, total:
+                        self.close_progress.emit(symbol, result['success'], done, total)
+                )
+            engine.stop()
+            
         except Exception as e:
             logging.error(f"{self.lang.__('trading_stop_error')}: {str(e)}")
             
+        finally:
+            self.trading_stopped.emit(results)
+
+    def on_close_progress(self, symbol: str, success: bool, done: int, total: int):
+        """Pozisyon kapatma ilerlemesini göster"""
+        self.status_label.setText(f"{self.lang.__('closing_positions')} {done}/{total}")
+        if not success:
+            logging.error(f"{self.lang.__('position_close_error')} ({symbol})")
+
+    def on_trading_stopped(self, results: dict):
+        """Durdurma tamamlandığında UI'ı güncelle"""
+        try:
+            if results:
+                failed = [symbol for symbol, result in results.items() if not result['success']]
+                if failed:
+                    logging.error(f"{self.lang.__('some_positions_not_closed')} {', '.join(failed)}")
+                else:
+                    logging.info(self.lang.__('all_positions_closed'))
+            
+            self.trading_engine = None
+            self.data_provider.set_engine(None)
+            self.trades_table.clear()
+            logging.info(self.lang.__('trading_stopped'))
+            
         finally:
             # Her durumda butonları düzelt
             self.start_button.setEnabled(True)
             self.stop_button.setEnabled(False)
+            self.simulated_checkbox.setEnabled(True)
             self.status_label.setText(self.lang.__('trading_stopped'))
 
-    def update_ui(self):
-        """UI güncellemesi yap"""
-        if self.trading_engine and self.trading_engine.is_running:
+    def update_ui(self, snapshot: UISnapshot):
+        """Veri sağlayıcıdan gelen görüntüyü çiz (GUI thread'i I/O beklemez)"""
+        if snapshot.engine_running:
             try:
-                # Exchange null kontrolü
-                if not self.trading_engine.exchange:
-                    return
-                    
                 # Cüzdan bilgisini güncelle
-                try:
-                    balance = self.trading_engine.exchange.fetch_balance()
-                    if balance and 'USDT' in balance:
-                        usdt_balance = balance['USDT'].get('free', 0)
-                        self.balance_label.setText(f"{self.lang.__('usdt_balance')}: {usdt_balance:.2f}")
-                except Exception as e:
-                    logging.error(f"{self.lang.__('balance_update_error')}: {str(e)}")
+                if snapshot.usdt_balance is not None:
+                    self.balance_label.setText(f"{self.lang.__('usdt_balance')}: {snapshot.usdt_balance:.2f}")
+                
+                stats = snapshot.stats
                 
                 # İstatistikleri güncelle
                 try:
-                    total_profit = self.trading_engine.stats.total_profit_usdt
-                    self.profit_label.setText(f"{self.lang.__('total_profit')}: {total_profit:+.2f} USDT")
+                    self.profit_label.setText(f"{self.lang.__('total_profit')}: {stats.total_profit_usdt:+.2f} USDT")
                 except Exception as e:
                     logging.error(f"{self.lang.__('profit_update_error')}: {str(e)}")
                 
                 # İşlem sayılarını güncelle
                 try:
-                    active_count = len(self.trading_engine.active_trades)
-                    total_trades = self.trading_engine.stats.total_trades
-                    self.trades_label.setText(f"{self.lang.__('trades')}: {active_count}/{total_trades}")
+                    self.trades_label.setText(f"{self.lang.__('trades')}: {snapshot.active_count}/{stats.total_trades}")
                 except Exception as e:
                     logging.error(f"{self.lang.__('trade_count_update_error')}: {str(e)}")
                 
+                # Performans sekmesi sadece görünürken güncellenir
+                if self.tabs.currentWidget() is self.performance_tab:
+                    self.update_performance_tab(stats)
+                
                 # Aktif işlemleri güncelle
                 try:
-                    self.update_trades_table()
+                    self.update_trades_table(snapshot.trades)
                 except Exception as e:
                     logging.error(f"Tablo güncelleme hatası: {str(e)}")
-                    
-                try:
-                    self.update_history_table()
-                except Exception as e:
-                    logging.error(f"Geçmiş tablosu güncelleme hatası: {str(e)}")
+                
+                # Gecikme ve karantina verileri sadece sekme görünürken toplanır
+                if snapshot.latency is not None:
+                    self.update_latency_table(snapshot.latency)
+                if snapshot.quarantined is not None:
+                    self.update_quarantine_table(snapshot.quarantined)
                                         
             except Exception as e:
                 logging.error(f"UI güncelleme hatası: {str(e)}")
-                
-    def update_history_table(self):
-        """İşlem geçmişi tablosunu güncelle"""
-        if not self.trading_engine:
-            return
-            
-        # Trading stats'tan geçmiş verileri al
-        history = self.trading_engine.stats.trade_history
-        self.history_table.setRowCount(len(history))
         
-        for i, trade in enumerate(history):
+        # Geçmiş depodan okunur, trading durmuşken de gösterilir
+        if snapshot.history is not None:
             try:
-                # Tarih
-                date_item = QTableWidgetItem(trade.get('timestamp', '').strftime('%Y-%m-%d %H:%M:%S'))
-                self.history_table.setItem(i, 0, date_item)
-                
-                # Sembol
-                self.history_table.setItem(i, 1, QTableWidgetItem(trade.get('symbol', '')))
-                
-                # İşlem türü
-                type_item = QTableWidgetItem(self.lang.__('buy') if trade.get('type') == 'buy' else self.lang.__('sell'))
-                type_item.setForeground(QColor("#00ff00" if trade.get('type') == 'buy' else "#ff4444"))
-                self.history_table.setItem(i, 2, type_item)
-                
-                # Fiyat
-                self.history_table.setItem(i, 3, QTableWidgetItem(f"{trade.get('price', 0):.8f}"))
-                
-                # Miktar
-                self.history_table.setItem(i, 4, QTableWidgetItem(f"{trade.get('amount', 0):.8f}"))
-                
-                # Toplam USDT
-                total_usdt = trade.get('total_usdt', 0)
-                self.history_table.setItem(i, 5, QTableWidgetItem(f"{total_usdt:.2f}"))
-                
-                # Kâr/Zarar
-                if 'profit' in trade:
-                    profit_text = f"{trade['profit']:.2f} ({trade.get('profit_percentage', 0):.2f}%)"
-                    profit_item = QTableWidgetItem(profit_text)
-                    profit_item.setForeground(QColor("#00ff00" if trade['profit'] > 0 else "#ff4444"))
-                    self.history_table.setItem(i, 6, profit_item)
-                else:
-                    self.history_table.setItem(i, 6, QTableWidgetItem("-"))
-                
-                # Durum
-                status_text = trade.get('status', '')
-                if status_text == 'open_position':
-                    status_text = self.lang.__('open_position')
-                elif status_text == 'TAKE-PROFIT':
-                    status_text = self.lang.__('take_profit_reason')
-                elif status_text == 'STOP-LOSS':
-                    status_text = self.lang.__('stop_loss_reason')
-                self.history_table.setItem(i, 7, QTableWidgetItem(status_text))
-                
+                self.update_history_table(snapshot.history)
             except Exception as e:
-                logging.error(f"{self.lang.__('history_table_update_error')}: {str(e)}")
-
-    def update_trades_table(self):
-        """İşlem tablosunu güncelle"""
-        if not self.trading_engine:
+                logging.error(f"Geçmiş tablosu güncelleme hatası: {str(e)}")
+    
+    def on_tab_changed(self, index: int):
+        """Görünen sekmeye göre veri sağlayıcının toplayacağı bölümleri seç"""
+        sections = {
+            self.latency_tab: 'latency',
+            self.quarantine_tab: 'quarantine'
+        }
+        section = sections.get(self.tabs.currentWidget())
+        self.data_provider.set_sections([section] if section else [])
+    
+    def export_history(self):
+        """Seçili tabloyu tarih aralığıyla CSV/Parquet olarak dışa aktar"""
+        table = self.export_table_combo.currentData()
+        formats = {"CSV (*.csv)": 'csv'}
+        if parquet_available():
+            formats["Parquet (*.parquet)"] = 'parquet'
+        path, selected = QFileDialog.getSaveFileName(
+            self, self.lang.__('export'),
+            f"{table}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+            ";;".join(formats)
+        )
+        if not path:
             return
-            
+        
+        # Biçim seçilen filtreden belirlenir, uzantı buna göre düzeltilir
+        fmt = formats.get(selected, 'csv')
+        root, ext = os.path.splitext(path)
+        if ext.lower() != f'.{fmt}':
+            path = f"{root if ext.lower() in ('.csv', '.parquet') else path}.{fmt}"
+        
+        # Bitiş günü dahil
+        since = datetime.combine(self.export_from_date.date().toPyDate(), datetime.min.time())
+        until = datetime.combine(self.export_to_date.date().addDays(1).toPyDate(), datetime.min.time())
+        
+        # Büyük aktarımlar GUI'yi bloklamasın
+        threading.Thread(
+            target=self._export_history_worker, args=(table, path, fmt, since, until), daemon=True
+        ).start()
+    
+    def _export_history_worker(self, table: str, path: str, fmt: str, since: datetime, until: datetime):
         try:
-            # Dictionary'nin bir kopyasını al
-            trades = dict(self.trading_engine.active_trades)
-            self.trades_table.setRowCount(len(trades))
-            
-            for i, (symbol, trade) in enumerate(trades.items()):
-                try:
-                    current_price = float(self.trading_engine.exchange.fetch_ticker(symbol)['last'])
-                    profit_percent = ((current_price - trade['entry_price']) / trade['entry_price']) * 100
-                    
-                    # Tablo satırını güncelle
-                    self.trades_table.setItem(i, 0, QTableWidgetItem(symbol))
-                    self.trades_table.setItem(i, 1, QTableWidgetItem(f"{trade['entry_price']:.8f}"))
-                    self.trades_table.setItem(i, 2, QTableWidgetItem(f"{current_price:.8f}"))
-                    self.trades_table.setItem(i, 3, QTableWidgetItem(f"{trade['amount']:.8f}"))
-                    
-                    profit_item = QTableWidgetItem(f"{profit_percent:+.2f}%")
-                    profit_item.setForeground(QColor("#00ff00" if profit_percent > 0 else "#ff4444"))
-                    self.trades_table.setItem(i, 4, profit_item)
-                    
-                    self.trades_table.setItem(i, 5, QTableWidgetItem(f"{trade['stop_loss']:.8f}"))
-                    self.trades_table.setItem(i, 6, QTableWidgetItem(f"{trade['take_profit']:.8f}"))
-                    
-                except Exception as e:
-                    logging.error(f"Tablo satır güncelleme hatası ({symbol}): {str(e)}")
-                    
+            count = export_table(self.history_store, table, path, since, until, fmt=fmt)
+            logging.info(f"{self.lang.__('export_completed')}: {path} ({count})")
+        except Exception as e:
+            logging.error(f"{self.lang.__('export_error')}: {str(e)}")
+
+    def update_history_table(self, delta: HistoryDelta):
+        """Geçmiş farkını uygula (yeni işlemler eklenir, sadece değişen durumlar yenilenir)"""
+        if delta.reset:
+            # Depo değişti (simülasyon/gerçek), tablo baştan doldurulur
+            self.history_table.clear()
+        self.history_table.batch_update(delta.added + (delta.older or ()) + delta.updated)
+        if delta.older is not None or delta.reset:
+            # İstenen eski sayfa hemen yazılır ki görünüm sonraki sayfayı erken istemesin
+            self.history_table.flush()
+        self.history_model.set_paging(delta.has_more, fetched=delta.older is not None or delta.reset)
+
+    def update_history_count(self, *args):
+        """Yüklü işlem sayısını göster"""
+        self.history_count_label.setText(f"{self.lang.__('loaded_trades')}: {self.history_model.rowCount()}")
+
+    def update_trades_table(self, rows):
+        """İşlem tablosunu veri sağlayıcının satırlarıyla eşitle"""
+        try:
+            self.trades_table.batch_update((row._asdict() for row in rows), replace=True)
         except Exception as e:
             logging.error(f"Tablo güncelleme hatası: {str(e)}")
 
@@ -903,13 +1054,13 @@ class MainWindow(QMainWindow):
             QPushButton:disabled {
                 background-color: #333333;
             }
-            QTableWidget {
+            QTableWidget, QTableView {
                 background-color: #2d2d2d;
                 border: 1px solid #444444;
                 border-radius: 4px;
                 gridline-color: #444444;
             }
-            QTableWidget::item {
+            QTableWidget::item, QTableView::item {
             padding: 8px;
             height: 30px;
             }
@@ -951,9 +1102,13 @@ class MainWindow(QMainWindow):
                 self.trading_engine.stop()
                 self.trading_engine = None
             
-            # UI timer'ları durdur
-            if hasattr(self, 'update_timer'):
-                self.update_timer.stop()
+            # Veri sağlayıcıyı durdur (depoyu kullanır, önce durmalı)
+            if hasattr(self, 'data_provider'):
+                self.data_provider.stop()
+            
+            # Bekleyen geçmiş kayıtlarını yaz
+            for store in self.history_stores.values():
+                store.close()
                 
             event.accept()
             
@@ -965,26 +1120,30 @@ class MainWindow(QMainWindow):
             import sys
             sys.exit(0)
             
+    def create_table_view(self, model, sort_field: str = None) -> OptimizedTableWidget:
+        """Model için sıralanabilir, filtrelenebilir, toplu güncellenen salt okunur tablo"""
+        return OptimizedTableWidget(
+            model, sort_field=sort_field,
+            throttle_ms=int(self.config.config.get('ui_table_throttle_ms', 100)),
+            lang_manager=self.lang
+        )
+
     def setup_analysis_tab(self):
         """Analiz sekmesi"""
         tab = QWidget()
         layout = QVBoxLayout(tab)
         
-        # Analiz sonuçları tablosu
-        self.analysis_table = QTableWidget()
-        self.analysis_table.setColumnCount(8)
-        self.analysis_table.setHorizontalHeaderLabels([
-            "Coin", "Fiyat", "24s Değişim", "RSI", 
+        # Tarama sonuçları (sembol ve periyot başına tek satır, skora göre sıralı)
+        self.analysis_model = AnalysisTableModel(self.lang, [
+            "Coin", "Periyot", "Fiyat", "24s Değişim", "RSI",
             "Hacim (USDT)", "Skor", "Sinyal", "Son Güncelleme"
-        ])
-        
-        header = self.analysis_table.horizontalHeader()
-        header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        
-        # Sıralama özelliği ekle
-        self.analysis_table.setSortingEnabled(True)
-        
-        layout.addWidget(self.analysis_table)
+        ], capacity=4096)
+        self.scanner_view = ScannerView(
+            self.analysis_model, self.lang,
+            throttle_ms=int(self.config.config.get('ui_table_throttle_ms', 100))
+        )
+        self.analysis_table = self.scanner_view.table
+        layout.addWidget(self.scanner_view)
         
         # Tarama bilgisi
         info_frame = QFrame()
@@ -993,6 +1152,10 @@ class MainWindow(QMainWindow):
         self.scan_count_label = QLabel("Taranan Coin: 0/0")
         info_layout.addWidget(self.scan_count_label)
         
+        # Son iki tarama arasında skoru en çok değişenler
+        self.top_movers_label = QLabel(f"{self.lang.__('top_movers')}: -")
+        info_layout.addWidget(self.top_movers_label)
+        
         self.last_scan_label = QLabel("Son Tarama: -")
         info_layout.addWidget(self.last_scan_label, alignment=Qt.AlignmentFlag.AlignRight)
         
@@ -1001,83 +1164,181 @@ class MainWindow(QMainWindow):
         # Tab'a ekle
         self.tabs.addTab(tab, "Analysis")
         
+    def setup_latency_tab(self):
+        """Gecikme sekmesi (sinyal -> dolum aşama süreleri)"""
+        self.latency_tab = QWidget()
+        layout = QVBoxLayout(self.latency_tab)
+        
+        self.latency_table = QTableWidget()
+        self.latency_table.setColumnCount(7)
+        self.latency_table.setHorizontalHeaderLabels([
+            self.lang.__('stage'), self.lang.__('count'),
+            "Avg (ms)", "p50 (ms)", "p95 (ms)", "p99 (ms)", "Max (ms)"
+        ])
+        header = self.latency_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        layout.addWidget(self.latency_table)
+        
+        # Dışa aktarma butonu
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        self.export_latency_button = QPushButton(self.lang.__('export'))
+        self.export_latency_button.setFixedSize(120, 30)
+        self.export_latency_button.clicked.connect(self.export_latency)
+        button_layout.addWidget(self.export_latency_button)
+        layout.addLayout(button_layout)
+        
+        # Tab'a ekle
+        self.tabs.addTab(self.latency_tab, self.lang.__('latency'))
+
+    def setup_performance_tab(self):
+        """Performans sekmesi (özet metrikler + sembol bazlı sonuçlar)"""
+        self.performance_tab = QWidget()
+        layout = QVBoxLayout(self.performance_tab)
+        
+        self.metrics_panel = MetricsPanel(lang_manager=self.lang)
+        layout.addWidget(self.metrics_panel)
+        
+        self.symbol_stats_table = QTableWidget()
+        self.symbol_stats_table.setColumnCount(6)
+        self.symbol_stats_table.setHorizontalHeaderLabels([
+            self.lang.__('symbol'), self.lang.__('trades'), self.lang.__('win_rate'),
+            self.lang.__('profit_loss'), "Best", "Worst"
+        ])
+        header = self.symbol_stats_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        layout.addWidget(self.symbol_stats_table)
+        
+        # Tab'a ekle
+        self.tabs.addTab(self.performance_tab, self.lang.__('performance'))
+
+    def setup_quarantine_tab(self):
+        """Karantina sekmesi (hata nedeniyle taramadan çıkarılan semboller)"""
+        self.quarantine_tab = QWidget()
+        layout = QVBoxLayout(self.quarantine_tab)
+        
+        self.quarantine_table = QTableWidget()
+        self.quarantine_table.setColumnCount(5)
+        self.quarantine_table.setHorizontalHeaderLabels([
+            self.lang.__('symbol'), self.lang.__('error_class'), self.lang.__('failures'),
+            self.lang.__('remaining'), self.lang.__('last_error')
+        ])
+        self.quarantine_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        header = self.quarantine_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        header.setStretchLastSection(True)
+        layout.addWidget(self.quarantine_table)
+        
+        # Seçili sembolü karantinadan çıkarma butonu
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        self.release_symbol_button = QPushButton(self.lang.__('release'))
+        self.release_symbol_button.setFixedSize(120, 30)
+        self.release_symbol_button.clicked.connect(self.release_quarantined_symbol)
+        button_layout.addWidget(self.release_symbol_button)
+        layout.addLayout(button_layout)
+        
+        # Tab'a ekle
+        self.tabs.addTab(self.quarantine_tab, self.lang.__('quarantine'))
+
+    def update_quarantine_table(self, quarantined):
+        """Karantina tablosunu güncelle"""
+        self.quarantine_table.setRowCount(len(quarantined))
+        for i, item in enumerate(quarantined):
+            self.quarantine_table.setItem(i, 0, QTableWidgetItem(item['symbol']))
+            self.quarantine_table.setItem(i, 1, QTableWidgetItem(item['error_class']))
+            self.quarantine_table.setItem(i, 2, QTableWidgetItem(str(item['failures'])))
+            self.quarantine_table.setItem(i, 3, QTableWidgetItem(f"{item['remaining']:.0f}"))
+            self.quarantine_table.setItem(i, 4, QTableWidgetItem(item['last_error']))
+
+    def release_quarantined_symbol(self):
+        """Seçili sembolleri karantinadan çıkar"""
+        if not self.trading_engine:
+            return
+        
+        rows = {index.row() for index in self.quarantine_table.selectedIndexes()}
+        for row in sorted(rows):
+            symbol = self.quarantine_table.item(row, 0).text()
+            self.trading_engine.release_symbol(symbol)
+            logging.info(f"{self.lang.__('symbol_released')}: {symbol}")
+        self.data_provider.request_update()
+
+    def update_performance_tab(self, stats):
+        """Performans sekmesini istatistik görüntüsünden güncelle"""
+        self.metrics_panel.update_metrics({
+            'total_trades': stats.total_trades,
+            'winning_trades': stats.winning_trades,
+            'losing_trades': stats.losing_trades,
+            'total_profit': stats.total_profit_usdt,
+            'win_rate': stats.win_rate,
+            'avg_profit': stats.average_profit_per_trade,
+            'max_drawdown': stats.max_drawdown_pct,
+            'profit_factor': stats.profit_factor,
+            'expectancy': stats.expectancy,
+            'sharpe': stats.sharpe,
+            'sortino': stats.sortino
+        })
+        
+        # En kârlı semboller üstte
+        rows = sorted(stats.per_symbol.items(), key=lambda item: item[1].profit, reverse=True)
+        self.symbol_stats_table.setRowCount(len(rows))
+        for i, (symbol, symbol_stats) in enumerate(rows):
+            win_rate = symbol_stats.wins / symbol_stats.trades * 100 if symbol_stats.trades else 0
+            profit_item = QTableWidgetItem(f"{symbol_stats.profit:+.2f}")
+            profit_item.setForeground(QColor("#00ff00" if symbol_stats.profit >= 0 else "#ff4444"))
+            
+            self.symbol_stats_table.setItem(i, 0, QTableWidgetItem(symbol))
+            self.symbol_stats_table.setItem(i, 1, QTableWidgetItem(str(symbol_stats.trades)))
+            self.symbol_stats_table.setItem(i, 2, QTableWidgetItem(f"{win_rate:.1f}%"))
+            self.symbol_stats_table.setItem(i, 3, profit_item)
+            self.symbol_stats_table.setItem(i, 4, QTableWidgetItem(f"{symbol_stats.best:+.2f}"))
+            self.symbol_stats_table.setItem(i, 5, QTableWidgetItem(f"{symbol_stats.worst:+.2f}"))
+
+    def update_latency_table(self, summary):
+        """Gecikme tablosunu güncelle"""
+        self.latency_table.setRowCount(len(summary))
+        
+        for i, row in enumerate(summary):
+            self.latency_table.setItem(i, 0, QTableWidgetItem(row['stage']))
+            self.latency_table.setItem(i, 1, QTableWidgetItem(str(row['count'])))
+            for col, key in enumerate(['avg_ms', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms'], 2):
+                self.latency_table.setItem(i, col, QTableWidgetItem(f"{row[key]:.1f}"))
+
+    def export_latency(self):
+        """Gecikme histogramlarını CSV dosyasına aktar"""
+        if not self.trading_engine:
+            return
+        
+        path, _ = QFileDialog.getSaveFileName(
+            self, self.lang.__('export'),
+            f"latency_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+            "CSV (*.csv)"
+        )
+        if not path:
+            return
+        
+        try:
+            self.trading_engine.latency.export_csv(path)
+            logging.info(f"{self.lang.__('latency_exported')}: {path}")
+        except Exception as e:
+            logging.error(f"{self.lang.__('export_error')}: {str(e)}")
+
     def update_analysis_table(self, scan_results, scanned, total):
-        """Analiz tablosunu güncelle"""
+        """Analiz tablosunu güncelle (köprüden son kareden bu yana gelen sonuçlar)"""
         try:
-            self.analysis_table.setRowCount(len(scan_results))
-            
-            for i, result in enumerate(scan_results):
-                # Coin
-                self.analysis_table.setItem(i, 0, QTableWidgetItem(result['symbol']))
-                
-                # Fiyat
-                self.analysis_table.setItem(i, 1, QTableWidgetItem(f"{result['price']:.8f}"))
-                
-                # 24s Değişim
-                change_item = QTableWidgetItem(f"{result['change_24h']:+.2f}%")
-                change_item.setForeground(QColor("#00ff00" if result['change_24h'] > 0 else "#ff4444"))
-                self.analysis_table.setItem(i, 2, change_item)
-                
-                # RSI
-                self.analysis_table.setItem(i, 3, QTableWidgetItem(f"{result['rsi']:.1f}"))
-                
-                # Hacim
-                self.analysis_table.setItem(i, 4, QTableWidgetItem(f"{result['volume']:,.0f}"))
-                
-                # Skor
-                score_item = QTableWidgetItem(f"{result['score']:.1f}")
-                if result['score'] >= 85:
-                    score_item.setForeground(QColor("#00ff00"))
-                elif result['score'] >= 70:
-                    score_item.setForeground(QColor("#00dd00"))
-                self.analysis_table.setItem(i, 5, score_item)
-                
-                # Sinyal
-                signal_item = QTableWidgetItem(result['signal'])
-                if "ALIM" in result['signal']:
-                    signal_item.setForeground(QColor("#00ff00"))
-                self.analysis_table.setItem(i, 6, signal_item)
-                
-                # Son Güncelleme
-                self.analysis_table.setItem(i, 7, QTableWidgetItem(
-                    result['timestamp'].strftime('%H:%M:%S')
-                ))
+            self.scanner_view.batch_update(scan_results)
                 
+            # Tarama tamamlandığında skor değişimlerini göster
+            if scanned == total and self.trading_engine:
+                movers = self.trading_engine.scan_history.top_movers(5)
+                if movers:
+                    self.top_movers_label.setText(f"{self.lang.__('top_movers')}: " + ", ".join(
+                        f"{symbol.split('/')[0]} {delta:+.1f}" for symbol, _, _, delta in movers
+                    ))
+            
             # İlerleme bilgisini güncelle
             self.scan_count_label.setText(f"Taranan Coin: {scanned}/{total}")
             self.last_scan_label.setText(f"Son Tarama: {datetime.now().strftime('%H:%M:%S')}")
             
         except Exception as e:
             logging.error(f"Analiz tablosu güncelleme hatası: {str(e)}")
-
-class QTextEditLogger(Handler):
-    def __init__(self, widget):
-        super().__init__()
-        self.widget = widget
-        self.widget.setReadOnly(True)
-
-    def emit(self, record):
-        msg = self.format(record)
-        try:
-            # Doğrudan QTextEdit'e yazma işlemi
-            if self.widget:
-                # Timestamp ekle
-                timestamp = datetime.now().strftime('%H:%M:%S')
-                formatted_msg = f"[{timestamp}] {msg}"
-                
-                # Thread-safe mesaj ekleme
-                from PyQt6.QtCore import QMetaObject, Qt, Q_ARG
-                QMetaObject.invokeMethod(
-                    self.widget,
-                    "append",
-                    Qt.ConnectionType.QueuedConnection,
-                    Q_ARG(str, formatted_msg)
-                )
-
-                # Otomatik scroll
-                scrollbar = self.widget.verticalScrollBar()
-                if scrollbar:
-                    scrollbar.setValue(scrollbar.maximum())
-                    
-        except Exception as e:
-            print(f"Log yazma hatası: {str(e)}")  # En azından konsola yazalım
\ No newline at end of file
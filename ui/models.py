@@ -0,0 +1,653 @@
+from PyQt6.QtCore import Qt, QAbstractProxyModel, QAbstractTableModel, QModelIndex, QSortFilterProxyModel, QTimer
+from PyQt6.QtGui import QColor
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+import numpy as np
+
+# Proxy modelin sıralamada kullandığı ham değer rolü
+SORT_ROLE = Qt.ItemDataRole.UserRole
+
+GREEN = QColor("#00ff00")
+LIGHT_GREEN = QColor("#00dd00")
+RED = QColor("#ff4444")
+
+class ColumnarTableModel(QAbstractTableModel):
+    """
+    Sütunsal numpy dizileri üzerinde tablo modeli.
+    Her alan ayrı bir dizide tutulur (sayılar 'f8', metinler object), satırlar KEY
+    alanına göre eşlenir. Güncellemeler vektörel karşılaştırılır ve sadece değişen
+    hücreler için dataChanged yayınlanır; yeni satırlar tek beginInsertRows ile eklenir.
+    Hücre metni sadece görünen satırlar için data() çağrısında üretilir.
+    """
+    KEY = 'symbol'
+    # (alan, dtype) listesi
+    FIELDS: Tuple[Tuple[str, str], ...] = ()
+    # Görünen sütunlar (alan adları, sırasıyla)
+    COLUMNS: Tuple[str, ...] = ()
+    # Görünmeyen alan -> değiştiğinde yenilenecek sütun
+    COLUMN_OF: Dict[str, str] = {}
+    # Alan -> biçimlendirici (ham değer -> metin); sayı alanlarında NaN her zaman "-"
+    FORMATS: Dict[str, Callable[[Any], str]] = {}
+    # Alan -> renklendirici (ham değer -> QColor veya None)
+    COLORS: Dict[str, Callable[[Any], Optional[QColor]]] = {}
+
+    def __init__(self, headers: Optional[Sequence[str]] = None, capacity: int = 64, parent=None):
+        super().__init__(parent)
+        self._dtypes = dict(self.FIELDS)
+        self._data = {field: self._empty(dtype, capacity) for field, dtype in self.FIELDS}
+        self._count = 0
+        self._index: Dict[Any, int] = {}
+        self._headers = list(headers or self.COLUMNS)
+
+        # Alan -> sütun indeksi (görünmeyen alanlar bağlı oldukları sütuna)
+        self._field_column = {field: i for i, field in enumerate(self.COLUMNS)}
+        for field, column in self.COLUMN_OF.items():
+            self._field_column[field] = self.COLUMNS.index(column)
+
+        # Sütun başına biçimlendirici ve renklendirici bir kez hazırlanır
+        formats = self.formats()
+        colors = self.colors()
+        self._formatters = tuple(self._formatter(field, formats.get(field)) for field in self.COLUMNS)
+        self._colorers = tuple(colors.get(field) for field in self.COLUMNS)
+
+    def formats(self) -> Dict[str, Callable[[Any], str]]:
+        """Sütun biçimlendiricileri (örneğe bağlı olanlar için alt sınıflar genişletir)"""
+        return self.FORMATS
+
+    def colors(self) -> Dict[str, Callable[[Any], Optional[QColor]]]:
+        """Sütun renklendiricileri"""
+        return self.COLORS
+
+    def _formatter(self, field: str, fmt: Optional[Callable[[Any], str]]) -> Callable[[Any], str]:
+        if self._dtypes[field] != 'f8':
+            return fmt or str
+        fmt = fmt or (lambda value: f"{value:.8f}")
+        return lambda value: "-" if np.isnan(value) else fmt(value)
+
+    @staticmethod
+    def _empty(dtype: str, size: int) -> np.ndarray:
+        return np.full(size, np.nan) if dtype == 'f8' else np.full(size, '', dtype=object)
+
+    def _grow(self, needed: int) -> None:
+        capacity = len(self._data[self.KEY])
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for field, dtype in self.FIELDS:
+            data = self._empty(dtype, capacity)
+            data[:self._count] = self._data[field][:self._count]
+            self._data[field] = data
+
+    def _convert(self, field: str, value: Any) -> Any:
+        if self._dtypes[field] != 'f8':
+            return '' if value is None else value
+        if value is None:
+            return np.nan
+        if isinstance(value, datetime):
+            return value.timestamp()
+        return value
+
+    # Qt arayüzü
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._count
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self._headers[section] if section < len(self._headers) else None
+        return None
+
+    def set_headers(self, headers: Sequence[str]) -> None:
+        self._headers = list(headers)
+        self.headerDataChanged.emit(Qt.Orientation.Horizontal, 0, len(self.COLUMNS) - 1)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        return self.cell(index.row(), index.column(), role)
+
+    def cell(self, row: int, column: int, role=Qt.ItemDataRole.DisplayRole):
+        """Satır/sütun numarasıyla hücre verisi (proxy'ler indeks üretmeden okur)"""
+        if row >= self._count:
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.display(row, column)
+        if role == Qt.ItemDataRole.ForegroundRole:
+            colorer = self._colorers[column]
+            return colorer(self._data[self.COLUMNS[column]][row]) if colorer else None
+        if role == SORT_ROLE:
+            return self.sort_value(row, column)
+        return None
+
+    def sort_value(self, row: int, column: int) -> Any:
+        """Sıralamada kullanılan ham değer"""
+        field = self.COLUMNS[column]
+        value = self._data[field][row]
+        if self._dtypes[field] == 'f8':
+            # NaN sıralamayı bozmasın, en sona düşsün
+            return float('-inf') if np.isnan(value) else float(value)
+        return value
+
+    def display(self, row: int, column: int) -> str:
+        """Hücre metni (sütunun hazır biçimlendiricisiyle)"""
+        return self._formatters[column](self._data[self.COLUMNS[column]][row])
+
+    def value(self, row: int, field: str) -> Any:
+        return self._data[field][row]
+
+    def key_at(self, row: int) -> Any:
+        return self._data[self.KEY][row]
+
+    def column_values(self, field: str) -> np.ndarray:
+        """Alanın dolu satırları (kopya değil, salt okunur kullanılmalı)"""
+        return self._data[field][:self._count]
+
+    def record_key(self, record: Mapping) -> Any:
+        """Kaydın satır anahtarı"""
+        return record[self.KEY]
+
+    # Güncelleme
+    def update(self, records: Sequence[Mapping]) -> None:
+        """
+        Kayıtları KEY alanına göre ekle veya güncelle.
+        Mevcut satırlarda sadece kayıtta bulunan alanlar değişir (kısmi güncelleme).
+        """
+        if not records:
+            return
+        # Aynı anahtarın son kaydı geçerlidir
+        latest = {self.record_key(record): record for record in records}
+
+        existing = [(self._index[key], record) for key, record in latest.items() if key in self._index]
+        new = [(key, record) for key, record in latest.items() if key not in self._index]
+
+        if existing:
+            self._update_rows(existing)
+        if new:
+            self._insert_rows(new)
+
+    def _update_rows(self, existing: List[Tuple[int, Mapping]]) -> None:
+        rows = np.fromiter((row for row, _ in existing), dtype=np.intp, count=len(existing))
+        changed = np.zeros((len(rows), len(self.COLUMNS)), dtype=bool)
+
+        for field, dtype in self.FIELDS:
+            if field == self.KEY or field not in self._field_column:
+                continue
+            old = self._data[field][rows]
+            if not any(field in record for _, record in existing):
+                continue
+            values = [
+                self._convert(field, record[field]) if field in record else old[i]
+                for i, (_, record) in enumerate(existing)
+            ]
+            if dtype == 'f8':
+                new = np.asarray(values, dtype='f8')
+                diff = (old != new) & ~(np.isnan(old) & np.isnan(new))
+            else:
+                new = np.empty(len(values), dtype=object)
+                new[:] = values
+                diff = old != new
+            if diff.any():
+                self._data[field][rows[diff]] = new[diff]
+                changed[:, self._field_column[field]] |= diff
+
+        # Her satır için sadece değişen ilk ve son sütun arası yenilenir
+        changed_rows = np.flatnonzero(changed.any(axis=1))
+        last_column = len(self.COLUMNS) - 1
+        for i in changed_rows:
+            columns = changed[i]
+            first = int(np.argmax(columns))
+            last = last_column - int(np.argmax(columns[::-1]))
+            row = int(rows[i])
+            self.dataChanged.emit(self.index(row, first), self.index(row, last))
+
+    def _insert_rows(self, new: List[Tuple[Any, Mapping]]) -> None:
+        start = self._count
+        end = start + len(new)
+        self.beginInsertRows(QModelIndex(), start, end - 1)
+        self._grow(end)
+        for field, _ in self.FIELDS:
+            if field == self.KEY:
+                values = [key for key, _ in new]
+            else:
+                values = [self._convert(field, record.get(field)) for _, record in new]
+            if self._dtypes[field] == 'f8':
+                self._data[field][start:end] = values
+            else:
+                column = np.empty(len(values), dtype=object)
+                column[:] = values
+                self._data[field][start:end] = column
+        for i, (key, _) in enumerate(new):
+            self._index[key] = start + i
+        self._count = end
+        self.endInsertRows()
+
+    def sync(self, records: Sequence[Mapping]) -> None:
+        """Tabloyu kayıtlarla eşitle: olmayan anahtarların satırlarını sil, kalanları güncelle"""
+        keys = {self.record_key(record) for record in records}
+        removed = sorted((row for key, row in self._index.items() if key not in keys), reverse=True)
+
+        # Ardışık satırlar tek seferde, sondan başa doğru silinir
+        i = 0
+        while i < len(removed):
+            last = first = removed[i]
+            while i + 1 < len(removed) and removed[i + 1] == first - 1:
+                i += 1
+                first = removed[i]
+            self._remove_rows(first, last)
+            i += 1
+
+        self.update(records)
+
+    def _remove_rows(self, first: int, last: int) -> None:
+        self.beginRemoveRows(QModelIndex(), first, last)
+        count = last - first + 1
+        for field, dtype in self.FIELDS:
+            data = self._data[field]
+            data[first:self._count - count] = data[last + 1:self._count]
+            data[self._count - count:self._count] = np.nan if dtype == 'f8' else ''
+        self._count -= count
+        self._index = {self._data[self.KEY][row]: row for row in range(self._count)}
+        self.endRemoveRows()
+
+    def clear(self) -> None:
+        """Tüm satırları sil"""
+        self.beginResetModel()
+        self._count = 0
+        self._index.clear()
+        self.endResetModel()
+
+class AnalysisTableModel(ColumnarTableModel):
+    """Tarama sonuçları (sembol ve periyot başına tek satır, anahtar "SEMBOL_periyot")"""
+    KEY = 'key'
+    FIELDS = (
+        ('key', 'O'), ('symbol', 'O'), ('timeframe', 'O'), ('price', 'f8'), ('change_24h', 'f8'),
+        ('rsi', 'f8'), ('volume', 'f8'), ('score', 'f8'), ('signal', 'O'), ('timestamp', 'f8')
+    )
+    COLUMNS = ('symbol', 'timeframe', 'price', 'change_24h', 'rsi', 'volume', 'score', 'signal', 'timestamp')
+    FORMATS = {
+        'change_24h': lambda value: f"{value:+.2f}%",
+        'rsi': lambda value: f"{value:.1f}",
+        'volume': lambda value: f"{value:,.0f}",
+        'score': lambda value: f"{value:.1f}",
+        'timestamp': lambda value: datetime.fromtimestamp(value).strftime('%H:%M:%S')
+    }
+    COLORS = {
+        'change_24h': lambda value: GREEN if value > 0 else RED,
+        'score': lambda value: GREEN if value >= 85 else LIGHT_GREEN if value >= 70 else None
+    }
+
+    def __init__(self, lang, headers: Optional[Sequence[str]] = None, capacity: int = 64, parent=None):
+        self.lang = lang
+        super().__init__(headers, capacity=capacity, parent=parent)
+
+    def colors(self) -> Dict[str, Callable[[Any], Optional[QColor]]]:
+        # Sinyal metni analizcinin diliyle üretilir, alım sinyalleri çeviriyle karşılaştırılır
+        return {**self.COLORS, 'signal': self._signal_color}
+
+    def _signal_color(self, value: str) -> Optional[QColor]:
+        return GREEN if value in (self.lang.__('strong_buy'), self.lang.__('buy_signal')) else None
+
+    def record_key(self, record: Mapping) -> str:
+        return f"{record['symbol']}_{record.get('timeframe', '')}"
+
+class TradesTableModel(ColumnarTableModel):
+    """Aktif işlemler"""
+    KEY = 'symbol'
+    FIELDS = (
+        ('symbol', 'O'), ('entry_price', 'f8'), ('current_price', 'f8'), ('amount', 'f8'),
+        ('profit_percent', 'f8'), ('stop_loss', 'f8'), ('take_profit', 'f8')
+    )
+    COLUMNS = ('symbol', 'entry_price', 'current_price', 'amount', 'profit_percent', 'stop_loss', 'take_profit')
+    FORMATS = {'profit_percent': lambda value: f"{value:+.2f}%"}
+    COLORS = {'profit_percent': lambda value: None if np.isnan(value) else GREEN if value > 0 else RED}
+
+class HistoryTableModel(ColumnarTableModel):
+    """
+    İşlem geçmişi (depodaki işlem kimliğine göre).
+    Sadece eklenir; eski işlemler görünüm sona kaydırıldıkça fetchMore ile sayfa sayfa gelir.
+    """
+    KEY = 'id'
+    FIELDS = (
+        ('id', 'O'), ('timestamp', 'f8'), ('symbol', 'O'), ('type', 'O'), ('price', 'f8'),
+        ('amount', 'f8'), ('total_usdt', 'f8'), ('profit', 'f8'), ('profit_percentage', 'f8'),
+        ('status', 'O')
+    )
+    COLUMNS = ('timestamp', 'symbol', 'type', 'price', 'amount', 'total_usdt', 'profit', 'status')
+    COLUMN_OF = {'profit_percentage': 'profit'}
+    FORMATS = {
+        'timestamp': lambda value: datetime.fromtimestamp(value).strftime('%Y-%m-%d %H:%M:%S'),
+        'total_usdt': lambda value: f"{value:.2f}"
+    }
+    COLORS = {
+        'type': lambda value: GREEN if value == 'buy' else RED,
+        'profit': lambda value: None if np.isnan(value) else GREEN if value > 0 else RED
+    }
+
+    # Durum kodu -> çeviri anahtarı
+    STATUS_KEYS = {
+        'open_position': 'open_position',
+        'closed_position': 'closed_position',
+        'TAKE-PROFIT': 'take_profit_reason',
+        'STOP-LOSS': 'stop_loss_reason',
+        'manual_stop': 'manual_stop'
+    }
+
+    def __init__(self, lang, headers: Optional[Sequence[str]] = None, parent=None):
+        self.lang = lang
+        super().__init__(headers, parent=parent)
+
+        # Görünüm sona kaydırıldığında eski işlemleri isteyen geri çağrı
+        self.fetch_older: Optional[Callable[[], None]] = None
+        self._has_more = False
+        self._fetching = False
+        self._profit_column = self.COLUMNS.index('profit')
+
+    def set_paging(self, has_more: bool, fetched: bool = False) -> None:
+        """Eski işlem sayfalama durumunu güncelle (fetched: istenen eski sayfa geldi)"""
+        if fetched:
+            self._fetching = False
+        self._has_more = has_more
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and self._has_more and not self._fetching and self.fetch_older is not None
+
+    def fetchMore(self, parent=QModelIndex()) -> None:
+        # Okuma arka planda yapılır, sonuç sonraki farkla gelir
+        self._fetching = True
+        self.fetch_older()
+
+    def formats(self) -> Dict[str, Callable[[Any], str]]:
+        # Çevrilen sütunlar dil yöneticisine bağlıdır
+        return {
+            **self.FORMATS,
+            'type': lambda value: self.lang.__('buy') if value == 'buy' else self.lang.__('sell'),
+            'status': self._status_text
+        }
+
+    def _status_text(self, value: str) -> str:
+        key = self.STATUS_KEYS.get(value)
+        return self.lang.__(key) if key else value
+
+    def display(self, row: int, column: int) -> str:
+        # Kâr sütunu yüzdeyi de gösterir
+        if column == self._profit_column:
+            value = self._data['profit'][row]
+            if np.isnan(value):
+                return "-"
+            return f"{value:.2f} ({self._data['profit_percentage'][row]:.2f}%)"
+        return super().display(row, column)
+
+    def retranslate(self) -> None:
+        """Dil değişince çevrilen sütunları yenile"""
+        if self._count:
+            for field in ('type', 'status'):
+                column = self.COLUMNS.index(field)
+                self.dataChanged.emit(self.index(0, column), self.index(self._count - 1, column))
+
+def sorted_proxy(model: ColumnarTableModel, filter_field: str = 'symbol', parent=None) -> QSortFilterProxyModel:
+    """Ham değerlere göre sıralayan, filter_field sütununda metin filtresi uygulayan proxy"""
+    proxy = QSortFilterProxyModel(parent)
+    proxy.setSourceModel(model)
+    proxy.setSortRole(SORT_ROLE)
+    proxy.setDynamicSortFilter(True)
+    proxy.setFilterKeyColumn(model.COLUMNS.index(filter_field))
+    proxy.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+    return proxy
+
+class ScannerProxyModel(QAbstractProxyModel):
+    """
+    Tarama tablosu proxy'si: sembol metni, periyot, sinyal, en düşük skor ve hacim
+    filtreleri ile çok sütunlu sıralama.
+    Görünen satırlar modelin sütun dizileri üzerinde vektörel hesaplanır (filtre maskesi
+    ve np.lexsort); satır başına Python karşılaştırması yapılmaz. Kaynak değişiklikleri
+    olay döngüsünün sonunda tek yeniden hesaplamada birleşir. Filtreden çıkan satırlar
+    rowsRemoved, giren satırlar rowsInserted ile, sıra değişimi layoutChanged ile
+    yayınlanır; değişen hücreler kaynak aralıkları eşlenerek tek tek yenilenir.
+    Değişiklik çok dağınıksa model sıfırlanır.
+    """
+    # Bundan fazla ardışık silme/ekleme aralığında model sıfırlanır,
+    # değişen hücre aralığında tek kapsayıcı dataChanged yayınlanır
+    MAX_ROW_RUNS = 64
+
+    def __init__(self, model: ColumnarTableModel, parent=None):
+        super().__init__(parent)
+        self._filters = {'text': '', 'timeframe': '', 'signal': '', 'min_score': 0.0, 'min_volume': 0.0}
+        # (sütun, yön) listesi; ilki birincil sıralama
+        self._sort_keys: List[Tuple[int, Qt.SortOrder]] = []
+        # Görünen sıra -> kaynak satır ve kaynak satır -> görünen sıra (-1 = elendi)
+        self._order = np.empty(0, dtype=np.intp)
+        self._position = np.empty(0, dtype=np.intp)
+        # Son yeniden hesaplamadan beri değişen kaynak aralıkları (ilk/son satır, ilk/son sütun)
+        self._changed: List[Tuple[int, int, int, int]] = []
+
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.timeout.connect(self.refresh)
+        # Kaynak modelin yanıt verdiği roller
+        self._roles = {Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ForegroundRole, SORT_ROLE}
+        self.setSourceModel(model)
+
+    def setSourceModel(self, model: ColumnarTableModel) -> None:
+        self.beginResetModel()
+        super().setSourceModel(model)
+        self._cell = model.cell
+        self._columns = model.columnCount()
+        # Eklemeler (sona) ve değişiklikler birleştirilir; silme ve sıfırlamada kaynak
+        # satır numaraları kaydığı için proxy de sıfırlanır
+        model.rowsInserted.connect(self._schedule_refresh)
+        model.dataChanged.connect(self._on_source_data_changed)
+        model.rowsRemoved.connect(self._reset)
+        model.modelReset.connect(self._reset)
+        self._order, self._position = self._compute()
+        self._changed = []
+        self.endResetModel()
+
+    # Qt arayüzü
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._order)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._columns
+
+    def index(self, row: int, column: int, parent=QModelIndex()) -> QModelIndex:
+        if parent.isValid() or not (0 <= row < len(self._order)) or not (0 <= column < self._columns):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index=QModelIndex()) -> QModelIndex:
+        return QModelIndex()
+
+    def mapToSource(self, proxy_index: QModelIndex) -> QModelIndex:
+        if not proxy_index.isValid() or proxy_index.row() >= len(self._order):
+            return QModelIndex()
+        return self.sourceModel().index(int(self._order[proxy_index.row()]), proxy_index.column())
+
+    def mapFromSource(self, source_index: QModelIndex) -> QModelIndex:
+        row = source_index.row()
+        if not source_index.isValid() or row >= len(self._position) or self._position[row] < 0:
+            return QModelIndex()
+        return self.index(int(self._position[row]), source_index.column())
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        model = self.sourceModel()
+        return model.headerData(section, orientation, role) if model is not None else None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        # Salt okunur tablo; kaynağa eşleme gerekmez
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        # Çizimde her hücre için birçok rol sorulur; kaynak indeksi üretilmez
+        if role not in self._roles or not index.isValid():
+            return None
+        return self._cell(int(self._order[index.row()]), index.column(), role)
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder) -> None:
+        self.set_sort_keys([(column, order)] if column >= 0 else [])
+
+    # Filtre ve sıralama
+    def set_filters(self, **filters) -> None:
+        """Verilen filtreleri değiştir (boş metin / 0 = filtre yok)"""
+        unknown = set(filters) - set(self._filters)
+        if unknown:
+            raise KeyError(f"Bilinmeyen filtre: {', '.join(sorted(unknown))}")
+        filters['text'] = filters.get('text', self._filters['text']).strip().lower()
+        if filters.items() <= self._filters.items():
+            return
+        self._filters.update(filters)
+        self.refresh()
+
+    @property
+    def sort_keys(self) -> List[Tuple[int, Qt.SortOrder]]:
+        return list(self._sort_keys)
+
+    def set_sort_keys(self, keys: Sequence[Tuple[int, Qt.SortOrder]]) -> None:
+        """Çok sütunlu sıralamayı ayarla (birincil anahtar ilk sırada)"""
+        self._sort_keys = list(keys)
+        self.refresh()
+
+    def _schedule_refresh(self, *args) -> None:
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start(0)
+
+    def _on_source_data_changed(self, top_left: QModelIndex, bottom_right: QModelIndex, *args) -> None:
+        self._changed.append((top_left.row(), bottom_right.row(), top_left.column(), bottom_right.column()))
+        self._schedule_refresh()
+
+    def _reset(self, *args) -> None:
+        self._refresh_timer.stop()
+        self.beginResetModel()
+        self._order, self._position = self._compute()
+        self._changed = []
+        self.endResetModel()
+
+    def _mask(self, model: ColumnarTableModel) -> np.ndarray:
+        filters = self._filters
+        mask = np.ones(model.rowCount(), dtype=bool)
+        # NaN skor/hacim eşik varken elenir
+        if filters['min_score']:
+            mask &= model.column_values('score') >= filters['min_score']
+        if filters['min_volume']:
+            mask &= model.column_values('volume') >= filters['min_volume']
+        if filters['signal']:
+            mask &= model.column_values('signal') == filters['signal']
+        if filters['timeframe']:
+            mask &= model.column_values('timeframe') == filters['timeframe']
+        if filters['text']:
+            text = filters['text']
+            symbols = model.column_values('symbol')
+            mask &= np.fromiter((text in symbol.lower() for symbol in symbols), dtype=bool, count=len(symbols))
+        return mask
+
+    def _sort_key(self, model: ColumnarTableModel, rows: np.ndarray, column: int,
+                  order: Qt.SortOrder) -> np.ndarray:
+        values = model.column_values(model.COLUMNS[column])[rows]
+        if values.dtype == object:
+            # Metinler sıra numarasına çevrilir
+            values = np.unique(values.astype(str), return_inverse=True)[1].astype('f8')
+        else:
+            # NaN yöne bakılmaksızın en sona düşsün
+            values = np.where(np.isnan(values), -np.inf if order == Qt.SortOrder.DescendingOrder else np.inf, values)
+        return -values if order == Qt.SortOrder.DescendingOrder else values
+
+    def _compute(self) -> Tuple[np.ndarray, np.ndarray]:
+        model = self.sourceModel()
+        count = model.rowCount()
+        rows = np.flatnonzero(self._mask(model))
+        if self._sort_keys and len(rows) > 1:
+            # lexsort son anahtarı birincil kabul eder; eşitlikte kaynak sırası korunur
+            keys = [self._sort_key(model, rows, column, order) for column, order in reversed(self._sort_keys)]
+            rows = rows[np.lexsort(keys)]
+        position = np.full(count, -1, dtype=np.intp)
+        position[rows] = np.arange(len(rows))
+        return rows, position
+
+    def _set_order(self, order: np.ndarray) -> None:
+        position = np.full(self.sourceModel().rowCount(), -1, dtype=np.intp)
+        position[order] = np.arange(len(order))
+        self._order, self._position = order, position
+
+    @staticmethod
+    def _runs(rows: np.ndarray) -> List[Tuple[int, int]]:
+        """Artan satır numaralarını ardışık (ilk, son) aralıklarına böl"""
+        if not len(rows):
+            return []
+        breaks = np.flatnonzero(np.diff(rows) != 1)
+        starts = np.concatenate(([0], breaks + 1))
+        ends = np.concatenate((breaks, [len(rows) - 1]))
+        return [(int(rows[a]), int(rows[b])) for a, b in zip(starts, ends)]
+
+    def refresh(self, *args) -> None:
+        """Görünen satırları yeniden hesapla ve değişiklikleri yayınla"""
+        self._refresh_timer.stop()
+        changed, self._changed = self._changed, []
+        order, position = self._compute()
+
+        if not np.array_equal(order, self._order):
+            # Filtreden çıkan görünen satırlar ve giren kaynak satırlar
+            removed = np.flatnonzero(~np.isin(self._order, order))
+            added = order[~np.isin(order, self._order)]
+            removed_runs = self._runs(removed)
+            if len(removed_runs) + bool(len(added)) > self.MAX_ROW_RUNS:
+                self.beginResetModel()
+                self._order, self._position = order, position
+                self.endResetModel()
+                return
+
+            # Silmeler sondan başa, satır numaraları kaymadan
+            for first, last in reversed(removed_runs):
+                self.beginRemoveRows(QModelIndex(), first, last)
+                self._set_order(np.delete(self._order, np.s_[first:last + 1]))
+                self.endRemoveRows()
+
+            # Yeni satırlar sona eklenir, yerlerine sıralama adımında taşınır
+            if len(added):
+                count = len(self._order)
+                self.beginInsertRows(QModelIndex(), count, count + len(added) - 1)
+                self._set_order(np.concatenate((self._order, added)))
+                self.endInsertRows()
+
+            if not np.array_equal(order, self._order):
+                self._reorder(order, position)
+
+        self._position = position
+        self._emit_changed(changed)
+
+    def _reorder(self, order: np.ndarray, position: np.ndarray) -> None:
+        """Aynı satır kümesinin yeni sırasını layoutChanged ile yayınla"""
+        self.layoutAboutToBeChanged.emit()
+        old_indexes = self.persistentIndexList()
+        sources = [(int(self._order[index.row()]), index.column()) for index in old_indexes]
+        self._order, self._position = order, position
+        self.changePersistentIndexList(old_indexes, [
+            self.index(int(position[row]), column) for row, column in sources
+        ])
+        self.layoutChanged.emit()
+
+    def _emit_changed(self, changed: List[Tuple[int, int, int, int]]) -> None:
+        """
+        Değişen kaynak aralıklarını görünen sıraya eşleyip hücre hücre yenile.
+        Aralık çok fazlaysa hepsini kapsayan tek bir dataChanged yayınlanır.
+        """
+        ranges = []
+        position = self._position
+        for top, bottom, left, right in changed:
+            if top == bottom:
+                # Kaynak model satır başına ayrı yayınlar; tek satır doğrudan eşlenir
+                if top < len(position) and position[top] >= 0:
+                    row = int(position[top])
+                    ranges.append((row, row, left, right))
+                continue
+            rows = position[top:bottom + 1]
+            rows = np.sort(rows[rows >= 0])
+            ranges.extend((first, last, left, right) for first, last in self._runs(rows))
+        if len(ranges) > self.MAX_ROW_RUNS:
+            first, last, left, right = zip(*ranges)
+            ranges = [(min(first), max(last), min(left), max(right))]
+        for first, last, left, right in ranges:
+            self.dataChanged.emit(self.index(first, left), self.index(last, right))
@@ -0,0 +1,61 @@
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from typing import Dict, List, Optional, Tuple
+import threading
+
+class ScanBridge(QObject):
+    """
+    Trading thread'inden gelen tarama sonuçlarını GUI thread'ine taşıyan köprü.
+    push() herhangi bir thread'den çağrılabilir; sadece son çağrıdan bu yana eklenen
+    sonuçlar kuyruğa alınır ve aynı sembol/periyodun yalnızca son sonucu tutulur.
+    GUI thread'indeki zamanlayıcı kuyruğu en fazla saniyede fps kez boşaltır ve
+    birikenleri tek scan_batch sinyaliyle gönderir.
+    """
+    # (yeni/değişen sonuçlar, taranan, toplam)
+    scan_batch = pyqtSignal(object, int, int)
+
+    def __init__(self, fps: float = 10, parent=None):
+        super().__init__(parent)
+        self._lock = threading.Lock()
+        self._pending: Dict[Tuple[str, Optional[str]], dict] = {}
+        self._progress = None
+        self._source: Optional[List[dict]] = None
+        self._sent = 0
+
+        # Zamanlayıcı köprünün oluşturulduğu (GUI) thread'inde çalışır
+        self._timer = QTimer(self)
+        self._timer.setInterval(max(1, int(1000 / fps)))
+        self._timer.timeout.connect(self.flush)
+        self._timer.start()
+
+    def set_fps(self, fps: float) -> None:
+        self._timer.setInterval(max(1, int(1000 / fps)))
+
+    def push(self, scan_results: List[dict], scanned: int, total: int) -> None:
+        """Engine'in scan_callback'i: taramanın biriken sonuç listesini al (thread-safe)"""
+        with self._lock:
+            # Her tarama yeni bir liste ile başlar
+            if scan_results is not self._source:
+                self._source = scan_results
+                self._sent = 0
+            for result in scan_results[self._sent:]:
+                self._pending[(result['symbol'], result.get('timeframe'))] = result
+            self._sent = len(scan_results)
+            self._progress = (scanned, total)
+
+    def flush(self) -> None:
+        """Biriken sonuçları GUI thread'inde tek sinyalle gönder"""
+        if self._progress is None:
+            return
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            scanned, total = self._progress
+            self._progress = None
+        self.scan_batch.emit(list(pending.values()), scanned, total)
+
+    def reset(self) -> None:
+        """Bekleyen sonuçları at (engine değiştiğinde)"""
+        with self._lock:
+            self._pending = {}
+            self._progress = None
+            self._source = None
+            self._sent = 0
@@ -0,0 +1,159 @@
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QComboBox,
+                           QDoubleSpinBox, QLabel, QHeaderView, QApplication)
+from PyQt6.QtCore import Qt
+from typing import Iterable, Mapping
+
+from ui.models import AnalysisTableModel, ScannerProxyModel
+from ui.widgets import OptimizedTableWidget
+
+# Sinyal filtresi seçenekleri (analizcinin ürettiği çeviri anahtarları)
+SIGNAL_KEYS = ('strong_buy', 'buy_signal', 'neutral', 'sell_signal')
+
+class ScannerView(QWidget):
+    """
+    Piyasa tarayıcısı görünümü.
+    Tablo sanal çizilir (sadece görünen satırlar), filtreler ve çok sütunlu sıralama
+    proxy üzerinde istemci tarafında uygulanır; canlı tarama sonuçları toplu
+    güncellemeyle modele yazılır. Başlığa tıklamak birincil sıralamayı, Shift ile
+    tıklamak ikincil sıralama anahtarı ekler veya yönünü değiştirir.
+    """
+    def __init__(self, model: AnalysisTableModel, lang_manager, throttle_ms: int = 100, parent=None):
+        super().__init__(parent)
+        self.model = model
+        self.lang = lang_manager
+        self._timeframes = set()
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        # Filtreler
+        filter_layout = QHBoxLayout()
+        self.filter_input = QLineEdit()
+        self.filter_input.setPlaceholderText("Coin")
+        self.filter_input.setClearButtonEnabled(True)
+        self.filter_input.textChanged.connect(lambda text: self.proxy.set_filters(text=text))
+        filter_layout.addWidget(self.filter_input)
+
+        self.timeframe_combo = QComboBox()
+        self.timeframe_combo.addItem(self.lang.__('all'), '')
+        self.timeframe_combo.currentIndexChanged.connect(
+            lambda: self.proxy.set_filters(timeframe=self.timeframe_combo.currentData() or '')
+        )
+        filter_layout.addWidget(self.timeframe_combo)
+
+        self.signal_combo = QComboBox()
+        self.signal_combo.addItem(self.lang.__('all'), '')
+        for key in SIGNAL_KEYS:
+            self.signal_combo.addItem(self.lang.__(key), self.lang.__(key))
+        self.signal_combo.currentIndexChanged.connect(
+            lambda: self.proxy.set_filters(signal=self.signal_combo.currentData() or '')
+        )
+        filter_layout.addWidget(self.signal_combo)
+
+        self.min_score_label = QLabel(self.lang.__('min_score'))
+        filter_layout.addWidget(self.min_score_label)
+        self.min_score_spin = QDoubleSpinBox()
+        self.min_score_spin.setRange(0, 100)
+        self.min_score_spin.setDecimals(1)
+        self.min_score_spin.valueChanged.connect(lambda value: self.proxy.set_filters(min_score=value))
+        filter_layout.addWidget(self.min_score_spin)
+
+        self.min_volume_label = QLabel(self.lang.__('min_volume'))
+        filter_layout.addWidget(self.min_volume_label)
+        self.min_volume_spin = QDoubleSpinBox()
+        self.min_volume_spin.setRange(0, 1e12)
+        self.min_volume_spin.setDecimals(0)
+        self.min_volume_spin.setSingleStep(10000)
+        self.min_volume_spin.setGroupSeparatorShown(True)
+        self.min_volume_spin.setSuffix(" USDT")
+        self.min_volume_spin.valueChanged.connect(lambda value: self.proxy.set_filters(min_volume=value))
+        filter_layout.addWidget(self.min_volume_spin)
+
+        self.count_label = QLabel()
+        filter_layout.addWidget(self.count_label)
+        layout.addLayout(filter_layout)
+
+        # Tablo
+        self.proxy = ScannerProxyModel(model)
+        self.table = OptimizedTableWidget(model, throttle_ms=throttle_ms, proxy=self.proxy,
+                                          lang_manager=self.lang)
+        # Sıralama Qt yerine başlık tıklamalarıyla yönetilir
+        self.table.setSortingEnabled(False)
+        header = self.table.horizontalHeader()
+        header.setSectionsClickable(True)
+        header.setSortIndicatorShown(True)
+        header.sectionClicked.connect(self._on_header_clicked)
+        # Sabit satır yüksekliği: görünmeyen satırlar ölçülmez
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(24)
+        layout.addWidget(self.table)
+
+        for signal in (self.proxy.rowsInserted, self.proxy.rowsRemoved, self.proxy.modelReset,
+                       self.proxy.layoutChanged):
+            signal.connect(self._update_count)
+
+        self._set_sort_keys([(model.COLUMNS.index('score'), Qt.SortOrder.DescendingOrder)])
+        self._update_count()
+
+    def batch_update(self, records: Iterable[Mapping]) -> None:
+        """Tarama sonuçlarını toplu güncellemeye ver"""
+        records = list(records)
+        for record in records:
+            timeframe = record.get('timeframe')
+            if timeframe and timeframe not in self._timeframes:
+                self._timeframes.add(timeframe)
+                self.timeframe_combo.addItem(timeframe, timeframe)
+        self.table.batch_update(records)
+
+    def _on_header_clicked(self, column: int) -> None:
+        keys = self.proxy.sort_keys
+        columns = [key_column for key_column, _ in keys]
+
+        def toggled(order):
+            if order == Qt.SortOrder.DescendingOrder:
+                return Qt.SortOrder.AscendingOrder
+            return Qt.SortOrder.DescendingOrder
+
+        if QApplication.keyboardModifiers() & Qt.KeyboardModifier.ShiftModifier and keys:
+            # İkincil anahtar ekle veya yönünü değiştir
+            if column in columns:
+                i = columns.index(column)
+                keys[i] = (column, toggled(keys[i][1]))
+            else:
+                keys.append((column, Qt.SortOrder.DescendingOrder))
+        elif columns and columns[0] == column:
+            keys = [(column, toggled(keys[0][1]))]
+        else:
+            keys = [(column, Qt.SortOrder.DescendingOrder)]
+        self._set_sort_keys(keys)
+
+    def _set_sort_keys(self, keys) -> None:
+        self.proxy.set_sort_keys(keys)
+        column, order = keys[0]
+        self.table.horizontalHeader().setSortIndicator(column, order)
+        self._update_sort_tooltip()
+
+    def _update_sort_tooltip(self) -> None:
+        # İkincil anahtarlar başlık ipucunda gösterilir
+        self.table.horizontalHeader().setToolTip(" > ".join(
+            f"{self.model.headerData(key_column, Qt.Orientation.Horizontal)} "
+            f"{'↓' if key_order == Qt.SortOrder.DescendingOrder else '↑'}"
+            for key_column, key_order in self.proxy.sort_keys
+        ))
+
+    def _update_count(self, *args) -> None:
+        self.count_label.setText(f"{self.lang.__('shown')}: {self.proxy.rowCount()}/{self.model.rowCount()}")
+
+    def update_texts(self) -> None:
+        """Dil değişince etiketleri güncelle"""
+        self.timeframe_combo.setItemText(0, self.lang.__('all'))
+        self.signal_combo.setItemText(0, self.lang.__('all'))
+        for i, key in enumerate(SIGNAL_KEYS, start=1):
+            self.signal_combo.setItemText(i, self.lang.__(key))
+            self.signal_combo.setItemData(i, self.lang.__(key))
+        if self.signal_combo.currentIndex() > 0:
+            self.proxy.set_filters(signal=self.signal_combo.currentData())
+        self.min_score_label.setText(self.lang.__('min_score'))
+        self.min_volume_label.setText(self.lang.__('min_volume'))
+        self._update_sort_tooltip()
+        self._update_count()
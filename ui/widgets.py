@@ -1,48 +1,74 @@
-from PyQt6.QtWidgets import (QTableWidget, QHeaderView, QFrame, 
-                           QVBoxLayout, QLabel, QStatusBar, QGridLayout)
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtWidgets import (QTableView, QHeaderView, QFrame, 
+                           QVBoxLayout, QLabel, QGridLayout)
+from PyQt6.QtCore import Qt, QTimer, QAbstractProxyModel, pyqtSignal
 from PyQt6.QtGui import QColor, QPalette
 import logging
-from typing import Dict, Any
+import time
+from typing import Any, Dict, Iterable, Mapping, Optional
 
-class OptimizedTableWidget(QTableWidget):
+from ui.models import ColumnarTableModel, sorted_proxy
+from utils.language_manager import LanguageManager
+
+class OptimizedTableWidget(QTableView):
     """
     Optimize edilmiş tablo widget'ı.
-    Büyük veri setleri için performans iyileştirmeleri içerir.
+    Sütunsal bir tablo modelini sıralanabilir, filtrelenebilir proxy üzerinden gösterir;
+    sadece görünen satırlar çizilir. batch_update ile gelen kayıtlar anahtarlarına göre
+    tamponda birleştirilir ve tek atımlık zamanlayıcı en fazla throttle_ms'de bir
+    modele yazar. Satırlar anahtarla eşlendiği için yerinde güncellenir; biçimlendirici
+    ve renklendiriciler modelde sütun başına önceden hazırlanır.
     """
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+    def __init__(self, model: ColumnarTableModel, sort_field: Optional[str] = None,
+                 throttle_ms: int = 100, proxy: Optional[QAbstractProxyModel] = None,
+                 lang_manager=None, parent=None):
+        super().__init__(parent)
+        self.lang = lang_manager or LanguageManager()
+        self.source_model = model
+        self.proxy = proxy or sorted_proxy(model)
+        self.proxy.setParent(self)
+        self.setModel(self.proxy)
         self.setup_table()
-        self.update_buffer = {}
-        self.last_update = 0
+        if sort_field:
+            self.sortByColumn(model.COLUMNS.index(sort_field), Qt.SortOrder.DescendingOrder)
+
+        self.throttle_ms = throttle_ms
+        self.update_buffer: Dict[Any, dict] = {}
+        self.last_update = 0.0
+        self._replace = False
+
+        # Bekleyen güncellemeleri yazan tek atımlık zamanlayıcı
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self.flush)
 
     def setup_table(self):
         """Tablo özelliklerini ayarla"""
         # Performans optimizasyonları
-        self.setVerticalScrollMode(QTableWidget.ScrollMode.ScrollPerPixel)
-        self.setHorizontalScrollMode(QTableWidget.ScrollMode.ScrollPerPixel)
-        self.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        self.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.setVerticalScrollMode(QTableView.ScrollMode.ScrollPerPixel)
+        self.setHorizontalScrollMode(QTableView.ScrollMode.ScrollPerPixel)
+        self.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        self.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.setSortingEnabled(True)
         self.verticalHeader().setVisible(False)
         
         # Görsel ayarlar
         header = self.horizontalHeader()
         header.setStretchLastSection(True)
-        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         
         # Stil ayarları
         self.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: #1e1e1e;
                 color: white;
                 gridline-color: #3d3d3d;
                 border: 1px solid #3d3d3d;
                 border-radius: 4px;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 5px;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #0066cc;
             }
             QHeaderView::section {
@@ -53,100 +79,53 @@ class OptimizedTableWidget(QTableWidget):
             }
         """)
 
-    def batch_update(self, data: Dict[str, Any], throttle_ms: int = 100):
+    def batch_update(self, records: Iterable[Mapping], replace: bool = False):
         """
-        Tablo verilerini toplu güncelle.
-        Güncelleme hızını kontrol eder (throttling).
+        Kayıtları tampona al, zamanlayıcı sonraki yazmada modele uygular.
+        Aynı anahtarın kayıtları birleşir (sonraki alanlar öncekileri ezer).
+        replace=True ise kayıtlar tablonun tamamıdır; tampondaki önceki kayıtlar atılır
+        ve yazmada listede olmayan satırlar silinir.
         """
-        import time
-        current_time = time.time() * 1000  # milisaniye
-
-        # Throttling kontrolü
-        if current_time - self.last_update < throttle_ms:
-            self.update_buffer.update(data)
-            return
-
-        self.setUpdatesEnabled(False)
-        try:
-            # Eğer buffer'da veri varsa onları da ekle
-            all_updates = {**self.update_buffer, **data}
-            self.update_buffer.clear()
-
-            # Satır sayısını ayarla
-            self.setRowCount(len(all_updates))
-
-            # Verileri güncelle
-            for row, (key, item_data) in enumerate(all_updates.items()):
-                self._update_row(row, item_data)
-
-        finally:
-            self.setUpdatesEnabled(True)
-            self.last_update = current_time
+        record_key = self.source_model.record_key
+        if replace:
+            self.update_buffer = {}
+            self._replace = True
+        for record in records:
+            key = record_key(record)
+            pending = self.update_buffer.get(key)
+            if pending is None:
+                self.update_buffer[key] = dict(record)
+            else:
+                pending.update(record)
+
+        if not self._flush_timer.isActive():
+            # Son yazmadan bu yana throttle_ms geçtiyse hemen (olay döngüsünün sonunda) yaz
+            elapsed = (time.monotonic() - self.last_update) * 1000
+            self._flush_timer.start(int(max(0, self.throttle_ms - elapsed)))
+
+    def flush(self):
+        """Tampondaki güncellemeleri modele tek seferde yaz"""
+        self._flush_timer.stop()
+        records = list(self.update_buffer.values())
+        replace = self._replace
+        self.update_buffer = {}
+        self._replace = False
+        self.last_update = time.monotonic()
 
-    def _update_row(self, row: int, data: Dict):
-        """Tek bir satırı güncelle"""
         try:
-            for col, value in enumerate(data.values()):
-                item = self.item(row, col)
-                if item is None:
-                    from PyQt6.QtWidgets import QTableWidgetItem
-                    item = QTableWidgetItem()
-                    self.setItem(row, col, item)
-
-                # Sayısal değerler için formatlama
-                if isinstance(value, float):
-                    if col in [1, 2]:  # Fiyat kolonları
-                        formatted_value = f"{value:.8f}"
-                    else:
-                        formatted_value = f"{value:.2f}"
-                else:
-                    formatted_value = str(value)
-
-                item.setText(formatted_value)
-
-                # Renklendirme
-                if 'change' in str(data.keys()).lower():
-                    if value > 0:
-                        item.setForeground(QColor("#00ff00"))
-                    elif value < 0:
-                        item.setForeground(QColor("#ff4444"))
-
+            if replace:
+                self.source_model.sync(records)
+            elif records:
+                self.source_model.update(records)
         except Exception as e:
-            logging.error(f"Satır güncelleme hatası: {str(e)}")
+            logging.error(f"{self.lang.__('table_update_error')}: {str(e)}")
 
-class StatusBar(QStatusBar):
-    """
-    Özelleştirilmiş durum çubuğu.
-    Trading durumu ve metrikleri gösterir.
-    """
-    def __init__(self, parent=None, lang_manager=None):
-        super().__init__(parent)
-        self.lang = lang_manager
-        
-        # Profit label
-        self.profit_label = QLabel()
-        self.addWidget(self.profit_label)
-        
-        # Trades label
-        self.trades_label = QLabel()
-        self.addWidget(self.trades_label)
-
-    def update_metrics(self, metrics: Dict):
-        """Update trading metrics"""
-        try:
-            # Update profit/loss
-            profit = metrics.get('total_profit', 0)
-            profit_color = "#00ff00" if profit >= 0 else "#ff4444"
-            self.profit_label.setStyleSheet(f"color: {profit_color};")
-            self.profit_label.setText(f"{self.lang.__('total_profit')}: {profit:+.2f} USDT")
-
-            # Update trade counts
-            active = len(metrics.get('active_trades', {}))
-            total = metrics.get('total_trades', 0)
-            self.trades_label.setText(f"{self.lang.__('trades')}: {active}/{total}")
-
-        except Exception as e:
-            logging.error(f"{self.lang.__('ui_update_error')}: {str(e)}")
+    def clear(self):
+        """Bekleyen güncellemeleri at ve tabloyu boşalt"""
+        self._flush_timer.stop()
+        self.update_buffer = {}
+        self._replace = False
+        self.source_model.clear()
 
 class MetricsPanel(QFrame):
     """Metrics panel widget"""
@@ -169,7 +148,11 @@ class MetricsPanel(QFrame):
             'total_profit',
             'win_rate',
             'avg_profit',
-            'max_drawdown'
+            'max_drawdown',
+            'profit_factor',
+            'expectancy',
+            'sharpe_ratio',
+            'sortino_ratio'
         ]
         
         for i, metric in enumerate(metrics):
@@ -205,63 +188,13 @@ class MetricsPanel(QFrame):
             drawdown = metrics.get('max_drawdown', 0)
             self.labels['max_drawdown'].setText(f"{self.lang.__('max_drawdown')}: {drawdown:.2f}%")
             
+            # Risk/getiri oranları
+            profit_factor = metrics.get('profit_factor', 0)
+            self.labels['profit_factor'].setText(f"{self.lang.__('profit_factor')}: {profit_factor:.2f}")
+            expectancy = metrics.get('expectancy', 0)
+            self.labels['expectancy'].setText(f"{self.lang.__('expectancy')}: {expectancy:+.2f} USDT")
+            self.labels['sharpe_ratio'].setText(f"{self.lang.__('sharpe_ratio')}: {metrics.get('sharpe', 0):.2f}")
+            self.labels['sortino_ratio'].setText(f"{self.lang.__('sortino_ratio')}: {metrics.get('sortino', 0):.2f}")
+            
         except Exception as e:
             logging.error(f"{self.lang.__('ui_update_error')}: {str(e)}")
-
-class TradeHistoryWidget(OptimizedTableWidget):
-    """
-    İşlem geçmişi için özelleştirilmiş tablo widget'ı.
-    İşlem filtrelerini ve özet istatistikleri içerir.
-    """
-    def __init__(self):
-        super().__init__()
-        self.setColumnCount(8)
-        self.setHorizontalHeaderLabels([
-            "Tarih", "Sembol", "İşlem", "Fiyat", 
-            "Miktar", "Toplam", "Kâr/Zarar", "Durum"
-        ])
-        
-    def update_history(self, trades: list):
-        """İşlem geçmişini güncelle"""
-        self.setRowCount(len(trades))
-        for i, trade in enumerate(trades):
-            try:
-                # Tarih
-                self.setItem(i, 0, self._create_item(trade.get('timestamp', '')))
-                
-                # Sembol
-                self.setItem(i, 1, self._create_item(trade.get('symbol', '')))
-                
-                # İşlem türü (Alış/Satış)
-                trade_type = "ALIŞ" if trade.get('type') == 'buy' else "SATIŞ"
-                type_item = self._create_item(trade_type)
-                type_item.setForeground(QColor("#00ff00" if trade_type == "ALIŞ" else "#ff4444"))
-                self.setItem(i, 2, type_item)
-                
-                # Fiyat
-                self.setItem(i, 3, self._create_item(f"{trade.get('price', 0):.8f}"))
-                
-                # Miktar
-                self.setItem(i, 4, self._create_item(f"{trade.get('amount', 0):.8f}"))
-                
-                # Toplam USDT
-                self.setItem(i, 5, self._create_item(f"{trade.get('total_usdt', 0):.2f}"))
-                
-                # Kâr/Zarar
-                profit = trade.get('profit', 0)
-                profit_item = self._create_item(f"{profit:+.2f}")
-                profit_item.setForeground(QColor("#00ff00" if profit >= 0 else "#ff4444"))
-                self.setItem(i, 6, profit_item)
-                
-                # Durum
-                self.setItem(i, 7, self._create_item(trade.get('status', '')))
-                
-            except Exception as e:
-                logging.error(f"İşlem geçmişi satır güncelleme hatası: {str(e)}")
-                
-    def _create_item(self, text):
-        """TableWidgetItem oluştur"""
-        from PyQt6.QtWidgets import QTableWidgetItem
-        item = QTableWidgetItem(str(text))
-        item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        return item
\ No newline at end of file
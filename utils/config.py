@@ -52,6 +52,44 @@ class ConfigManager:
             'max_usdt': 10.0,
             'min_score': 75,
             'min_volume': 50000,
+            'position_check_interval': 0.5,
+            'use_oco': False,
+            'oco_stop_limit_gap': 0.2,
+            'oco_reconcile_interval': 5,
+            'balance_reconcile_interval': 60,
+            'close_all_concurrency': 5,
+            'journal_flush_interval': 0.2,
+            
+            # Geçmiş deposu (SQLite)
+            'history_flush_interval': 1.0,
+            'history_page_size': 100,
+            'store_scans': True,
+            'scan_history_size': 500,
+            
+            # Cache (saniye / kayıt sayısı)
+            'price_cache_ttl': 2,
+            'price_max_stale': 30,
+            'price_refresh_interval': 1.0,
+            'position_price_max_age': 0.5,
+            'ui_price_max_age': 5,
+            'ui_update_interval': 1.0,
+            'ui_scan_fps': 10,
+            'ui_table_throttle_ms': 100,
+            'log_max_lines': 5000,
+            'log_flush_interval_ms': 200,
+            'ohlcv_cache_ttl': 60,
+            'ohlcv_cache_size': 1000,
+            'ohlcv_disk_ttl': 300,
+            'ohlcv_disk_cache_mb': 200,
+            'indicator_cache_ttl': 900,
+            'indicator_cache_size': 1000,
+            
+            # Hata veren semboller için en uzun karantina süresi (saniye)
+            'quarantine_max_seconds': 21600,
+            
+            # Simülasyon (kağıt üzerinde işlem)
+            'simulated': False,
+            'simulated_balance': 1000.0,
             
             # Yasaklı coinler
             'excluded_coins': [
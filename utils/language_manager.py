@@ -229,6 +229,7 @@ class LanguageManager:
                 'analysis_score': 'Analiz Skoru',
                 'manual_stop': 'MANUEL-DURDURMA',
                 'open_position': 'Açık Pozisyon',
+                'closed_position': 'Kapanan Pozisyon',
                 'weak_buy': 'ZAYIF ALIM',
                 'wait': 'BEKLE',
                 'stop_loss_reason': 'STOP-LOSS',
@@ -268,7 +269,117 @@ class LanguageManager:
                 
                 # Dil
                 'language': 'Dil',
-                'language_changed': 'Dil değiştirildi'
+                'language_changed': 'Dil değiştirildi',
+                
+                # Pozisyon takibi
+                'position_monitor_error': 'Pozisyon takip döngüsü hatası',
+                
+                # OCO koruma emirleri
+                'oco_order_placed': 'OCO koruma emri verildi',
+                'oco_order_error': 'OCO emri verilemedi, fiyat takibine dönülüyor',
+                'oco_cancel_error': 'OCO emri iptal hatası',
+                'oco_order_cancelled': 'OCO emri borsada iptal edilmiş, fiyat takibine dönülüyor',
+                
+                # Emir kuralları
+                'order_below_min_amount': 'Emir miktarı minimum lot miktarının altında',
+                'order_above_max_amount': 'Emir miktarı maksimum lot miktarının üstünde',
+                'order_below_min_notional': 'Emir tutarı minimum işlem tutarının altında',
+                
+                # Pozisyon günlüğü
+                'journal_position_restored': 'Açık pozisyon günlükten geri yüklendi',
+                'journal_position_dropped': 'Günlükteki pozisyon için bakiye yok, atlandı',
+                'journal_recovery_error': 'Pozisyon günlüğü kurtarma hatası',
+                
+                # Gecikme ölçümü
+                'latency': 'Gecikme',
+                'stage': 'Aşama',
+                'count': 'Adet',
+                'export': 'Dışa Aktar',
+                'latency_exported': 'Gecikme verileri dışa aktarıldı',
+                'export_error': 'Dışa aktarma hatası',
+                
+                # Geçmiş deposu
+                'loaded_trades': 'Yüklenen işlem',
+                'history_store_error': 'Geçmiş veritabanı hatası',
+                
+                # Performans istatistikleri
+                'performance': 'Performans',
+                'total_trades': 'Toplam İşlem',
+                'winning_trades': 'Kazançlı İşlem',
+                'losing_trades': 'Zararlı İşlem',
+                'win_rate': 'Kazanma Oranı',
+                'avg_profit': 'Ort. Kâr',
+                'max_drawdown': 'Maks. Düşüş',
+                'profit_factor': 'Kâr Faktörü',
+                'expectancy': 'Beklenen Değer',
+                'sharpe_ratio': 'Sharpe Oranı',
+                'sortino_ratio': 'Sortino Oranı',
+                
+                # Tarama geçmişi
+                'top_movers': 'En çok değişen',
+                
+                # Dışa aktarma
+                'positions': 'Pozisyonlar',
+                'scans': 'Taramalar',
+                'export_completed': 'Dışa aktarma tamamlandı',
+                
+                # Sembol karantinası
+                'quarantine': 'Karantina',
+                'error_class': 'Hata Türü',
+                'failures': 'Hata Sayısı',
+                'remaining': 'Kalan (sn)',
+                'last_error': 'Son Hata',
+                'release': 'Serbest Bırak',
+                'symbol_quarantined': 'Sembol karantinaya alındı',
+                'symbol_released': 'Sembol karantinadan çıkarıldı',
+                
+                # Log konsolu
+                'all': 'Tümü',
+                'search': 'Ara...',
+                
+                # Tarayıcı filtreleri
+                'timeframe': 'Periyot',
+                'min_volume': 'Min. Hacim',
+                'shown': 'Gösterilen',
+                
+                # Simülasyon ve OCO ayarları
+                'simulated_mode': 'Simülasyon modu (API anahtarı gerekmez)',
+                'use_oco_orders': 'Borsada OCO ile SL/TP koruması',
+                
+                # Emir yürütücü
+                'order_execution_error': 'Emir yürütme hatası',
+                'order_latency': 'Emir gecikmesi',
+                'queue_wait': 'kuyruk',
+                'execution_time': 'yürütme',
+                
+                # Pozisyon günlüğü dosyası
+                'journal_write_error': 'Pozisyon günlüğü yazma hatası',
+                'journal_corrupt_line': 'Pozisyon günlüğünde bozuk satır atlandı',
+                
+                # Geçmiş veritabanı
+                'history_store_write_error': 'Geçmiş veritabanı yazma hatası',
+                
+                # Bakiye defteri
+                'balance_drift_corrected': 'Bakiye sapması düzeltildi',
+                'balance_reconcile_deferred': 'Bakiye çekilirken defter değişti, uzlaştırma ertelendi',
+                
+                # OHLCV disk cache
+                'ohlcv_disk_write_error': 'OHLCV disk cache yazma hatası',
+                'ohlcv_disk_read_error': 'OHLCV disk cache okuma hatası',
+                
+                # Fiyat cache
+                'price_refresh_error': 'Fiyat cache yenileme hatası',
+                
+                # Analiz sinyalleri
+                'strong_buy': 'GÜÇLÜ ALIM',
+                'buy_signal': 'ALIM',
+                'neutral': 'NÖTR',
+                'sell_signal': 'SATIM',
+                
+                # Arayüz veri akışı
+                'ui_collect_error': 'UI veri toplama hatası',
+                'price_update_error': 'Fiyat güncelleme hatası',
+                'table_update_error': 'Tablo güncelleme hatası'
             },
             'en': {
                 # Main menu
@@ -365,6 +476,7 @@ class LanguageManager:
                 'analysis_score': 'Analysis Score',
                 'manual_stop': 'MANUAL-STOP',
                 'open_position': 'Open Position',
+                'closed_position': 'Closed Position',
                 'weak_buy': 'WEAK BUY',
                 'wait': 'WAIT',
                 'stop_loss_reason': 'STOP-LOSS',
@@ -404,7 +516,117 @@ class LanguageManager:
                 
                 # Language
                 'language': 'Language',
-                'language_changed': 'Language changed'
+                'language_changed': 'Language changed',
+                
+                # Position monitoring
+                'position_monitor_error': 'Position monitor loop error',
+                
+                # OCO protection orders
+                'oco_order_placed': 'OCO protection order placed',
+                'oco_order_error': 'OCO order failed, falling back to price polling',
+                'oco_cancel_error': 'OCO order cancel error',
+                'oco_order_cancelled': 'OCO order was cancelled on the exchange, falling back to price polling',
+                
+                # Order rules
+                'order_below_min_amount': 'Order amount is below the minimum lot size',
+                'order_above_max_amount': 'Order amount is above the maximum lot size',
+                'order_below_min_notional': 'Order value is below the minimum notional',
+                
+                # Position journal
+                'journal_position_restored': 'Open position restored from journal',
+                'journal_position_dropped': 'No balance for journaled position, skipped',
+                'journal_recovery_error': 'Position journal recovery error',
+                
+                # Latency instrumentation
+                'latency': 'Latency',
+                'stage': 'Stage',
+                'count': 'Count',
+                'export': 'Export',
+                'latency_exported': 'Latency data exported',
+                'export_error': 'Export error',
+                
+                # History store
+                'loaded_trades': 'Loaded trades',
+                'history_store_error': 'History database error',
+                
+                # Performance statistics
+                'performance': 'Performance',
+                'total_trades': 'Total Trades',
+                'winning_trades': 'Winning Trades',
+                'losing_trades': 'Losing Trades',
+                'win_rate': 'Win Rate',
+                'avg_profit': 'Avg. Profit',
+                'max_drawdown': 'Max Drawdown',
+                'profit_factor': 'Profit Factor',
+                'expectancy': 'Expectancy',
+                'sharpe_ratio': 'Sharpe Ratio',
+                'sortino_ratio': 'Sortino Ratio',
+                
+                # Scan history
+                'top_movers': 'Top movers',
+                
+                # Export
+                'positions': 'Positions',
+                'scans': 'Scans',
+                'export_completed': 'Export completed',
+                
+                # Symbol quarantine
+                'quarantine': 'Quarantine',
+                'error_class': 'Error Class',
+                'failures': 'Failures',
+                'remaining': 'Remaining (s)',
+                'last_error': 'Last Error',
+                'release': 'Release',
+                'symbol_quarantined': 'Symbol quarantined',
+                'symbol_released': 'Symbol released from quarantine',
+                
+                # Log console
+                'all': 'All',
+                'search': 'Search...',
+                
+                # Scanner filters
+                'timeframe': 'Timeframe',
+                'min_volume': 'Min. Volume',
+                'shown': 'Shown',
+                
+                # Simulation and OCO settings
+                'simulated_mode': 'Simulated mode (no API keys needed)',
+                'use_oco_orders': 'Exchange-side OCO SL/TP protection',
+                
+                # Order executor
+                'order_execution_error': 'Order execution error',
+                'order_latency': 'Order latency',
+                'queue_wait': 'queue',
+                'execution_time': 'execution',
+                
+                # Position journal file
+                'journal_write_error': 'Position journal write error',
+                'journal_corrupt_line': 'Skipped corrupt line in position journal',
+                
+                # History database
+                'history_store_write_error': 'History database write error',
+                
+                # Balance ledger
+                'balance_drift_corrected': 'Balance drift corrected',
+                'balance_reconcile_deferred': 'Ledger changed while fetching balance, reconcile deferred',
+                
+                # OHLCV disk cache
+                'ohlcv_disk_write_error': 'OHLCV disk cache write error',
+                'ohlcv_disk_read_error': 'OHLCV disk cache read error',
+                
+                # Price cache
+                'price_refresh_error': 'Price cache refresh error',
+                
+                # Analysis signals
+                'strong_buy': 'STRONG BUY',
+                'buy_signal': 'BUY',
+                'neutral': 'NEUTRAL',
+                'sell_signal': 'SELL',
+                
+                # UI data flow
+                'ui_collect_error': 'UI data collection error',
+                'price_update_error': 'Price update error',
+                'table_update_error': 'Table update error'
             },
             'es': {
                 # Menú principal
@@ -501,6 +723,7 @@ class LanguageManager:
                 'analysis_score': 'Puntuación de Análisis',
                 'manual_stop': 'PARADA-MANUAL',
                 'open_position': 'Posición Abierta',
+                'closed_position': 'Posición Cerrada',
                 'weak_buy': 'COMPRA DÉBIL',
                 'wait': 'ESPERAR',
                 'stop_loss_reason': 'STOP-LOSS',
@@ -540,7 +763,117 @@ class LanguageManager:
                 
                 # Idioma
                 'language': 'Idioma',
-                'language_changed': 'Idioma cambiado'
+                'language_changed': 'Idioma cambiado',
+                
+                # Seguimiento de posiciones
+                'position_monitor_error': 'Error del bucle de seguimiento de posiciones',
+                
+                # Órdenes de protección OCO
+                'oco_order_placed': 'Orden de protección OCO colocada',
+                'oco_order_error': 'Error en la orden OCO, se vuelve al seguimiento de precios',
+                'oco_cancel_error': 'Error al cancelar la orden OCO',
+                'oco_order_cancelled': 'La orden OCO fue cancelada en el exchange, se vuelve al seguimiento de precios',
+                
+                # Reglas de órdenes
+                'order_below_min_amount': 'La cantidad de la orden está por debajo del lote mínimo',
+                'order_above_max_amount': 'La cantidad de la orden supera el lote máximo',
+                'order_below_min_notional': 'El valor de la orden está por debajo del nocional mínimo',
+                
+                # Registro de posiciones
+                'journal_position_restored': 'Posición abierta restaurada desde el registro',
+                'journal_position_dropped': 'Sin saldo para la posición registrada, omitida',
+                'journal_recovery_error': 'Error al recuperar el registro de posiciones',
+                
+                # Medición de latencia
+                'latency': 'Latencia',
+                'stage': 'Etapa',
+                'count': 'Cantidad',
+                'export': 'Exportar',
+                'latency_exported': 'Datos de latencia exportados',
+                'export_error': 'Error de exportación',
+                
+                # Almacén de historial
+                'loaded_trades': 'Operaciones cargadas',
+                'history_store_error': 'Error de la base de datos de historial',
+                
+                # Estadísticas de rendimiento
+                'performance': 'Rendimiento',
+                'total_trades': 'Operaciones Totales',
+                'winning_trades': 'Operaciones Ganadoras',
+                'losing_trades': 'Operaciones Perdedoras',
+                'win_rate': 'Tasa de Acierto',
+                'avg_profit': 'Beneficio Medio',
+                'max_drawdown': 'Caída Máxima',
+                'profit_factor': 'Factor de Beneficio',
+                'expectancy': 'Esperanza',
+                'sharpe_ratio': 'Ratio de Sharpe',
+                'sortino_ratio': 'Ratio de Sortino',
+                
+                # Historial de escaneo
+                'top_movers': 'Mayores cambios',
+                
+                # Exportación
+                'positions': 'Posiciones',
+                'scans': 'Escaneos',
+                'export_completed': 'Exportación completada',
+                
+                # Cuarentena de símbolos
+                'quarantine': 'Cuarentena',
+                'error_class': 'Tipo de Error',
+                'failures': 'Fallos',
+                'remaining': 'Restante (s)',
+                'last_error': 'Último Error',
+                'release': 'Liberar',
+                'symbol_quarantined': 'Símbolo en cuarentena',
+                'symbol_released': 'Símbolo liberado de la cuarentena',
+                
+                # Consola de registros
+                'all': 'Todos',
+                'search': 'Buscar...',
+                
+                # Filtros del escáner
+                'timeframe': 'Temporalidad',
+                'min_volume': 'Volumen mín.',
+                'shown': 'Mostrados',
+                
+                # Ajustes de simulación y OCO
+                'simulated_mode': 'Modo simulado (sin claves API)',
+                'use_oco_orders': 'Protección SL/TP con OCO en el exchange',
+                
+                # Ejecutor de órdenes
+                'order_execution_error': 'Error de ejecución de orden',
+                'order_latency': 'Latencia de orden',
+                'queue_wait': 'cola',
+                'execution_time': 'ejecución',
+                
+                # Archivo del diario de posiciones
+                'journal_write_error': 'Error al escribir el diario de posiciones',
+                'journal_corrupt_line': 'Línea dañada omitida en el diario de posiciones',
+                
+                # Base de datos del historial
+                'history_store_write_error': 'Error al escribir en la base de datos del historial',
+                
+                # Libro de saldos
+                'balance_drift_corrected': 'Desviación de saldo corregida',
+                'balance_reconcile_deferred': 'El libro cambió al obtener el saldo, conciliación aplazada',
+                
+                # Caché OHLCV en disco
+                'ohlcv_disk_write_error': 'Error al escribir la caché OHLCV en disco',
+                'ohlcv_disk_read_error': 'Error al leer la caché OHLCV en disco',
+                
+                # Caché de precios
+                'price_refresh_error': 'Error al actualizar la caché de precios',
+                
+                # Señales de análisis
+                'strong_buy': 'COMPRA FUERTE',
+                'buy_signal': 'COMPRA',
+                'neutral': 'NEUTRAL',
+                'sell_signal': 'VENTA',
+                
+                # Flujo de datos de la interfaz
+                'ui_collect_error': 'Error al recopilar datos de la interfaz',
+                'price_update_error': 'Error al actualizar precios',
+                'table_update_error': 'Error al actualizar la tabla'
             },
             'de': {
                 # Hauptmenü
@@ -637,6 +970,7 @@ class LanguageManager:
                 'analysis_score': 'Analysepunktzahl',
                 'manual_stop': 'MANUELLER-STOPP',
                 'open_position': 'Offene Position',
+                'closed_position': 'Geschlossene Position',
                 'weak_buy': 'SCHWACHER KAUF',
                 'wait': 'WARTEN',
                 'stop_loss_reason': 'STOP-LOSS',
@@ -676,7 +1010,117 @@ class LanguageManager:
                 
                 # Sprache
                 'language': 'Sprache',
-                'language_changed': 'Sprache geändert'
+                'language_changed': 'Sprache geändert',
+                
+                # Positionsüberwachung
+                'position_monitor_error': 'Fehler in der Positionsüberwachung',
+                
+                # OCO-Schutzorders
+                'oco_order_placed': 'OCO-Schutzorder platziert',
+                'oco_order_error': 'OCO-Order fehlgeschlagen, Rückfall auf Preisabfrage',
+                'oco_cancel_error': 'Fehler beim Stornieren der OCO-Order',
+                'oco_order_cancelled': 'OCO-Order wurde an der Börse storniert, Rückfall auf Preisabfrage',
+                
+                # Orderregeln
+                'order_below_min_amount': 'Ordermenge liegt unter der minimalen Losgröße',
+                'order_above_max_amount': 'Ordermenge liegt über der maximalen Losgröße',
+                'order_below_min_notional': 'Orderwert liegt unter dem Mindestnominalwert',
+                
+                # Positionsjournal
+                'journal_position_restored': 'Offene Position aus dem Journal wiederhergestellt',
+                'journal_position_dropped': 'Kein Guthaben für Journal-Position, übersprungen',
+                'journal_recovery_error': 'Fehler bei der Wiederherstellung des Positionsjournals',
+                
+                # Latenzmessung
+                'latency': 'Latenz',
+                'stage': 'Phase',
+                'count': 'Anzahl',
+                'export': 'Exportieren',
+                'latency_exported': 'Latenzdaten exportiert',
+                'export_error': 'Exportfehler',
+                
+                # Verlaufsspeicher
+                'loaded_trades': 'Geladene Trades',
+                'history_store_error': 'Fehler in der Verlaufsdatenbank',
+                
+                # Leistungsstatistiken
+                'performance': 'Leistung',
+                'total_trades': 'Trades Gesamt',
+                'winning_trades': 'Gewinn-Trades',
+                'losing_trades': 'Verlust-Trades',
+                'win_rate': 'Trefferquote',
+                'avg_profit': 'Durchschn. Gewinn',
+                'max_drawdown': 'Max. Drawdown',
+                'profit_factor': 'Gewinnfaktor',
+                'expectancy': 'Erwartungswert',
+                'sharpe_ratio': 'Sharpe-Ratio',
+                'sortino_ratio': 'Sortino-Ratio',
+                
+                # Scan-Verlauf
+                'top_movers': 'Größte Veränderungen',
+                
+                # Export
+                'positions': 'Positionen',
+                'scans': 'Scans',
+                'export_completed': 'Export abgeschlossen',
+                
+                # Symbol-Quarantäne
+                'quarantine': 'Quarantäne',
+                'error_class': 'Fehlerklasse',
+                'failures': 'Fehler',
+                'remaining': 'Verbleibend (s)',
+                'last_error': 'Letzter Fehler',
+                'release': 'Freigeben',
+                'symbol_quarantined': 'Symbol unter Quarantäne',
+                'symbol_released': 'Symbol aus Quarantäne freigegeben',
+                
+                # Log-Konsole
+                'all': 'Alle',
+                'search': 'Suchen...',
+                
+                # Scanner-Filter
+                'timeframe': 'Zeitrahmen',
+                'min_volume': 'Min. Volumen',
+                'shown': 'Angezeigt',
+                
+                # Simulations- und OCO-Einstellungen
+                'simulated_mode': 'Simulationsmodus (keine API-Schlüssel nötig)',
+                'use_oco_orders': 'Börsenseitiger OCO-SL/TP-Schutz',
+                
+                # Orderausführung
+                'order_execution_error': 'Fehler bei der Orderausführung',
+                'order_latency': 'Orderlatenz',
+                'queue_wait': 'Warteschlange',
+                'execution_time': 'Ausführung',
+                
+                # Positionsjournal-Datei
+                'journal_write_error': 'Fehler beim Schreiben des Positionsjournals',
+                'journal_corrupt_line': 'Beschädigte Zeile im Positionsjournal übersprungen',
+                
+                # Verlaufsdatenbank
+                'history_store_write_error': 'Fehler beim Schreiben der Verlaufsdatenbank',
+                
+                # Saldenbuch
+                'balance_drift_corrected': 'Saldenabweichung korrigiert',
+                'balance_reconcile_deferred': 'Ledger hat sich beim Abrufen des Saldos geändert, Abgleich verschoben',
+                
+                # OHLCV-Festplattencache
+                'ohlcv_disk_write_error': 'Fehler beim Schreiben des OHLCV-Festplattencaches',
+                'ohlcv_disk_read_error': 'Fehler beim Lesen des OHLCV-Festplattencaches',
+                
+                # Preiscache
+                'price_refresh_error': 'Fehler beim Aktualisieren des Preiscaches',
+                
+                # Analysesignale
+                'strong_buy': 'STARKER KAUF',
+                'buy_signal': 'KAUF',
+                'neutral': 'NEUTRAL',
+                'sell_signal': 'VERKAUF',
+                
+                # UI-Datenfluss
+                'ui_collect_error': 'Fehler beim Sammeln der UI-Daten',
+                'price_update_error': 'Fehler beim Aktualisieren der Preise',
+                'table_update_error': 'Fehler beim Aktualisieren der Tabelle'
             }
         }
         